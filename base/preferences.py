@@ -35,6 +35,13 @@ def on_logging_level_update(self, context):
     logger.setLevel(level)
 
 
+def on_solver_processes_update(self, context):
+    # Workers are started on demand with the new size
+    from ..solver_pool import shutdown
+
+    shutdown()
+
+
 # Presets
 
 
@@ -123,6 +130,37 @@ class Preferences(AddonPreferences):
         description="Automatically align view to workplane when activating a sketch.",
         default=True,
     )
+    solver_processes: IntProperty(
+        name="Solver Processes",
+        description=(
+            "Number of worker processes that solve sketches in parallel on "
+            "frame change and file load, 1 solves them one after the other"
+        ),
+        default=1,
+        min=1,
+        soft_max=16,
+        update=on_solver_processes_update,
+    )
+    solve_cache_mb: IntProperty(
+        name="Solve Cache (MB)",
+        description=(
+            "Memory for remembering solved sketches by their dimension values "
+            "during animation playback, 0 disables the cache"
+        ),
+        default=64,
+        min=0,
+        soft_max=1024,
+    )
+    drag_refresh_rate: IntProperty(
+        name="Drag Refresh Rate",
+        description=(
+            "Maximum number of generated mesh updates per second while "
+            "dragging geometry, 0 updates on every redraw"
+        ),
+        default=30,
+        min=0,
+        soft_max=120,
+    )
     show_whats_new: BoolProperty(
         name="Show What's New on Update",
         description="Show a summary of the changes after CAD Sketcher is updated",
@@ -201,6 +239,9 @@ class Preferences(AddonPreferences):
         box.label(text="Advanced")
         col = box.column(align=True)
         col.prop(self, "show_whats_new")
+        col.prop(self, "solver_processes")
+        col.prop(self, "solve_cache_mb")
+        col.prop(self, "drag_refresh_rate")
         col.prop(self, "show_debug_settings")
         col.prop(self, "logging_level")
 
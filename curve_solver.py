@@ -9,22 +9,179 @@ Constraints still come from PropertyGroups (referencing entities for now).
 """
 
 import logging
-import math
 
-from mathutils import Matrix as _Matrix
-from mathutils import Vector
+import numpy as np
 
 from .model.constants import SketchCurveType
-from .utilities.constants import FULL_TURN, HALF_TURN
-from .utilities.curve_data import (
-    get_curve_index,
-    get_uuid,
-    has_uuid_field,
-)
+from .utilities.curve_data import has_uuid_field
+from .utilities.sketch_table import get_table, to_key
+from .utilities.solve_timings import measure, phase
 from .utilities.workplane import ensure_workplane_empty
 
 logger = logging.getLogger(__name__)
 
+# slvs holds a single, module-global system: every CurveSolver build starts with
+# clear_sketch(). The solver that built the live system is recorded here so a
+# SolverSession can tell whether its system survived or was replaced by another
+# solve (e.g. the depsgraph handler) in between two drag steps.
+_system_owner = None
+
+# target_object pointer -> {component key: (result code, dof)} of the last
+# per-component solve, so a partial solve can report the untouched islands.
+_component_results = {}
+
+
+# target_object pointer -> number of solves run on the sketch, so caches of
+# solved results (utilities.solve_cache) notice solves they didn't run.
+_solve_generation = {}
+
+
+def solve_generation(sketch):
+    """Counter bumped by every solve of ``sketch``."""
+    return _solve_generation.get(sketch.target_object.as_pointer(), 0)
+
+
+def reset_results():
+    """Forget the per-sketch solve results (file load: pointers get reused)."""
+    _component_results.clear()
+    _solve_generation.clear()
+
+
+def _is_ok(result_code):
+    return result_code == 0 or result_code == 4
+
+
+def _result_enum(result_code):
+    from .global_data import solver_state_items
+    from .utilities.bpy import bpyEnum
+
+    return bpyEnum(solver_state_items, index=min(result_code, 5))
+
+
+def _read_curve_arrays(curve_data):
+    """What both solver passes need from the sketch table: sketch_type and the
+    first point index per curve, and all point positions as an (n, 3) array."""
+    table = get_table(curve_data)
+    return table.types, table.first, table.positions
+
+
+def _sync_legacy_entities(context, sketch):
+    """Sync entity.co / radius from solved curve data (bridge for gizmo positioning).
+
+    TODO: Remove when gizmos read from curve data directly
+    """
+    curve_data = sketch.target_object.data
+    seg_attr = curve_data.attributes.get("segment_entity_index")
+    if not seg_attr or not curve_data.attributes.get("sketch_type"):
+        return
+
+    entity_indices = np.empty(len(curve_data.curves), dtype=np.int32)
+    seg_attr.data.foreach_get("value", entity_indices)
+    linked = np.flatnonzero(entity_indices).tolist()
+    if not linked:
+        return
+
+    types, first, positions = _read_curve_arrays(curve_data)
+    table = get_table(curve_data, values=False)
+    entities = context.scene.sketcher.entities
+    cp_list = None
+    index_by_id = None
+    for curve_idx in linked:
+        entity = entities.get(int(entity_indices[curve_idx]))
+        if entity is None:
+            continue
+        ctype = types[curve_idx]
+        pos = positions[first[curve_idx]]
+        if ctype == SketchCurveType.POINT and hasattr(entity, "co"):
+            entity.co = (float(pos[0]), float(pos[1]))
+        elif ctype == SketchCurveType.CIRCLE and hasattr(entity, "radius"):
+            if cp_list is None:
+                cp_list = table.key_list(curve_data, "center_point_id")
+                cid_list = table.key_list(curve_data, "curve_id")
+                index_by_id = {cid: i for i, cid in enumerate(cid_list)}
+            ct_idx = index_by_id.get(cp_list[curve_idx])
+            if ct_idx is not None:
+                ct_pos = positions[first[ct_idx]]
+                entity.radius = float(np.linalg.norm(pos - ct_pos))
+
+
+class SolveTable:
+    """What constraint translation needs to know about each curve of a solve.
+
+    Built once per system build from the arrays ``_init_geometry`` reads in
+    bulk and passed to every constraint's ``create_slvs_data_from_curves``, so
+    resolving a curve's type, point ids, position or solvespace handle is a
+    dict lookup instead of a curve data scan per constraint.
+
+    Everything is keyed by curve key (``sketch_table.to_key``); the lookups
+    also take the hex ids constraints store in their ``curve_id_*`` properties.
+    """
+
+    def __init__(self):
+        # curve key -> solvespace entity handle
+        self.handles = {}
+        # curve key -> solvespace handle, point curves only
+        self.point_handles = {}
+        # curve key -> radius distance entity of a circle
+        self.radius_params = {}
+        self._index = {}
+
+    def load(self, cid_list, sp_list, ep_list, cp_list, types, first, positions):
+        self._index = {cid: i for i, cid in enumerate(cid_list)}
+        self._sp = sp_list
+        self._ep = ep_list
+        self._cp = cp_list
+        self._types = types.tolist()
+        self._first = first
+        self._positions = positions
+
+    def get(self, curve_id, default=None):
+        """The solvespace entity handle of ``curve_id``."""
+        return self.handles.get(to_key(curve_id), default)
+
+    def type(self, curve_id):
+        """The SketchCurveType of ``curve_id``, None if it's not in the sketch."""
+        i = self._index.get(to_key(curve_id))
+        return None if i is None else self._types[i]
+
+    def is_point(self, curve_id):
+        return self.type(curve_id) == SketchCurveType.POINT
+
+    def is_line(self, curve_id):
+        return self.type(curve_id) == SketchCurveType.LINE
+
+    def is_curve(self, curve_id):
+        return self.type(curve_id) in (SketchCurveType.ARC, SketchCurveType.CIRCLE)
+
+    def is_circle(self, curve_id):
+        return self.type(curve_id) == SketchCurveType.CIRCLE
+
+    def start_point(self, curve_id):
+        i = self._index.get(to_key(curve_id))
+        return None if i is None else self._sp[i]
+
+    def end_point(self, curve_id):
+        i = self._index.get(to_key(curve_id))
+        return None if i is None else self._ep[i]
+
+    def center_point(self, curve_id):
+        i = self._index.get(to_key(curve_id))
+        return None if i is None else self._cp[i]
+
+    def position(self, curve_id):
+        """Local position of the first point of ``curve_id`` (a point curve's
+        location, the edge point of a circle), None if it's not in the sketch."""
+        i = self._index.get(to_key(curve_id))
+        return None if i is None else self._positions[self._first[i]]
+
+    def radius(self, curve_id):
+        """Current radius of an arc or circle, None if it can't be resolved."""
+        edge = self.position(curve_id)
+        center = self.position(self.center_point(curve_id))
+        if edge is None or center is None:
+            return None
+        return float(np.linalg.norm(edge - center))
+
 
 class CurveSolver:
     """Solver that operates on native curve data."""
@@ -32,28 +189,41 @@ class CurveSolver:
     group_fixed = 1
     group_sketch = 3
 
-    def __init__(self, context, sketch):
+    def __init__(
+        self, context, sketch, component=None, standalone=True, solvesys=None
+    ):
         self.context = context
         self.sketch = sketch
-
-        import slvs
-
-        slvs.clear_sketch()
-        self.solvesys = slvs
+        # Restrict the system to one independent island of the sketch
+        # (utilities.components.SolveComponent); None solves everything.
+        self.component = component
+        # A standalone solver publishes its state/dof and rebuilds segments
+        # itself. Per-component solves run by solve_sketch_from_curves leave
+        # both to the caller, which aggregates over all components.
+        self.standalone = standalone
+
+        # Anything with the slvs call interface; solver_pool passes a recorder
+        # to build the system as plain data for a worker process.
+        if solvesys is None:
+            import slvs
+
+            slvs.clear_sketch()
+            solvesys = slvs
+        self.solvesys = solvesys
 
         self.ok = True
         self.result = None
+        self.result_code = 0
+        self.dof = 0
 
         # Tweak state
         self._tweak_curve_id = None
         self._tweak_pos = None
+        # The temporary dragged point pinned to the cursor (see _init_geometry)
+        self._drag_point = None
 
-        # Mapping: curve_id → solvespace handle (for points)
-        self._point_handles = {}
-        # Mapping: curve_id → solvespace handle (for all entities)
-        self._entity_handles = {}
-        # For circle radius params
-        self._distance_params = {}
+        # Curve lookups and solvespace handles of the built system
+        self.table = SolveTable()
 
     def tweak(self, curve_id, pos):
         """Set the curve to be dragged to the given position."""
@@ -123,69 +293,63 @@ class CurveSolver:
 
         wp = self._wp_handle
 
-        from .utilities.curve_data import read_uuid_list
-
         # Bulk-read the id fields and flags once. Per-curve get_uuid() converts a
         # 128-bit int id to a hex string with two attribute lookups each time, so
-        # calling it ~4x per curve dominated solve; one foreach_get + a single
-        # conversion pass per field is far cheaper (issue #342).
-        cid_list = read_uuid_list(curve_data, "curve_id")
-        sp_list = read_uuid_list(curve_data, "start_point_id")
-        ep_list = read_uuid_list(curve_data, "end_point_id")
-        cp_list = read_uuid_list(curve_data, "center_point_id")
-        fixed_attr = curve_data.attributes.get("fixed")
+        # calling it ~4x per curve dominated solve (issue #342); the sketch
+        # table's integer keys need neither. The same goes for types, fixed
+        # flags and positions: only the slvs calls stay per-element.
+        types, first, positions = _read_curve_arrays(curve_data)
+        sketch_table = get_table(curve_data, values=False)
+        cid_list = sketch_table.key_list(curve_data, "curve_id")
+        sp_list = sketch_table.key_list(curve_data, "start_point_id")
+        ep_list = sketch_table.key_list(curve_data, "end_point_id")
+        cp_list = sketch_table.key_list(curve_data, "center_point_id")
+        table = self.table
+        table.load(cid_list, sp_list, ep_list, cp_list, types, first, positions)
+        fixed = sketch_table.flags["fixed"]
+        ids = self.component.curve_ids if self.component else None
+
+        is_point = types == SketchCurveType.POINT
+        point_uv = positions[first[is_point], :2].tolist()
+        fixed_points = fixed[is_point].tolist()
 
         # First pass: create all points
-        for curve_idx in range(n_curves):
-            ctype = type_attr.data[curve_idx].value
-            if ctype != SketchCurveType.POINT:
-                continue
-
+        for curve_idx, (u, v), is_fixed in zip(
+            np.flatnonzero(is_point).tolist(), point_uv, fixed_points
+        ):
             cid = cid_list[curve_idx]
-            fixed = bool(fixed_attr.data[curve_idx].value) if fixed_attr else False
-            group = self.group_fixed if fixed else self.group_sketch
-
-            pt_idx = curve_data.curves[curve_idx].points[0].index
-            pos = curve_data.points[pt_idx].position
-            u, v = float(pos[0]), float(pos[1])
+            if ids is not None and cid not in ids:
+                continue
+            group = self.group_fixed if is_fixed else self.group_sketch
 
             handle = self.solvesys.add_point_2d(group, u, v, wp)
-            self._point_handles[cid] = handle
-            self._entity_handles[cid] = handle
+            table.point_handles[cid] = handle
+            table.handles[cid] = handle
 
         # Second pass: create lines, arcs, circles
-        for curve_idx in range(n_curves):
-            ctype = type_attr.data[curve_idx].value
+        for curve_idx in np.flatnonzero(~is_point).tolist():
+            ctype = types[curve_idx]
             cid = cid_list[curve_idx]
+            if ids is not None and cid not in ids:
+                continue
 
             if ctype == SketchCurveType.LINE:
                 sp_id = sp_list[curve_idx]
                 ep_id = ep_list[curve_idx]
 
-                p1_handle = self._point_handles.get(sp_id)
-                p2_handle = self._point_handles.get(ep_id)
+                p1_handle = table.point_handles.get(sp_id)
+                p2_handle = table.point_handles.get(ep_id)
                 if p1_handle and p2_handle:
                     handle = self.solvesys.add_line_2d(
                         self.group_sketch, p1_handle, p2_handle, wp
                     )
-                    self._entity_handles[cid] = handle
+                    table.handles[cid] = handle
 
             elif ctype == SketchCurveType.CIRCLE:
                 cp_id = cp_list[curve_idx]
-                ct_handle = self._point_handles.get(cp_id)
+                ct_handle = table.point_handles.get(cp_id)
                 if ct_handle:
-                    # Get radius from curve geometry
-                    ct_pos = Vector(
-                        curve_data.points[
-                            curve_data.curves[get_curve_index(sketch, cp_id)]
-                            .points[0]
-                            .index
-                        ].position
-                    )
-                    first_pt = curve_data.curves[curve_idx].points[0].index
-                    edge_pos = Vector(curve_data.points[first_pt].position)
-                    radius = (edge_pos - ct_pos).length
-
+                    radius = table.radius(cid)
                     dist_param = self.solvesys.add_distance(
                         self.group_sketch, radius, wp
                     )
@@ -196,17 +360,17 @@ class CurveSolver:
                         dist_param,
                         wp,
                     )
-                    self._entity_handles[cid] = handle
-                    self._distance_params[cid] = dist_param
+                    table.handles[cid] = handle
+                    table.radius_params[cid] = dist_param
 
             elif ctype == SketchCurveType.ARC:
                 cp_id = cp_list[curve_idx]
                 sp_id = sp_list[curve_idx]
                 ep_id = ep_list[curve_idx]
 
-                ct_handle = self._point_handles.get(cp_id)
-                p1_handle = self._point_handles.get(sp_id)
-                p2_handle = self._point_handles.get(ep_id)
+                ct_handle = table.point_handles.get(cp_id)
+                p1_handle = table.point_handles.get(sp_id)
+                p2_handle = table.point_handles.get(ep_id)
                 if ct_handle and p1_handle and p2_handle:
                     handle = self.solvesys.add_arc(
                         self.group_sketch,
@@ -216,27 +380,33 @@ class CurveSolver:
                         p2_handle,
                         wp,
                     )
-                    self._entity_handles[cid] = handle
+                    table.handles[cid] = handle
 
         # Third pass: handle tweak (after all entities exist)
         if self._tweak_curve_id is not None and self._tweak_pos is not None:
-            tweak_handle = self._entity_handles.get(self._tweak_curve_id)
+            tweak_handle = table.get(self._tweak_curve_id)
             if tweak_handle:
-                wp_obj = self.sketch.workplane_object
-                if not wp_obj and self.sketch.target_object:
-                    wp_obj = self.sketch.target_object.parent
-                if wp_obj:
-                    wp_mat = wp_obj.matrix_world
-                else:
-                    from mathutils import Matrix
-
-                    wp_mat = Matrix.Identity(4)
-                tw_u, tw_v, _ = wp_mat.inverted() @ self._tweak_pos
+                tw_u, tw_v = self._tweak_uv(self._tweak_pos)
                 drag_pt = self.solvesys.add_point_2d(self.group_sketch, tw_u, tw_v, wp)
                 # For points: coincident point-to-point
                 # For lines/arcs/circles: coincident point-on-entity
                 self.solvesys.coincident(self.group_sketch, drag_pt, tweak_handle, wp)
                 self.solvesys.dragged(self.group_sketch, drag_pt, wp)
+                self._drag_point = drag_pt
+
+    def _tweak_uv(self, pos):
+        """World-space tweak position -> workplane (u, v)."""
+        wp_obj = self.sketch.workplane_object
+        if not wp_obj and self.sketch.target_object:
+            wp_obj = self.sketch.target_object.parent
+        if wp_obj:
+            wp_mat = wp_obj.matrix_world
+        else:
+            from mathutils import Matrix
+
+            wp_mat = Matrix.Identity(4)
+        tw_u, tw_v, _ = wp_mat.inverted() @ pos
+        return tw_u, tw_v
 
     def _init_constraints(self):
         """Initialize constraints using curve_id handles."""
@@ -256,7 +426,12 @@ class CurveSolver:
         # user's constraints (a single constraint may add several handles).
         self._constraint_by_handle = {}
 
-        for c in sketch_constraints.all:
+        if self.component:
+            constraints = self.component.constraints
+        else:
+            constraints = sketch_constraints.all
+
+        for c in constraints:
             group = self.group_sketch
             c.failed = False
 
@@ -265,7 +440,7 @@ class CurveSolver:
 
             try:
                 handles = c.create_slvs_data_from_curves(
-                    self.solvesys, self._entity_handles, wp, group
+                    self.solvesys, self.table, wp, group
                 )
             except Exception as e:
                 logger.debug(f"Constraint init failed: {c}, {e}")
@@ -280,116 +455,9 @@ class CurveSolver:
                 if h:
                     self._constraint_by_handle[h] = c
 
-    def _rebuild_arc_bezier(self, curve_data, curve_idx, center_pos, is_cyclic):
-        """Rebuild arc/circle bezier handles from solved point positions.
-
-        Replicates create_bezier_curve logic without entity references.
-        """
-        curve_slice = curve_data.curves[curve_idx]
-        n_points = curve_slice.points_length
-        first = curve_slice.points[0].index
-
-        # Collect point positions
-        positions = []
-        for i in range(n_points):
-            positions.append(Vector(curve_data.points[first + i].position[:2]))
-
-        center = Vector(center_pos[:2])
-
-        # Compute radius and angle
-        radius = (positions[0] - center).length
-        if radius < 1e-6:
-            return
-
-        if is_cyclic:
-            angle_per_segment = FULL_TURN / n_points
-            segment_count = n_points
-        else:
-            # Compute total angle from start to end
-            start_vec = positions[0] - center
-            end_vec = positions[-1] - center
-            from .utilities.math import range_2pi
-
-            total_angle = range_2pi(
-                math.atan2(end_vec[1], end_vec[0])
-                - math.atan2(start_vec[1], start_vec[0])
-            )
-            segment_count = n_points - 1
-            if segment_count == 0:
-                return
-            angle_per_segment = total_angle / segment_count
-
-        # Compute handle offset (standard bezier circle approximation)
-        n = FULL_TURN / angle_per_segment if angle_per_segment != 0 else 0
-        if n == 0:
-            return
-        q = (4 / 3) * math.tan(HALF_TURN / (2 * n))
-        base_offset = Vector((radius, q * radius))
-
-        # Compute midpoint positions for multi-segment arcs
-        if not is_cyclic and segment_count > 1:
-            start_angle = math.atan2(start_vec[1], start_vec[0])
-            for i in range(1, segment_count):
-                a = start_angle + angle_per_segment * i
-                positions[i] = center + Vector(
-                    (radius * math.cos(a), radius * math.sin(a))
-                )
-
-        # Build locations list
-        locations = list(positions)
-        if is_cyclic:
-            locations.append(locations[0])
-
-        # Set positions and handles
-        attrs = curve_data.attributes
-        hl = attrs.get("handle_left")
-        hr = attrs.get("handle_right")
-        if not hl or not hr:
-            return
-
-        bezier_indices = list(range(first, first + n_points))
-        if is_cyclic:
-            bezier_indices.append(first)
-
-        for seg in range(segment_count):
-            loc1, loc2 = locations[seg], locations[seg + 1]
-            b1_idx, b2_idx = bezier_indices[seg], bezier_indices[seg + 1]
-
-            coords = []
-            for i, loc in enumerate((loc1, loc2)):
-                pos = loc - center
-                angle = math.atan2(pos[1], pos[0])
-                offset = base_offset.copy()
-                if i == 1:
-                    offset[1] *= -1
-                offset.rotate(_Matrix.Rotation(angle, 2))
-                coords.append((center + offset).to_3d())
-
-            hr.data[b1_idx].vector = coords[0]
-            hl.data[b2_idx].vector = coords[1]
-            curve_data.points[b2_idx].position = loc2.to_3d()
-
-            if not is_cyclic:
-                if seg == 0:
-                    pos = loc1 - center
-                    angle = math.atan2(pos[1], pos[0])
-                    offset = base_offset.copy()
-                    offset[1] *= -1
-                    offset.rotate(_Matrix.Rotation(angle, 2))
-                    hl.data[b1_idx].vector = (center + offset).to_3d()
-                if seg == segment_count - 1:
-                    pos = loc2 - center
-                    angle = math.atan2(pos[1], pos[0])
-                    offset = base_offset.copy()
-                    offset.rotate(_Matrix.Rotation(angle, 2))
-                    hr.data[b2_idx].vector = (center + offset).to_3d()
-
-        # Set start point position
-        curve_data.points[first].position = positions[0].to_3d()
-
     def _get_solved_point_position(self, curve_id):
         """Get solved position for a point curve_id."""
-        handle = self._point_handles.get(curve_id)
+        handle = self.table.point_handles.get(to_key(curve_id))
         if not handle:
             return None
         u = self.solvesys.get_param_value(handle["param"][0])
@@ -403,80 +471,56 @@ class CurveSolver:
             return
 
         curve_data = sketch.target_object.data
-        n_curves = len(curve_data.curves)
         type_attr = curve_data.attributes.get("sketch_type")
         if not has_uuid_field(curve_data, "curve_id") or not type_attr:
             return
 
-        # Bulk-read ids once instead of per-curve get_uuid (see _init_geometry).
-        from .utilities.curve_data import read_uuid_list
-
-        cid_list = read_uuid_list(curve_data, "curve_id")
-        cp_list = read_uuid_list(curve_data, "center_point_id")
+        # Bulk-read ids, types and positions once (see _init_geometry), patch
+        # the solved values into the position array and write it back with a
+        # single foreach_set. The array is the sketch table's, so the table
+        # stays in step with what's written.
+        types, first, positions = _read_curve_arrays(curve_data)
+        sketch_table = get_table(curve_data, values=False)
+        cid_list = sketch_table.key_list(curve_data, "curve_id")
+        cp_list = sketch_table.key_list(curve_data, "center_point_id")
 
         # First pass: update all point positions
-        for curve_idx in range(n_curves):
-            ctype = type_attr.data[curve_idx].value
-            cid = cid_list[curve_idx]
-
-            if ctype == SketchCurveType.POINT:
-                pos = self._get_solved_point_position(cid)
-                if pos:
-                    pt_idx = curve_data.curves[curve_idx].points[0].index
-                    curve_data.points[pt_idx].position = pos
+        for curve_idx in np.flatnonzero(types == SketchCurveType.POINT).tolist():
+            pos = self._get_solved_point_position(cid_list[curve_idx])
+            if pos:
+                positions[first[curve_idx]] = pos
+
+        # Second pass: update circle edge positions from solved radius
+        for curve_idx in np.flatnonzero(types == SketchCurveType.CIRCLE).tolist():
+            dist_param = self.table.radius_params.get(cid_list[curve_idx])
+            if dist_param is None:
+                continue
+            param_h = dist_param.get("param", [0])[0]
+            solved_radius = self.solvesys.get_param_value(param_h) if param_h else None
+            cp_id = cp_list[curve_idx]
+            if cp_id and solved_radius is not None:
+                ct_pos = self._get_solved_point_position(cp_id)
+                if ct_pos:
+                    # Update first edge point at new radius
+                    positions[first[curve_idx]] = (
+                        ct_pos[0] + solved_radius,
+                        ct_pos[1],
+                        ct_pos[2],
+                    )
 
-        # Second pass: update circle/arc edge positions from solved radius
-        for curve_idx in range(n_curves):
-            ctype = type_attr.data[curve_idx].value
-            cid = cid_list[curve_idx]
+        curve_data.points.foreach_set("position", positions.ravel())
 
-            if ctype == SketchCurveType.CIRCLE and cid in self._distance_params:
-                dist_param = self._distance_params[cid]
-                param_h = dist_param.get("param", [0])[0]
-                solved_radius = (
-                    self.solvesys.get_param_value(param_h) if param_h else None
-                )
-                cp_id = cp_list[curve_idx]
-                if cp_id and solved_radius is not None:
-                    ct_pos = self._get_solved_point_position(cp_id)
-                    if ct_pos:
-                        # Update first edge point at new radius
-                        curve_slice = curve_data.curves[curve_idx]
-                        first = curve_slice.points[0].index
-                        curve_data.points[first].position = (
-                            ct_pos[0] + solved_radius,
-                            ct_pos[1],
-                            ct_pos[2],
-                        )
-
-        # Third pass: rebuild segments from updated point positions
+    def _rebuild_segments(self):
+        """Rebuild segments from the written-back points (standalone solves)."""
         from .utilities.curve_data import rebuild_segments
 
-        rebuild_segments(sketch)
-
-        # Sync entity.co from solved curve positions (bridge for gizmo positioning)
-        # TODO: Remove when gizmos read from curve data directly
-        entities = self.context.scene.sketcher.entities
-        seg_attr = curve_data.attributes.get("segment_entity_index")
-        if seg_attr:
-            for curve_idx in range(n_curves):
-                entity_index = seg_attr.data[curve_idx].value
-                if entity_index == 0:
-                    continue
-                entity = entities.get(entity_index)
-                if entity is None:
-                    continue
-                ctype = type_attr.data[curve_idx].value
-                if ctype == SketchCurveType.POINT and hasattr(entity, "co"):
-                    pt_idx = curve_data.curves[curve_idx].points[0].index
-                    pos = curve_data.points[pt_idx].position
-                    entity.co = (pos[0], pos[1])
-                elif ctype == SketchCurveType.CIRCLE:
-                    dist = self._distance_params.get(
-                        get_uuid(curve_data, "curve_id", curve_idx)
-                    )
-                    if dist and hasattr(entity, "radius"):
-                        entity.radius = self.solvesys.get_param_value(dist["param"][0])
+        with phase("rebuild_segments"):
+            if self.component:
+                rebuild_segments(self.sketch, point_ids=self.component.curve_ids)
+            else:
+                rebuild_segments(self.sketch)
+        with phase("legacy_sync"):
+            _sync_legacy_entities(self.context, self.sketch)
 
     def solve(self):
         """Run the solver on curve data.
@@ -488,26 +532,47 @@ class CurveSolver:
         we drop the drag and re-solve, keeping the sketch's valid, constrained
         state instead of flipping it to inconsistent (issue #584).
         """
-        self._solve_once()
-        if not self.ok and self._tweak_curve_id is not None:
-            self._tweak_curve_id = None
-            self._tweak_pos = None
+        with measure(self.sketch):
             self._solve_once()
+            if not self.ok and self._tweak_curve_id is not None:
+                self._tweak_curve_id = None
+                self._tweak_pos = None
+                self._solve_once()
         return self.ok
 
     def _solve_once(self):
         """Build and solve the system once from the current curve/tweak state."""
-        self.solvesys.clear_sketch()
-        self._point_handles.clear()
-        self._entity_handles.clear()
-        self._distance_params.clear()
-        self._constraint_by_handle = {}
+        self._build()
+        return self._run()
 
-        self._init_workplane()
-        self._init_geometry()
-        self._init_constraints()
+    def _build(self):
+        """(Re)build the whole solvespace system from the current curve state."""
+        global _system_owner
 
-        result = self.solvesys.solve_sketch(self.group_sketch, True)
+        self.solvesys.clear_sketch()
+        self.table = SolveTable()
+        self._constraint_by_handle = {}
+        self._drag_point = None
+
+        with phase("workplane"):
+            self._init_workplane()
+        with phase("geometry"):
+            self._init_geometry()
+        with phase("constraints"):
+            self._init_constraints()
+        if not getattr(self.solvesys, "recording", False):
+            _system_owner = self
+
+    def owns_system(self):
+        """True while the live slvs system is still the one this solver built."""
+        return _system_owner is self
+
+    def _run(self):
+        """Solve the already-built system and publish/write back the result."""
+        with phase("solve_sketch"):
+            result = self.solvesys.solve_sketch(self.group_sketch, True)
+        key = self.sketch.target_object.as_pointer()
+        _solve_generation[key] = _solve_generation.get(key, 0) + 1
 
         # solve_sketch returns either the result dict or (result, failed_handles),
         # where failed_handles lists the constraints solvespace couldn't satisfy.
@@ -519,11 +584,8 @@ class CurveSolver:
             if rest and isinstance(rest[0], (list, tuple)):
                 failed_handles = rest[0]
 
-        from .global_data import solver_state_items
-        from .utilities.bpy import bpyEnum
-
         result_code = retval["result"]
-        self.ok = result_code == 0 or result_code == 4
+        self.ok = _is_ok(result_code)
 
         # Flag the offending constraints so the UI (constraint list + gizmos) can
         # point the user at what to remove -- an inconsistent sketch can't solve,
@@ -534,23 +596,26 @@ class CurveSolver:
             if c is not None:
                 c.failed = True
 
-        if result_code > 4:
-            self.result = bpyEnum(solver_state_items, index=5)
-        else:
-            self.result = bpyEnum(solver_state_items, index=result_code)
+        self.result_code = result_code
+        self.dof = retval.get("dof", 0)
+        self.result = _result_enum(result_code)
 
-        self.sketch.solver_state = self.result.identifier
-        # A tweak solve augments the system with a temporary dragged/coincident
-        # pin (see _init_geometry), so its reported dof is ~2 lower than the
-        # sketch's real dof. Dragging doesn't change the true dof, so don't
-        # publish the tweak value (it would read as "fully defined" after a
-        # drag); the tweak operator does a clean re-solve on release.
-        if self._tweak_curve_id is None:
-            self.sketch.dof = retval.get("dof", 0)
+        if self.standalone:
+            self.sketch.solver_state = self.result.identifier
+            # A tweak solve augments the system with a temporary dragged/coincident
+            # pin (see _init_geometry), so its reported dof is ~2 lower than the
+            # sketch's real dof. Dragging doesn't change the true dof, so don't
+            # publish the tweak value (it would read as "fully defined" after a
+            # drag); the tweak operator does a clean re-solve on release.
+            if self._tweak_curve_id is None:
+                self.sketch.dof = self.dof
 
         if self.ok:
-            self._write_results()
-            self.sketch.geometry_solved = True
+            with phase("write_back"):
+                self._write_results()
+            if self.standalone:
+                self._rebuild_segments()
+                self.sketch.geometry_solved = True
 
         return self.ok
 
@@ -558,17 +623,199 @@ class CurveSolver:
 Solver = CurveSolver
 
 
-def solve_sketch_from_curves(context, sketch):
-    """Convenience function to solve a sketch using curve data."""
+def _topology_signature(sketch):
+    """Counts that change whenever a drag's solvespace system would change shape.
+
+    Curves/points cover added or removed geometry (and arc resegmentation),
+    constraints cover a constraint added or deleted mid-drag. Positions are
+    deliberately excluded: they are what the drag itself updates.
+    """
+    cd = sketch.target_object.data
+    n_constraints = sum(len(lst) for lst in cd.sketch_constraints.get_lists())
+    return (len(cd.curves), len(cd.points), n_constraints)
+
+
+class SolverSession:
+    """A solvespace system kept alive for the duration of a tweak drag.
+
+    ``CurveSolver`` rebuilds the whole system -- workplane, every point, segment
+    and constraint -- for each solve, which is what a drag did on every mouse
+    move. A session builds that system once, with the dragged pin included, and
+    afterwards only moves the pin's two parameters and re-solves. solvespace
+    leaves the solved values in the parameters, so each step warm-starts from
+    the previous one exactly like a fresh build from the written-back curve data
+    would.
+
+    Only the independent component containing the dragged curve is built; the
+    rest of the sketch can't move with it.
+
+    The system is rebuilt from scratch when the sketch topology changes mid-drag
+    or another solve replaced the global slvs system in between two steps.
+    """
+
+    def __init__(self, context, sketch, curve_id):
+        self.context = context
+        self.sketch = sketch
+        self.curve_id = curve_id
+        self._solver = None
+        self._component = None
+        self._signature = None
+        # Number of full system builds, for tests and the perf harness.
+        self.builds = 0
+
+    @property
+    def active(self):
+        return self._solver is not None
+
+    def _is_current(self):
+        return (
+            self._solver is not None
+            and self._solver._drag_point is not None
+            and self._solver.owns_system()
+            and _topology_signature(self.sketch) == self._signature
+        )
+
+    def _rebuild(self, pos):
+        from .utilities.components import component_of, find_components
+
+        self._component = component_of(find_components(self.sketch), self.curve_id)
+        solver = CurveSolver(self.context, self.sketch, component=self._component)
+        solver.tweak(self.curve_id, pos)
+        solver._build()
+        self._solver = solver
+        self._signature = _topology_signature(self.sketch)
+        self.builds += 1
+        return solver
+
+    def drag(self, pos):
+        """Pull the dragged curve to world-space ``pos`` and re-solve.
+
+        Returns the solve result like ``CurveSolver.solve``. A failed drag (e.g.
+        a fully defined sketch) is dropped and the sketch re-solved without the
+        pin, and the session rebuilds on the next step.
+        """
+        if not self.sketch.target_object or not self.sketch.target_object.data:
+            return False
+        with measure(self.sketch):
+            return self._drag(pos)
+
+    def _drag(self, pos):
+        if self._is_current():
+            solver = self._solver
+            u, v = solver._tweak_uv(pos)
+            params = solver._drag_point["param"]
+            solver.solvesys.set_param_value(params[0], u)
+            solver.solvesys.set_param_value(params[1], v)
+            solver._tweak_pos = pos
+        else:
+            solver = self._rebuild(pos)
+
+        if solver._run():
+            return True
+
+        # Same fallback as CurveSolver.solve: drop the drag, keep the sketch's
+        # valid constrained state. It goes through the per-component solve so
+        # the published dof/state cover the whole sketch, not just the dragged
+        # component. The fallback replaces the live system, so the next step
+        # rebuilds the session.
+        self._solver = None
+        return solve_sketch_from_curves(
+            self.context, self.sketch, changed_ids={self.curve_id}
+        )
+
+    def end(self):
+        """Release the session's system (the caller does the clean re-solve)."""
+        self._solver = None
+        self._signature = None
+
+
+def solve_sketch_from_curves(context, sketch, changed_ids=None):
+    """Solve a sketch one independent component at a time.
+
+    With ``changed_ids`` (hex ids or keys) only the components containing one of
+    those curves are re-solved; the others keep their geometry and report their last result.
+    Components without constraints or arcs can't move and aren't sent to the
+    solver at all. The sketch's solver state is the worst component result and
+    its dof the sum over all components.
+    """
     if not sketch:
         return False
-    solver = CurveSolver(context, sketch)
-    return solver.solve()
 
+    with measure(sketch):
+        results, pending = _plan_components(sketch, changed_ids)
+        solved_ids = set()
+        for comp in pending:
+            solver = CurveSolver(context, sketch, component=comp, standalone=False)
+            solver.solve()
+            results[comp.key] = (solver.result_code, solver.dof)
+            if solver.ok:
+                solved_ids |= comp.curve_ids
+        return _publish_components(context, sketch, results, solved_ids, changed_ids)
+
+
+def _plan_components(sketch, changed_ids):
+    """Split a sketch for solving.
+
+    Returns ``(results, pending)``: the (result code, dof) of every component
+    that doesn't need the solver, keyed by component key, and the components
+    that do.
+    """
+    from .utilities.components import find_components
+
+    key = sketch.target_object.as_pointer()
+    previous = {}
+    if changed_ids is not None:
+        previous = _component_results.get(key, {})
+        changed_ids = {to_key(cid) for cid in changed_ids}
+    results = {}
+    pending = []
+    for comp in find_components(sketch):
+        last = previous.get(comp.key)
+        if last is not None and comp.curve_ids.isdisjoint(changed_ids):
+            results[comp.key] = last
+        elif comp.is_trivial:
+            results[comp.key] = (0, comp.trivial_dof)
+        else:
+            pending.append(comp)
+    return results, pending
+
+
+def _publish_components(context, sketch, results, solved_ids, changed_ids):
+    """Rebuild segments once and publish the aggregated per-component result."""
+    from .utilities.curve_data import rebuild_segments
+
+    key = sketch.target_object.as_pointer()
+    _component_results[key] = results
+    # Also counts solves where no component needed the solver.
+    _solve_generation[key] = _solve_generation.get(key, 0) + 1
+
+    with phase("rebuild_segments"):
+        if changed_ids is None:
+            rebuild_segments(sketch)
+        elif solved_ids:
+            rebuild_segments(sketch, point_ids=solved_ids)
+    with phase("legacy_sync"):
+        _sync_legacy_entities(context, sketch)
+
+    codes = [code for code, _dof in results.values()]
+    # Failures outrank REDUNDANT_OK, which outranks OKAY.
+    result_code = max(codes, key=lambda c: (not _is_ok(c), c), default=0)
+    sketch.solver_state = _result_enum(result_code).identifier
+    sketch.dof = sum(dof for _code, dof in results.values())
+
+    ok = _is_ok(result_code)
+    if ok:
+        sketch.geometry_solved = True
+    return ok
+
+
+def solve_system(context, sketch=None, changed_ids=None):
+    """Solve the constraint system for a sketch.
 
-def solve_system(context, sketch=None):
-    """Solve the constraint system for a sketch."""
+    ``changed_ids`` (hex ids or keys) limits the solve to the components touching
+    them, see ``solve_sketch_from_curves``.
+    """
     if sketch and sketch.target_object and sketch.target_object.data:
         if len(sketch.target_object.data.curves) > 0:
-            return solve_sketch_from_curves(context, sketch)
+            return solve_sketch_from_curves(context, sketch, changed_ids=changed_ids)
     return True
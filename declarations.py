@@ -89,6 +89,9 @@ class Operators(str, Enum):
     Update = "view3d.slvs_update"
     Trim = "view3d.slvs_trim"
     Bevel = "view3d.slvs_bevel"
+    BakeSolveCache = "view3d.slvs_bake_solve_cache"
+    BakeSolveFile = "view3d.slvs_bake_solve_file"
+    RecordSolver = "view3d.slvs_record_solver"
     Tweak = "view3d.slvs_tweak"
     TweakConstraintValuePos = "view3d.slvs_tweak_constraint_value_pos"
     UnregisterDrawCB = "view3d.slvs_unregister_draw_cb"
@@ -1,36 +1,40 @@
 """Cached, batched overlay drawing for native sketch curves.
 
-Builds GPU batches from :mod:`render_data` and caches them per sketch, keyed by
-a cheap change-signature. Batches (and the geometry extraction behind them) are
-rebuilt only when the signature changes, so a static or merely-redrawn viewport
-costs a signature hash and a few draw calls instead of re-extracting and
-re-uploading every element every frame.
+Builds GPU batches from :mod:`render_data` arrays and caches them per sketch,
+keyed by cheap change-signatures. The geometry extraction and the position
+buffers are rebuilt only when the geometry signature changes -- which includes
+the arcs' view-dependent levels of detail, so zooming re-tessellates only when
+an arc crosses a level; a selection or hover change only rewrites the colour
+buffers. Sketches whose bounds lie outside the view frustum are skipped
+before any of that. A static or merely-redrawn
+viewport costs a signature hash and a few draw calls instead of re-extracting
+and re-uploading every element every frame.
 
 Everything of one kind draws in a single per-vertex-color batch -- all points
 (as billboarded quads), all solid lines, all dashed lines -- so the draw-call
-count stays constant regardless of selection. Only geometry or selection changes
-invalidate a batch.
+count stays constant regardless of selection.
 """
 
 import gpu
-from gpu_extras.batch import batch_for_shader
+import numpy as np
 from bpy.types import Context
 
-from ..utilities import preferences
+from ..utilities import preferences, sketch_table
 from ..utilities.preferences import get_prefs
+from ..utilities.view import _boxes_outside_view, _project_points_to_region
 from ..shaders import Shaders
 from ..model.sketch_ref import get_sketches
 from . import render_data as rd
 
 
-# obj_name -> (signature, point_batch, line_batch, dashed_batch)
+# obj_name -> _SketchBatches
 _cache = {}
 
 # Two triangles covering [-1, 1]^2, for expanding a point into a screen quad.
-_QUAD_CORNERS = [
+_QUAD_CORNERS = np.array([
     (-1, -1), (1, -1), (1, 1),
     (-1, -1), (1, 1), (-1, 1),
-]
+], dtype=np.float32)
 
 
 def _theme_signature(ts):
@@ -43,53 +47,115 @@ def _theme_signature(ts):
     )
 
 
-def _build_batches(data):
-    """Turn extracted buckets into a *few* GPU batches with per-vertex color.
+def _vertbuf(**attrs):
+    """A ``GPUVertBuf`` holding float32 ``attrs`` (name -> (n, k) array)."""
+    fmt = gpu.types.GPUVertFormat()
+    for name, data in attrs.items():
+        fmt.attr_add(id=name, comp_type="F32", len=data.shape[1], fetch_mode="FLOAT")
+    vbo = gpu.types.GPUVertBuf(fmt, len(next(iter(attrs.values()))))
+    for name, data in attrs.items():
+        vbo.attr_fill(name, np.ascontiguousarray(data, dtype=np.float32))
+    return vbo
+
+
+class _SketchBatches:
+    """The overlay's GPU batches for one sketch.
 
     Everything of one kind draws in a single batch/draw call regardless of
     selection: all points, all solid lines, all dashed (construction) lines.
     This keeps the draw-call count constant when selection changes -- adding a
     selected-color bucket no longer adds a draw call, which is what exhausted the
     Vulkan descriptor pool (``OUT_OF_POOL_MEMORY``) and dropped the last call.
+
+    Geometry and appearance live in separate vertex buffers. The position
+    buffers are made once per geometry change; a selection/hover change only
+    ``repaint``s, writing fresh colour (and point corner) buffers next to them.
+    The solid lines are the exception: the builtin polyline shader expands
+    its lines from the batch's first buffer, so positions and colours must
+    share it; that buffer is refilled from the cached positions instead.
     """
-    # Points are drawn as billboarded quads (2 tris) so per-vertex color works
-    # (GL_POINTS didn't apply it on the Vulkan backend). Each point contributes
-    # 6 vertices sharing the same center/color; the per-point size factor is
-    # baked into `corner` so hovered/selected points draw bigger in the same
-    # batch.
-    pverts, pcols, pcorners = [], [], []
-    for color, entries in data.point_buckets.items():
-        for pos, psize in entries:
-            pverts += [pos] * 6
-            pcols += [color] * 6
-            pcorners += [(cx * psize, cy * psize) for cx, cy in _QUAD_CORNERS]
-    point_batch = (
-        batch_for_shader(Shaders.point_sprite_color_3d(), "TRIS",
-                         {"pos": pverts, "color": pcols, "corner": pcorners})
-        if pverts else None
-    )
 
-    sverts, scols, dverts, dcols = [], [], [], []
-    for (construction, color), verts in data.line_buckets.items():
-        if not verts:
-            continue
-        if construction:
-            dverts += verts
-            dcols += [color] * len(verts)
-        else:
-            sverts += verts
-            scols += [color] * len(verts)
-    line_batch = (
-        batch_for_shader(Shaders.polyline_flat_color_3d(), "LINES",
-                         {"pos": sverts, "color": scols})
-        if sverts else None
+    __slots__ = (
+        "geometry",
+        "appearance",
+        "data",
+        "_point_pos",
+        "_dashed_pos",
+        "_solid",
+        "points",
+        "lines",
+        "dashed",
     )
-    dashed_batch = (
-        batch_for_shader(Shaders.dashed_flat_color_line_3d(), "LINES",
-                         {"pos": dverts, "color": dcols})
-        if dverts else None
-    )
-    return point_batch, line_batch, dashed_batch
+
+    def __init__(self, geometry, appearance, data):
+        self.geometry = geometry
+        self.data = data
+        construction = data.segment_construction
+        self._solid = ~construction
+        # Points are drawn as billboarded quads (2 tris) so per-vertex color
+        # works (GL_POINTS didn't apply it on the Vulkan backend). Each point
+        # contributes 6 vertices sharing the same center/color.
+        self._point_pos = (
+            _vertbuf(pos=np.repeat(data.points, 6, axis=0))
+            if len(data.points)
+            else None
+        )
+        self._dashed_pos = (
+            _vertbuf(pos=data.segments[construction].reshape(-1, 3))
+            if construction.any()
+            else None
+        )
+        self.repaint(appearance)
+
+    def repaint(self, appearance):
+        """Rewrite the colour buffers after ``render_data.paint``."""
+        self.appearance = appearance
+        data = self.data
+        colors = data.colors
+
+        self.points = None
+        if self._point_pos is not None:
+            # The per-point size factor is baked into `corner` so hovered/selected
+            # points draw bigger in the same batch.
+            corners = data.point_size[:, None, None] * _QUAD_CORNERS
+            self.points = _batch(
+                "TRIS",
+                self._point_pos,
+                _vertbuf(
+                    color=np.repeat(colors[data.point_color], 6, axis=0),
+                    corner=corners.reshape(-1, 2),
+                ),
+            )
+
+        self.dashed = None
+        if self._dashed_pos is not None:
+            construction = data.segment_construction
+            self.dashed = _batch(
+                "LINES",
+                self._dashed_pos,
+                _vertbuf(
+                    color=np.repeat(
+                        colors[data.segment_color[construction]], 2, axis=0
+                    )
+                ),
+            )
+
+        self.lines = None
+        if self._solid.any():
+            solid = self._solid
+            self.lines = gpu.types.GPUBatch(
+                type="LINES",
+                buf=_vertbuf(
+                    pos=data.segments[solid].reshape(-1, 3),
+                    color=np.repeat(colors[data.segment_color[solid]], 2, axis=0),
+                ),
+            )
+
+
+def _batch(kind, positions, appearance):
+    batch = gpu.types.GPUBatch(type=kind, buf=positions)
+    batch.vertbuf_add(appearance)
+    return batch
 
 
 def _draw_points(batch, scale, is_active, region):
@@ -147,6 +213,10 @@ def draw(context: Context):
     scale = preferences.get_scale()
     active_obj = context.scene.sketcher.active_sketch_object
     region = context.region
+    rv3d = context.region_data
+
+    def project(world):
+        return _project_points_to_region(world, region, rv3d)
 
     seen = set()
     for sketch in get_sketches(context):
@@ -159,18 +229,32 @@ def draw(context: Context):
         name = obj.name
         seen.add(name)
         is_active = obj == active_obj
-        sig = rd.overlay_signature(sketch, is_active, theme_sig)
-
-        cached = _cache.get(name)
-        if cached is None or cached[0] != sig:
-            data = rd.build(sketch, ts, is_active)
-            point_batch, line_batch, dashed_batch = _build_batches(data)
-            _cache[name] = (sig, point_batch, line_batch, dashed_batch)
-        else:
-            _, point_batch, line_batch, dashed_batch = cached
-
-        _draw_lines(line_batch, dashed_batch, scale, region)
-        _draw_points(point_batch, scale, is_active, region)
+        # The signature and the rebuild share one read of the sketch table
+        with sketch_table.frame():
+            lods = None
+            if rv3d is not None:
+                # Nothing to extract or draw for a sketch outside the view
+                bounds = rd.sketch_bounds(sketch)
+                if bounds is None or _boxes_outside_view(bounds, rv3d)[0]:
+                    continue
+                lods = rd.arc_lods(sketch, project)
+            geometry = (
+                rd.geometry_signature(sketch),
+                None if lods is None else lods.tobytes(),
+            )
+            appearance = rd.appearance_signature(is_active, theme_sig)
+
+            batches = _cache.get(name)
+            if batches is None or batches.geometry != geometry:
+                data = rd.build(sketch, ts, is_active, lods)
+                batches = _cache[name] = _SketchBatches(geometry, appearance, data)
+            elif batches.appearance != appearance:
+                # Only colours changed (selection, hover, theme, active state)
+                rd.paint(batches.data, ts, is_active)
+                batches.repaint(appearance)
+
+        _draw_lines(batches.lines, batches.dashed, scale, region)
+        _draw_points(batches.points, scale, is_active, region)
 
     # Drop cache entries for sketches that no longer exist / are hidden.
     for stale in [n for n in _cache if n not in seen]:
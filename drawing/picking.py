@@ -12,9 +12,15 @@ curves in ``selection.ignore_list`` are skipped, matching the old behavior.
 import numpy as np
 
 from ..model.sketch_ref import get_active_sketch
+from ..utilities import sketch_table
 from ..utilities.preferences import get_prefs, get_scale
-from ..utilities.view import _project_points_to_region
+from ..utilities.view import (
+    _box_corners,
+    _project_points_to_region,
+    _region_to_plane,
+)
 from . import render_data, selection
+from .spatial_index import GridIndex
 
 # Pick radius in pixels (scaled by UI scale). Points grab a bit wider than edges
 # and take priority, so a vertex is easy to hit even when it sits on a line.
@@ -22,10 +28,11 @@ _POINT_RADIUS = 11.0
 _EDGE_RADIUS = 8.0
 
 
-# (sketch object name) -> (geometry_signature, point_ids, segment_ids). Picking
-# only needs the projected points/segments, which depend on geometry, not on the
-# hover/selection state that changes every mouse-move -- so we rebuild the
-# extraction only when the geometry actually changes, not on every hover.
+# (sketch object name) -> ((geometry_signature, arc LODs), SketchRenderData,
+# GridIndex). Picking only needs the projected points/segments, which depend on
+# geometry (and the view's arc levels of detail), not on the hover/selection
+# state that changes every mouse-move -- so we rebuild the extraction and its
+# index only when the geometry actually changes, not on every hover.
 _pick_cache = {}
 
 
@@ -35,102 +42,170 @@ def _active_data(context):
         return None
 
     obj = sketch.target_object
-    sig = render_data.geometry_signature(sketch)
-    cached = _pick_cache.get(obj.name)
-    if cached is not None and cached[0] == sig:
-        return cached[1]
-
-    ts = get_prefs().theme_settings.entity
-    data = render_data.build(sketch, ts, is_active=True)
-    _pick_cache[obj.name] = (sig, data)
-    return data
+    region, rv3d = context.region, context.region_data
+    with sketch_table.frame():
+        # Arcs are picked against the tessellation the overlay draws
+        lods = None
+        if region is not None and rv3d is not None:
+            lods = render_data.arc_lods(
+                sketch, lambda world: _project_points_to_region(world, region, rv3d)
+            )
+        sig = (
+            render_data.geometry_signature(sketch),
+            None if lods is None else lods.tobytes(),
+        )
+        cached = _pick_cache.get(obj.name)
+        if cached is not None and cached[0] == sig:
+            return cached[1], cached[2]
+
+        ts = get_prefs().theme_settings.entity
+        data = render_data.build(sketch, ts, is_active=True, lods=lods)
+    index = _build_index(data)
+    _pick_cache[obj.name] = (sig, data, index)
+    return data, index
+
+
+def _build_index(data):
+    """``GridIndex`` of the points, then the segments, of ``data`` in the
+    sketch's plane; None if its world matrix can't be inverted."""
+    try:
+        inv = np.linalg.inv(data.matrix)
+    except np.linalg.LinAlgError:
+        return None
+    points = data.points @ inv[:2, :3].T + inv[:2, 3]
+    segments = data.segments.reshape(-1, 3) @ inv[:2, :3].T + inv[:2, 3]
+    segments = segments.reshape(-1, 2, 2)
+    return GridIndex(
+        np.concatenate((points, segments.min(axis=1))),
+        np.concatenate((points, segments.max(axis=1))),
+    )
+
+
+def _nearby(data, index, region, rv3d, x0, y0, x1, y1):
+    """Masks of the points and segments that may lie within the screen
+    rectangle, to be tested exactly.
+
+    The rectangle's corners are cast onto the sketch plane and the grid index
+    is queried with their bounds: a convex quad on the plane, so the bounds
+    cover everything inside it. When a corner ray misses the plane (a view
+    edge-on to it or the horizon in the rectangle), the tile bounds are used
+    instead.
+    """
+    corners = ((x0, y0), (x1, y0), (x1, y1), (x0, y1))
+    if index is not None:
+        local, valid = _region_to_plane(corners, region, rv3d, data.matrix)
+        if valid.all():
+            found = index.query(local.min(axis=0), local.max(axis=0))
+            n = len(data.points)
+            points = np.zeros(n, dtype=bool)
+            points[found[found < n]] = True
+            segments = np.zeros(len(data.segments), dtype=bool)
+            segments[found[found >= n] - n] = True
+            return points, segments
+
+    near = _tiles_near(data, region, rv3d, x0, y0, x1, y1)
+    return near[data.point_tile], near[data.segment_tile]
+
+
+def _points_screen(data, keep, region, rv3d):
+    """Project the kept points -> (curve indices, screen (N,2), valid (N,))."""
+    screen, valid = _project_points_to_region(data.points[keep], region, rv3d)
+    return data.point_curve[keep], screen, valid
+
+
+def _seg_screen(data, keep, region, rv3d):
+    """Project the kept segments -> (curve indices, screen (N,2,2), valid (N,2))."""
+    world = data.segments[keep].reshape(-1, 3)
+    screen, valid = _project_points_to_region(world, region, rv3d)
+    n = len(world) // 2
+    return data.segment_curve[keep], screen.reshape(n, 2, 2), valid.reshape(n, 2)
 
 
-def _points_screen(items, region, rv3d):
-    """Project [(cid, world_pos), ...] -> (cids, screen (N,2), valid (N,))."""
-    cids = [cid for cid, _ in items]
-    world = np.array([p for _, p in items], dtype=np.float64)
-    screen, valid = _project_points_to_region(world, region, rv3d)
-    return cids, screen, valid
+def _kept(data, curve_index):
+    """Mask of the elements whose curve isn't in ``selection.ignore_list``."""
+    return ~data.curve_mask(selection.ignore_list)[curve_index]
 
 
-def _seg_screen(items, region, rv3d):
-    """Project [(cid, a, b), ...] -> (cids, screen (N,2,2), valid (N,2))."""
-    cids = [cid for cid, _, _ in items]
-    world = np.array([[a, b] for _, a, b in items], dtype=np.float64).reshape(-1, 3)
-    screen, valid = _project_points_to_region(world, region, rv3d)
-    n = len(items)
-    return cids, screen.reshape(n, 2, 2), valid.reshape(n, 2)
+def _tiles_near(data, region, rv3d, x0, y0, x1, y1):
+    """Mask of the tiles of ``data`` whose screen footprint may overlap the
+    rectangle; their 8 corners are all that's projected for the others."""
+    n = len(data.tile_bounds)
+    screen, valid = _project_points_to_region(
+        _box_corners(data.tile_bounds).reshape(-1, 3), region, rv3d
+    )
+    screen = screen.reshape(n, 8, 2)
+    lo, hi = screen.min(axis=1), screen.max(axis=1)
+    overlap = (lo[:, 0] <= x1) & (hi[:, 0] >= x0) & (lo[:, 1] <= y1) & (hi[:, 1] >= y0)
+    # A tile reaching behind the view can't be bounded on screen; keep it
+    return overlap | ~valid.reshape(n, 8).all(axis=1)
 
 
-def _dist_to_segment(a, b, px, py):
-    abx, aby = b[0] - a[0], b[1] - a[1]
-    seg2 = abx * abx + aby * aby
-    if seg2 < 1e-9:
-        return ((px - a[0]) ** 2 + (py - a[1]) ** 2) ** 0.5
-    t = ((px - a[0]) * abx + (py - a[1]) * aby) / seg2
-    t = min(1.0, max(0.0, t))
-    cx, cy = a[0] + t * abx, a[1] + t * aby
-    return ((px - cx) ** 2 + (py - cy) ** 2) ** 0.5
+def _dist_to_segments(a, b, px, py):
+    """Distance from (px, py) to each segment a[i]-b[i], (N, 2) each."""
+    ab = b - a
+    seg2 = (ab * ab).sum(axis=1)
+    degenerate = seg2 < 1e-9
+    t = ((px - a[:, 0]) * ab[:, 0] + (py - a[:, 1]) * ab[:, 1]) / np.where(
+        degenerate, 1.0, seg2
+    )
+    t = np.where(degenerate, 0.0, np.clip(t, 0.0, 1.0))
+    return np.hypot(a[:, 0] + t * ab[:, 0] - px, a[:, 1] + t * ab[:, 1] - py)
 
 
 def pick_ranked(context, coords):
-    """curve_ids of every active-sketch element under ``coords``, nearest first.
+    """Curve keys of every active-sketch element under ``coords``, nearest first.
 
     Points take priority over edges (a vertex on a line is still grabbable), then
     by screen distance. Unlike ``pick`` this keeps *all* candidates within the hit
     radius, so overlapping entities can be cycled through instead of only ever
     getting the topmost one (issue #50)."""
-    data = _active_data(context)
+    active = _active_data(context)
     region, rv3d = context.region, context.region_data
-    if data is None or region is None or rv3d is None:
+    if active is None or region is None or rv3d is None:
         return []
+    data, index = active
 
-    ignore = selection.ignore_list
     scale = get_scale()
     cx, cy = float(coords[0]), float(coords[1])
-    hits = []  # (priority, distance, cid)
+    hits = []  # (priority, distance, curve index)
 
-    pts = [(cid, p) for cid, p in data.point_ids if cid not in ignore]
-    if pts:
-        cids, screen, valid = _points_screen(pts, region, rv3d)
+    # Only elements near the cursor are projected
+    reach = max(_POINT_RADIUS, _EDGE_RADIUS) * scale
+    near_points, near_segments = _nearby(
+        data, index, region, rv3d, cx - reach, cy - reach, cx + reach, cy + reach
+    )
+
+    keep = _kept(data, data.point_curve) & near_points
+    if keep.any():
+        curves, screen, valid = _points_screen(data, keep, region, rv3d)
         d = np.hypot(screen[:, 0] - cx, screen[:, 1] - cy)
-        r = _POINT_RADIUS * scale
-        for i, cid in enumerate(cids):
-            if valid[i] and d[i] <= r:
-                hits.append((0, float(d[i]), cid))
-
-    segs = [(cid, a, b) for cid, a, b in data.segment_ids if cid not in ignore]
-    if segs:
-        cids, screen, valid = _seg_screen(segs, region, rv3d)
-        r = _EDGE_RADIUS * scale
-        for i, cid in enumerate(cids):
-            if not (valid[i, 0] and valid[i, 1]):
-                continue
-            dist = _dist_to_segment(screen[i, 0], screen[i, 1], cx, cy)
-            if dist <= r:
-                hits.append((1, float(dist), cid))
+        for i in np.flatnonzero(valid & (d <= _POINT_RADIUS * scale)).tolist():
+            hits.append((0, float(d[i]), int(curves[i])))
+
+    keep = _kept(data, data.segment_curve) & near_segments
+    if keep.any():
+        curves, screen, valid = _seg_screen(data, keep, region, rv3d)
+        d = _dist_to_segments(screen[:, 0], screen[:, 1], cx, cy)
+        hit = valid[:, 0] & valid[:, 1] & (d <= _EDGE_RADIUS * scale)
+        for i in np.flatnonzero(hit).tolist():
+            hits.append((1, float(d[i]), int(curves[i])))
 
     hits.sort(key=lambda h: (h[0], h[1]))
-    ranked, seen = [], set()
-    for _, _, cid in hits:
-        if cid not in seen:
-            seen.add(cid)
-            ranked.append(cid)
-    return ranked
+    ranked = dict.fromkeys(curve for _, _, curve in hits)
+    return [data.curve_ids[curve] for curve in ranked]
 
 
 def pick(context, coords):
-    """curve_id of the active sketch's nearest element under ``coords``, or ``""``."""
+    """Curve key of the active sketch's nearest element under ``coords``, or 0."""
     ranked = pick_ranked(context, coords)
-    return ranked[0] if ranked else ""
+    return ranked[0] if ranked else 0
 
 
 def update_hover(context, coords):
     """Cycle-aware hover resolution shared by the preselection gizmo and picking.
 
     Stores the ranked candidate list on ``selection.hover_candidates`` and returns
-    the curve_id to hover: the current hover is kept if it is still under the
+    the curve key to hover: the current hover is kept if it is still under the
     cursor (so a cycled choice survives small mouse moves), otherwise the nearest.
     """
     ranked = pick_ranked(context, coords)
@@ -139,48 +214,44 @@ def update_hover(context, coords):
         return selection.hover
     # Moved to a different element (or off geometry): drop any wheel-set lock.
     selection.hover_locked = False
-    return ranked[0] if ranked else ""
-
-
-def _seg_intersects_box(a, b, x0, y0, x1, y1):
-    # Endpoint inside?
-    for px, py in (a, b):
-        if x0 <= px <= x1 and y0 <= py <= y1:
-            return True
-    # Else does the segment cross any box edge? Liang-Barvey-ish clip test.
-    dx, dy = b[0] - a[0], b[1] - a[1]
-    p = (-dx, dx, -dy, dy)
-    q = (a[0] - x0, x1 - a[0], a[1] - y0, y1 - a[1])
-    t0, t1 = 0.0, 1.0
-    for pi, qi in zip(p, q):
-        if pi == 0:
-            if qi < 0:
-                return False
-        else:
-            t = qi / pi
-            if pi < 0:
-                t0 = max(t0, t)
-            else:
-                t1 = min(t1, t)
-    return t0 <= t1
+    return ranked[0] if ranked else 0
+
+
+def _segs_intersect_box(a, b, x0, y0, x1, y1):
+    """Mask of the segments a[i]-b[i] ((N, 2) each) overlapping the box."""
+
+    def inside(p):
+        return (p[:, 0] >= x0) & (p[:, 0] <= x1) & (p[:, 1] >= y0) & (p[:, 1] <= y1)
+
+    # Else does the segment cross any box edge? Liang-Barsky clip test.
+    d = b - a
+    p = np.column_stack((-d[:, 0], d[:, 0], -d[:, 1], d[:, 1]))
+    q = np.column_stack((a[:, 0] - x0, x1 - a[:, 0], a[:, 1] - y0, y1 - a[:, 1]))
+    parallel = p == 0
+    t = q / np.where(parallel, 1.0, p)
+    t0 = np.where(p < 0, t, 0.0).max(axis=1)
+    t1 = np.where(p > 0, t, 1.0).min(axis=1)
+    outside = (parallel & (q < 0)).any(axis=1)
+    return inside(a) | inside(b) | (~outside & (t0 <= t1))
 
 
 def pick_box(context, min_co, max_co):
-    """curve_ids of the active sketch whose geometry overlaps the screen box."""
-    data = _active_data(context)
+    """Curve keys of the active sketch whose geometry overlaps the screen box."""
+    active = _active_data(context)
     region, rv3d = context.region, context.region_data
-    if data is None or region is None or rv3d is None:
+    if active is None or region is None or rv3d is None:
         return []
+    data, index = active
 
-    ignore = selection.ignore_list
     x0, x1 = sorted((float(min_co[0]), float(max_co[0])))
     y0, y1 = sorted((float(min_co[1]), float(max_co[1])))
 
-    found, seen = [], set()
+    found = []  # curve indices, points first
+    near_points, near_segments = _nearby(data, index, region, rv3d, x0, y0, x1, y1)
 
-    pts = [(cid, p) for cid, p in data.point_ids if cid not in ignore]
-    if pts:
-        cids, screen, valid = _points_screen(pts, region, rv3d)
+    keep = _kept(data, data.point_curve) & near_points
+    if keep.any():
+        curves, screen, valid = _points_screen(data, keep, region, rv3d)
         inside = (
             valid
             & (screen[:, 0] >= x0)
@@ -188,19 +259,13 @@ def pick_box(context, min_co, max_co):
             & (screen[:, 1] >= y0)
             & (screen[:, 1] <= y1)
         )
-        for i, cid in enumerate(cids):
-            if inside[i] and cid not in seen:
-                seen.add(cid)
-                found.append(cid)
-
-    segs = [(cid, a, b) for cid, a, b in data.segment_ids if cid not in ignore]
-    if segs:
-        cids, screen, valid = _seg_screen(segs, region, rv3d)
-        for i, cid in enumerate(cids):
-            if cid in seen or not (valid[i, 0] and valid[i, 1]):
-                continue
-            if _seg_intersects_box(screen[i, 0], screen[i, 1], x0, y0, x1, y1):
-                seen.add(cid)
-                found.append(cid)
-
-    return found
+        found += curves[inside].tolist()
+
+    keep = _kept(data, data.segment_curve) & near_segments
+    if keep.any():
+        curves, screen, valid = _seg_screen(data, keep, region, rv3d)
+        hit = valid[:, 0] & valid[:, 1]
+        hit &= _segs_intersect_box(screen[:, 0], screen[:, 1], x0, y0, x1, y1)
+        found += curves[hit].tolist()
+
+    return [data.curve_ids[curve] for curve in dict.fromkeys(found)]
@@ -1,54 +1,69 @@
-"""Extract a sketch's renderable geometry into flat draw buckets.
+"""Extract a sketch's renderable geometry into flat arrays.
 
-Pure data — no GPU calls — so it can be unit-tested headless. Produces:
+Pure data — no GPU calls — so it can be unit-tested headless. ``build`` produces
+a ``SketchRenderData``:
 
-- ``point_buckets``: ``color -> [(world position, size factor), ...]``
-- ``line_buckets``:  ``(construction, color) -> [segment endpoint, ...]`` (pairs)
-- ``point_ids`` / ``segment_ids``: the ``curve_id`` behind each point / segment,
-  kept for CPU picking (phase 2); unused by the overlay itself.
+- ``points``: (N, 3) world positions of the point curves, with per-point colour
+  index, size factor and curve index,
+- ``segments``: (M, 2, 3) world endpoints of every line and arc/circle
+  tessellation segment, with per-segment colour index, curve index and
+  construction flag,
+- ``colors``: the palette the colour indices refer to, and ``curve_ids``: the
+  curve key (``sketch_table.to_key``) behind each curve index, for CPU picking,
+- ``bounds`` / ``tile_bounds``: world-space boxes of the whole sketch and of
+  the tiles its elements are binned into, so picking can skip what's far
+  from the cursor before projecting it.
+
+Positions go through the sketch's world matrix in one multiply and arcs are
+tessellated as a batch; nothing is built per element.
 
 ``overlay_signature`` is a cheap hash of everything that affects the drawing, so
 the overlay can skip rebuilding batches when nothing changed.
 """
 
-import math
+import itertools
 
 import numpy as np
-from mathutils import Vector
 
 from ..model.constants import SketchCurveType
+from ..utilities.constants import FULL_TURN
 from ..utilities.curve_data import (
-    get_curve_data,
-    get_uuid,
     has_uuid_field,
     read_curve_id_list,
 )
-from ..utilities.math import range_2pi
+from ..utilities.sketch_table import (
+    FLAGS,
+    KEY_DTYPE,
+    get_table,
+    keys_in,
+    lookup,
+    to_key,
+)
+from ..utilities.view import _box_corners
 from . import selection
 
-# Segments for a full circle; arcs use a proportional share (min 4).
+# Segments for a full circle; arcs use a proportional share (min 2). Used when
+# there is no view to tessellate for.
 ARC_SEGMENTS = 48
 
+# Full-circle segment counts of the view-dependent levels of detail. An arc
+# gets the coarsest level that keeps its polyline within ARC_PIXEL_TOLERANCE
+# pixels of the true curve (see ``arc_lods``).
+ARC_LOD_SEGMENTS = np.array((8, 16, 32, 64, 128, 256))
+ARC_PIXEL_TOLERANCE = 0.5
+
+# Picking culls by tile: cells of a TILE_GRID^3 grid over the sketch's bounds
+TILE_GRID = 8
+
+# id(curve_data) -> (structure_version, arcs, center, start, end rows)
+_arc_refs_cache = {}
+
 # Per-point size multipliers over the (0.75x) base point size, so hovered and
 # selected points read as noticeably bigger (applied per-vertex on the quads).
 POINT_SIZE_HOVER = 1.667
 POINT_SIZE_SELECTED = 1.667
 
 
-def _bulk_bool(attr, n):
-    out = np.zeros(n, dtype=bool)
-    if attr is not None:
-        attr.data.foreach_get("value", out)
-    return out
-
-
-def _bulk_int(attr, n):
-    out = np.full(n, -1, dtype=np.int32)
-    if attr is not None:
-        attr.data.foreach_get("value", out)
-    return out
-
-
 def curve_color(ts, selected, hover, fixed, active=True):
     """Theme color for a curve given its state (mirrors the legacy drawing)."""
     if not active:
@@ -83,13 +98,11 @@ def geometry_signature(sketch):
     if n_points == 0:
         return (0, 0, 0)
 
-    pos = np.empty(n_points * 3, dtype=np.float32)
-    cd.points.foreach_get("position", pos)
-
-    parts = [pos.tobytes()]
-    for name in ("construction", "fixed", "visible", "cyclic"):
-        parts.append(_bulk_bool(cd.attributes.get(name), n_curves).tobytes())
-    parts.append(_bulk_int(cd.attributes.get("sketch_type"), n_curves).tobytes())
+    table = get_table(cd)
+    parts = [table.positions.tobytes()]
+    for name in FLAGS:
+        parts.append(table.flags[name].tobytes())
+    parts.append(table.types.tobytes())
     parts.append(
         np.array(sketch.target_object.matrix_world, dtype=np.float32).tobytes()
     )
@@ -117,17 +130,15 @@ def overlay_signature(sketch, is_active, theme_sig):
     """
     if len(sketch.data.points) == 0:
         return (0, 0, is_active, theme_sig)
+    return (geometry_signature(sketch), *appearance_signature(is_active, theme_sig))
 
-    if not is_active:
-        return (
-            geometry_signature(sketch),
-            False,
-            theme_sig,
-            frozenset(selection.selected),
-        )
 
+def appearance_signature(is_active, theme_sig):
+    """The part of ``overlay_signature`` that only affects colours and point
+    sizes (see ``paint``), not positions."""
+    if not is_active:
+        return (False, theme_sig, frozenset(selection.selected))
     return (
-        geometry_signature(sketch),
         True,
         theme_sig,
         frozenset(selection.selected),
@@ -136,42 +147,203 @@ def overlay_signature(sketch, is_active, theme_sig):
     )
 
 
-def _arc_points(center, radius, start_angle, arc_angle, segments, mat):
-    pts = []
-    for i in range(segments + 1):
-        a = start_angle + arc_angle * i / segments
-        pts.append(
-            (
-                mat
-                @ Vector(
-                    (
-                        center.x + radius * math.cos(a),
-                        center.y + radius * math.sin(a),
-                        0,
-                    )
-                )
-            )[:]
-        )
-    return pts
-
-
 class SketchRenderData:
-    """Draw buckets extracted from one sketch's curve data."""
+    """Geometry extracted from one sketch's curve data, as flat arrays.
+
+    Points and segments carry an index into ``colors`` (the theme palette) and
+    into ``curve_ids`` (the curve behind them, for picking). The colours and
+    point sizes are the appearance part, recomputed by ``paint``.
+    """
 
-    __slots__ = ("point_buckets", "line_buckets", "point_ids", "segment_ids")
+    __slots__ = (
+        "curve_ids",
+        "curve_keys",
+        "curve_fixed",
+        "colors",
+        "points",
+        "point_color",
+        "point_size",
+        "point_curve",
+        "segments",
+        "segment_color",
+        "segment_curve",
+        "segment_construction",
+        "matrix",
+        "bounds",
+        "tile_bounds",
+        "point_tile",
+        "segment_tile",
+    )
 
     def __init__(self):
-        self.point_buckets = {}  # color(tuple) -> [(pos, size_factor), ...]
-        self.line_buckets = {}  # (construction, color) -> [pos, pos, ...]
-        self.point_ids = []  # [(curve_id, pos), ...]  (for picking)
-        self.segment_ids = []  # [(curve_id, p0, p1), ...] (for picking)
+        self.curve_ids = []  # curve key per curve
+        self.curve_keys = np.empty(0, dtype=KEY_DTYPE)  # the same, as an array
+        self.curve_fixed = np.empty(0, dtype=bool)
+        self.colors = np.empty((0, 4), dtype=np.float32)  # palette
+        self.points = np.empty((0, 3), dtype=np.float32)  # world positions
+        self.point_color = np.empty(0, dtype=np.int32)
+        self.point_size = np.empty(0, dtype=np.float32)  # size factor
+        self.point_curve = np.empty(0, dtype=np.int64)
+        self.segments = np.empty((0, 2, 3), dtype=np.float32)  # world endpoints
+        self.segment_color = np.empty(0, dtype=np.int32)
+        self.segment_curve = np.empty(0, dtype=np.int64)
+        self.segment_construction = np.empty(0, dtype=bool)
+        self.matrix = np.identity(4)  # the world matrix positions went through
+        # World-space (min, max) corners of everything, and per tile
+        self.bounds = None
+        self.tile_bounds = np.empty((0, 2, 3))
+        self.point_tile = np.empty(0, dtype=np.int64)
+        self.segment_tile = np.empty(0, dtype=np.int64)
+
+    def curve_mask(self, curve_ids):
+        """Mask over the curves of those in ``curve_ids`` (keys or hex ids)."""
+        return _curve_mask(self.curve_keys, curve_ids)
+
+
+def _curve_mask(keys, curve_ids):
+    # Selection state can hold values that aren't curve keys (0 for nothing
+    # hovered, workplane pick ids, stale strings); those match nothing.
+    query = []
+    for cid in curve_ids:
+        try:
+            key = to_key(cid)
+        except (TypeError, ValueError):
+            continue
+        if key:
+            query.append(key)
+    if not query:
+        return np.zeros(len(keys), dtype=bool)
+    return keys_in(keys, query)
 
-    def _line_bucket(self, construction, col):
-        return self.line_buckets.setdefault((construction, tuple(col)), [])
 
+def _to_world(local, mat):
+    """(N, 3) local positions through the 4x4 ``mat``."""
+    return local @ mat[:3, :3].T + mat[:3, 3]
 
-def build(sketch, ts, is_active):
-    """Extract ``SketchRenderData`` for one sketch (no GPU work)."""
+
+def tessellate_arcs(centers, radii, start_angles, sweeps, segments):
+    """Polyline segments approximating a batch of arcs.
+
+    Per arc: 2D center, radius, start angle, sweep and segment count. Returns
+    ``(arc, p0, p1)``: the arc each segment belongs to and its (M, 2) endpoints,
+    arc by arc in order.
+    """
+    segments = np.asarray(segments, dtype=np.int64)
+    arc = np.repeat(np.arange(len(segments)), segments)
+    # Index of every segment within its arc: 0..n-1 per arc
+    k = np.arange(len(arc)) - np.repeat(np.cumsum(segments) - segments, segments)
+    step = (np.asarray(sweeps) / np.maximum(segments, 1))[arc]
+    angle = np.asarray(start_angles)[arc] + step * k
+    r = np.asarray(radii)[arc][:, None]
+    center = np.asarray(centers).reshape(-1, 2)[arc]
+
+    def on_arc(a):
+        return center + r * np.column_stack((np.cos(a), np.sin(a)))
+
+    return arc, on_arc(angle), on_arc(angle + step)
+
+
+def _arc_refs(cd, table):
+    """Arc/circle rows and the rows of their center, start and end point curves
+    (-1 where unresolved). Only depends on the table structure, so it's cached
+    until that changes."""
+    cached = _arc_refs_cache.get(id(cd))
+    if cached is not None and cached[0] == table.structure_version:
+        return cached[1:]
+
+    arcs = np.flatnonzero(
+        np.isin(table.types, (SketchCurveType.ARC, SketchCurveType.CIRCLE))
+        & (table.counts > 0)
+    )
+    keys = table.keys(cd, "curve_id")
+    rows = tuple(
+        lookup(keys, table.keys(cd, field)[arcs])
+        for field in ("center_point_id", "start_point_id", "end_point_id")
+    )
+    _arc_refs_cache[id(cd)] = (table.structure_version, arcs, *rows)
+    return (arcs, *rows)
+
+
+def arc_lods(sketch, project):
+    """Level of detail (index into ``ARC_LOD_SEGMENTS``) of every curve for the
+    current view; 0 for non-arcs.
+
+    ``project`` maps (N, 3) world positions to (N, 2) region pixels and a
+    validity mask. Each arc's radius is measured on screen along both sketch
+    axes; its level is the coarsest whose chord error stays within
+    ``ARC_PIXEL_TOLERANCE`` pixels.
+    """
+    cd = sketch.data
+    table = get_table(cd)
+    lods = np.zeros(table.n_curves, dtype=np.int8)
+    arcs, center, _start, _end = _arc_refs(cd, table)
+    found = center >= 0
+    arcs, center = arcs[found], center[found]
+    if not len(arcs):
+        return lods
+
+    xy = table.positions[:, :2].astype(np.float64)
+    c = xy[table.first[center]]
+    edge = xy[table.first[arcs]] - c
+    r = np.hypot(edge[:, 0], edge[:, 1])
+    # Center and a point one radius out along each sketch axis, in world space
+    local = np.zeros((len(arcs), 3, 3))
+    local[:, :, :2] = c[:, None]
+    local[:, 1, 0] += r
+    local[:, 2, 1] += r
+    mat = np.array(sketch.target_object.matrix_world, dtype=np.float64)
+    screen, valid = project(_to_world(local.reshape(-1, 3), mat))
+    screen = np.asarray(screen).reshape(-1, 3, 2)
+    valid = np.asarray(valid, dtype=bool).reshape(-1, 3).all(axis=1)
+    r_px = np.linalg.norm(screen[:, 1:] - screen[:, :1], axis=2).max(axis=1)
+
+    # A segment spanning angle a deviates r * (1 - cos(a / 2)) from the arc
+    ratio = np.clip(1.0 - ARC_PIXEL_TOLERANCE / np.maximum(r_px, 1e-9), -1.0, 1.0)
+    with np.errstate(divide="ignore"):
+        needed = FULL_TURN / (2.0 * np.arccos(ratio))
+    level = np.searchsorted(ARC_LOD_SEGMENTS, needed)
+    lods[arcs] = np.where(valid, np.minimum(level, len(ARC_LOD_SEGMENTS) - 1), 0)
+    return lods
+
+
+def _arc_segments(cd, table, visible, lods=None):
+    """Tessellate the visible arcs/circles at their ``lods`` (``ARC_SEGMENTS``
+    per full turn without); returns (curve, p0, p1) with (M, 2) local
+    endpoints. Arcs whose points don't resolve are skipped."""
+    xy = table.positions[:, :2].astype(np.float64)
+    arcs, ct, sp, ep = _arc_refs(cd, table)
+    # A circle is tessellated whole from angle 0, its first point sets the radius
+    cyclic = table.flags["cyclic"][arcs]
+    valid = visible[arcs] & (ct >= 0) & (cyclic | ((sp >= 0) & (ep >= 0)))
+    arcs, cyclic = arcs[valid], cyclic[valid]
+    center = xy[table.first[ct[valid]]]
+    start = xy[table.first[sp[valid]]]
+    end = xy[table.first[ep[valid]]]
+
+    edge = np.where(cyclic[:, None], xy[table.first[arcs]], start) - center
+    radius = np.hypot(edge[:, 0], edge[:, 1])
+    start_angle = np.arctan2(edge[:, 1], edge[:, 0])
+    sweep = np.mod(
+        np.arctan2(end[:, 1] - center[:, 1], end[:, 0] - center[:, 0])
+        - start_angle
+        + FULL_TURN,
+        FULL_TURN,
+    )
+    start_angle[cyclic] = 0.0
+    sweep[cyclic] = FULL_TURN
+
+    full = ARC_SEGMENTS if lods is None else ARC_LOD_SEGMENTS[lods[arcs]]
+    segments = np.maximum(np.ceil(sweep / FULL_TURN * full - 1e-9), 2).astype(np.int64)
+    arc, p0, p1 = tessellate_arcs(center, radius, start_angle, sweep, segments)
+    return arcs[arc], p0, p1
+
+
+def build(sketch, ts, is_active, lods=None):
+    """Extract ``SketchRenderData`` for one sketch (no GPU work).
+
+    ``lods`` (from ``arc_lods``) sets each arc's tessellation for a view;
+    without, every full turn gets ``ARC_SEGMENTS`` segments.
+    """
     rd = SketchRenderData()
     cd = sketch.data
     n_curves = len(cd.curves)
@@ -182,90 +354,127 @@ def build(sketch, ts, is_active):
     if type_attr is None or not has_uuid_field(cd, "curve_id"):
         return rd
 
-    con = _bulk_bool(cd.attributes.get("construction"), n_curves)
-    fix = _bulk_bool(cd.attributes.get("fixed"), n_curves)
-    vis = (
-        _bulk_bool(cd.attributes.get("visible"), n_curves)
-        if cd.attributes.get("visible")
-        else np.ones(n_curves, bool)
-    )
-    cyc = _bulk_bool(cd.attributes.get("cyclic"), n_curves)
-    types = _bulk_int(type_attr, n_curves)
-    cids = read_curve_id_list(cd)
+    table = get_table(cd)
+    types = table.types
+    counts = table.counts
+    first = table.first
+    positions = table.positions
+    visible = table.flags["visible"]
+    rd.curve_ids = table.key_list(cd, "curve_id")
+    rd.curve_keys = table.keys(cd, "curve_id")
+    rd.curve_fixed = table.flags["fixed"]
+
+    points = np.flatnonzero(visible & (types == SketchCurveType.POINT) & (counts > 0))
+    lines = np.flatnonzero(visible & (types == SketchCurveType.LINE) & (counts >= 2))
+    arc_curve, arc_p0, arc_p1 = _arc_segments(cd, table, visible, lods)
+
+    # Segments in curve order, so ties in picking resolve as the data is laid out
+    segment_curve = np.concatenate((lines, arc_curve))
+    order = np.argsort(segment_curve, kind="stable")
+    local = np.zeros((len(segment_curve), 2, 3))
+    local[: len(lines), 0] = positions[first[lines]]
+    local[: len(lines), 1] = positions[first[lines] + 1]
+    local[len(lines) :, 0, :2] = arc_p0
+    local[len(lines) :, 1, :2] = arc_p1
+
+    # All positions go to world space in one multiply
+    mat = np.array(sketch.target_object.matrix_world, dtype=np.float64)
+    world = _to_world(
+        np.concatenate((positions[first[points]], local.reshape(-1, 3))), mat
+    ).astype(np.float32)
+
+    rd.matrix = mat
+    rd.points = world[: len(points)]
+    rd.point_curve = points
+
+    segment_curve = segment_curve[order]
+    rd.segments = world[len(points) :].reshape(-1, 2, 3)[order]
+    rd.segment_curve = segment_curve
+    rd.segment_construction = table.flags["construction"][segment_curve]
+    _tile(rd)
+    paint(rd, ts, is_active)
+    return rd
 
-    # Selection/hover are transient runtime state (not persisted attributes).
-    selected_set = set(selection.selected)
-    hover = selection.hover
-    highlighted = set(selection.highlight_curve_ids)
 
-    mat = sketch.target_object.matrix_world
-    cp_present = has_uuid_field(cd, "center_point_id")
+def _tile(rd):
+    """Bin the points and segments of ``rd`` into tiles and record the bounds
+    of each tile and of the whole sketch."""
+    segments = rd.segments.astype(np.float64)
+    lo = np.concatenate((rd.points, segments.min(axis=1)))
+    hi = np.concatenate((rd.points, segments.max(axis=1)))
+    if not len(lo):
+        return
+    rd.bounds = np.stack((lo.min(axis=0), hi.max(axis=0)))
+
+    # Tiles are the grid cells of each element's midpoint; a tile's bounds grow
+    # to whatever its elements span.
+    extent = rd.bounds[1] - rd.bounds[0]
+    flat = extent <= 1e-9
+    cells = np.where(flat, 1, TILE_GRID)
+    t = ((lo + hi) * 0.5 - rd.bounds[0]) / np.where(flat, 1.0, extent)
+    cell = np.minimum((t * cells).astype(np.int64), cells - 1)
+    _unique, tile = np.unique(
+        np.ravel_multi_index(tuple(cell.T), tuple(cells)), return_inverse=True
+    )
+    tile = tile.ravel()
 
-    for i in range(n_curves):
-        if not vis[i]:
-            continue
-        ctype = types[i]
-        cid = cids[i]
-        is_sel = cid in selected_set
-        is_hov = cid == hover or cid in highlighted
-        col = curve_color(ts, is_sel, is_hov, bool(fix[i]), active=is_active)
-        curve_slice = cd.curves[i]
-
-        if ctype == SketchCurveType.POINT:
-            pos = (mat @ Vector(cd.points[curve_slice.points[0].index].position))[:]
-            psize = (
-                POINT_SIZE_SELECTED if is_sel else (POINT_SIZE_HOVER if is_hov else 1.0)
-            )
-            rd.point_buckets.setdefault(tuple(col), []).append((pos, psize))
-            rd.point_ids.append((cid, pos))
-
-        elif ctype == SketchCurveType.LINE and curve_slice.points_length >= 2:
-            first = curve_slice.points[0].index
-            p1 = (mat @ Vector(cd.points[first].position))[:]
-            p2 = (mat @ Vector(cd.points[first + 1].position))[:]
-            bucket = rd._line_bucket(bool(con[i]), col)
-            bucket += [p1, p2]
-            rd.segment_ids.append((cid, p1, p2))
-
-        elif ctype in (SketchCurveType.ARC, SketchCurveType.CIRCLE) and cp_present:
-            arc_pts = _arc_points_for_curve(
-                sketch, cd, i, curve_slice, bool(cyc[i]), mat
-            )
-            if arc_pts and len(arc_pts) >= 2:
-                bucket = rd._line_bucket(bool(con[i]), col)
-                for j in range(len(arc_pts) - 1):
-                    bucket += [arc_pts[j], arc_pts[j + 1]]
-                    rd.segment_ids.append((cid, arc_pts[j], arc_pts[j + 1]))
-                if cyc[i]:
-                    bucket += [arc_pts[-1], arc_pts[0]]
-                    rd.segment_ids.append((cid, arc_pts[-1], arc_pts[0]))
+    tile_bounds = np.empty((tile.max() + 1, 2, 3))
+    tile_bounds[:, 0] = np.inf
+    tile_bounds[:, 1] = -np.inf
+    np.minimum.at(tile_bounds[:, 0], tile, lo)
+    np.maximum.at(tile_bounds[:, 1], tile, hi)
+    rd.tile_bounds = tile_bounds
+    rd.point_tile = tile[: len(rd.points)]
+    rd.segment_tile = tile[len(rd.points) :]
 
-    return rd
 
-
-def _arc_points_for_curve(sketch, cd, curve_idx, curve_slice, is_cyclic, mat):
-    cp_cid = get_uuid(cd, "center_point_id", curve_idx)
-    _, _, cp_slice = get_curve_data(sketch, cp_cid)
-    if not cp_slice:
-        return None
-    center = Vector(cd.points[cp_slice.points[0].index].position[:2])
-
-    if is_cyclic:
-        edge = Vector(cd.points[curve_slice.points[0].index].position[:2])
-        radius = (edge - center).length
-        return _arc_points(center, radius, 0, math.tau, ARC_SEGMENTS, mat)
-
-    sp_cid = get_uuid(cd, "start_point_id", curve_idx)
-    ep_cid = get_uuid(cd, "end_point_id", curve_idx)
-    _, _, s_slice = get_curve_data(sketch, sp_cid) if sp_cid else (None, None, None)
-    _, _, e_slice = get_curve_data(sketch, ep_cid) if ep_cid else (None, None, None)
-    if not (s_slice and e_slice):
+def sketch_bounds(sketch):
+    """World-space (min, max) corners of everything the sketch draws, from the
+    sketch table alone (no extraction); None when it has no points."""
+    cd = sketch.data
+    table = get_table(cd)
+    if not table.n_points:
         return None
 
-    start = Vector(cd.points[s_slice.points[0].index].position[:2])
-    end = Vector(cd.points[e_slice.points[0].index].position[:2])
-    radius = (start - center).length
-    s_angle = math.atan2((start - center).y, (start - center).x)
-    arc_angle = range_2pi(math.atan2((end - center).y, (end - center).x) - s_angle)
-    segments = max(int(arc_angle / math.tau * ARC_SEGMENTS), 4)
-    return _arc_points(center, radius, s_angle, arc_angle, segments, mat)
+    positions = table.positions.astype(np.float64)
+    lo, hi = positions.min(axis=0), positions.max(axis=0)
+    # Arcs bulge past their control points; bound them by their full circle
+    arcs, center, _start, _end = _arc_refs(cd, table)
+    found = center >= 0
+    if found.any():
+        c = positions[table.first[center[found]], :2]
+        edge = positions[table.first[arcs[found]], :2] - c
+        r = np.hypot(edge[:, 0], edge[:, 1])[:, None]
+        lo[:2] = np.minimum(lo[:2], (c - r).min(axis=0))
+        hi[:2] = np.maximum(hi[:2], (c + r).max(axis=0))
+
+    mat = np.array(sketch.target_object.matrix_world, dtype=np.float64)
+    corners = _to_world(_box_corners(np.stack((lo, hi)))[0], mat)
+    return np.stack((corners.min(axis=0), corners.max(axis=0)))
+
+
+def paint(rd, ts, is_active):
+    """(Re)compute the palette, colour indices and point sizes of ``rd`` from
+    the theme and the current selection/hover; positions are left alone."""
+    # Selection/hover are transient runtime state (not persisted attributes).
+    is_sel = rd.curve_mask(selection.selected)
+    is_hov = rd.curve_mask([selection.hover, *selection.highlight_curve_ids])
+
+    # Every curve's colour is one of the 8 selected/hovered/fixed states
+    rd.colors = np.array(
+        [
+            curve_color(ts, sel, hov, fix, active=is_active)
+            for sel, hov, fix in itertools.product((False, True), repeat=3)
+        ],
+        dtype=np.float32,
+    )
+    color = (is_sel * 4 + is_hov * 2 + rd.curve_fixed).astype(np.int32)
+
+    points = rd.point_curve
+    rd.point_color = color[points]
+    rd.point_size = np.where(
+        is_sel[points],
+        POINT_SIZE_SELECTED,
+        np.where(is_hov[points], POINT_SIZE_HOVER, 1.0),
+    ).astype(np.float32)
+    rd.segment_color = color[rd.segment_curve]
@@ -5,16 +5,19 @@ highlighted -- owned by the drawing + selection system. It is intentionally
 *not* persisted: nothing here is written to curve attributes or saved with the
 file, so selecting or hovering never dirties the datablock. The overlay reads
 this directly at draw time; the select/pick operators mutate it.
+
+Curves are referred to by key (``utilities.sketch_table.to_key``), as picking
+returns them; convert with ``to_hex`` where one goes into an RNA property.
 """
 
-# curve_ids of the currently selected geometry (list: order + duplicates as the
+# Keys of the currently selected curves (list: order + duplicates as the
 # select operators expect).
 selected = []
 
-# The single curve_id under the cursor ("" = nothing hovered).
-hover = ""
+# The single curve key under the cursor (0 = nothing hovered).
+hover = 0
 
-# curve_ids of every element under the cursor, nearest first, so overlapping
+# Keys of every curve under the cursor, nearest first, so overlapping
 # entities can be cycled. Rebuilt on each hover update; ``hover`` is one of these.
 hover_candidates = []
 
@@ -24,8 +27,8 @@ hover_candidates = []
 # when the cursor moves to a different element.
 hover_locked = False
 
-# curve_ids to render highlighted in addition to hover -- e.g. the geometry a
-# hovered constraint acts on. Cleared by the preselection gizmo.
+# Keys of the curves to render highlighted in addition to hover -- e.g. the
+# geometry a hovered constraint acts on. Cleared by the preselection gizmo.
 highlight_curve_ids = []
 
 # The constraint under the cursor, so its gizmo/icon draws highlighted.
@@ -34,7 +37,7 @@ highlight_constraint = None
 # Legacy entity-based highlight list (old entity model); kept for compatibility.
 highlight_entities = []
 
-# curve_ids to skip while picking (e.g. the geometry currently being drawn).
+# Keys of the curves to skip while picking (e.g. the geometry currently being drawn).
 ignore_list = []
 
 
@@ -79,6 +82,6 @@ def clear():
     ignore_list.clear()
     hover_candidates.clear()
     global hover, highlight_constraint, hover_locked
-    hover = ""
+    hover = 0
     hover_locked = False
     highlight_constraint = None
@@ -0,0 +1,74 @@
+"""Uniform grid over 2D boxes, for finding what lies near a point or rectangle.
+
+Picking indexes the active sketch's points and segments in the sketch's own
+plane (see ``picking``), so a hover or box query only looks at the handful of
+elements in the cells it touches instead of projecting the whole sketch.
+
+The grid is stored flat: ``items`` holds the box ids sorted by cell and
+``start[c]:start[c + 1]`` is the slice of cell ``c``. A box is registered in
+every cell its bounds overlap.
+"""
+
+import numpy as np
+
+# Cells per axis are capped so a sketch with far-flung outliers doesn't
+# allocate a huge, mostly empty grid.
+MAX_CELLS = 1024
+
+
+class GridIndex:
+    """Uniform grid over a batch of 2D (min, max) boxes."""
+
+    __slots__ = ("origin", "cell", "shape", "start", "items")
+
+    def __init__(self, lo, hi):
+        lo = np.asarray(lo, dtype=np.float64).reshape(-1, 2)
+        hi = np.asarray(hi, dtype=np.float64).reshape(-1, 2)
+        n = len(lo)
+        self.origin = lo.min(axis=0) if n else np.zeros(2)
+        extent = (hi.max(axis=0) - self.origin) if n else np.zeros(2)
+        # About one box per cell on average
+        self.cell = max(
+            float(np.sqrt(extent[0] * extent[1] / max(n, 1))),
+            float(extent.max()) / MAX_CELLS,
+            1e-9,
+        )
+        self.shape = np.minimum(extent // self.cell + 1, MAX_CELLS).astype(np.int64)
+
+        x0, y0 = self._cells(lo).T
+        x1, y1 = self._cells(hi).T
+        nx, ny = x1 - x0 + 1, y1 - y0 + 1
+        count = nx * ny
+        box = np.repeat(np.arange(n), count)
+        # Position of every (box, cell) pair within its box's cell range
+        k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        cells = (y0[box] + k // nx[box]) * self.shape[0] + x0[box] + k % nx[box]
+
+        order = np.argsort(cells, kind="stable")
+        self.items = box[order]
+        self.start = np.searchsorted(
+            cells[order], np.arange(self.shape[0] * self.shape[1] + 1)
+        )
+
+    def _cells(self, xy):
+        cell = ((xy - self.origin) // self.cell).astype(np.int64)
+        return np.clip(cell, 0, self.shape - 1)
+
+    def query(self, lo, hi):
+        """Ids of the boxes registered in the cells the rectangle (lo, hi)
+        overlaps, sorted. A superset of the boxes overlapping it: callers still
+        test the candidates exactly."""
+        lo = np.asarray(lo, dtype=np.float64)
+        hi = np.asarray(hi, dtype=np.float64)
+        if not len(self.items) or (hi < self.origin).any():
+            return np.empty(0, dtype=np.int64)
+        if (lo > self.origin + self.shape * self.cell).any():
+            return np.empty(0, dtype=np.int64)
+
+        (x0, y0), (x1, y1) = self._cells(np.stack((lo, hi)))
+        rows = np.arange(y0, y1 + 1)[:, None] * self.shape[0]
+        cells = (rows + np.arange(x0, x1 + 1)).ravel()
+        first, last = self.start[cells], self.start[cells + 1]
+        count = last - first
+        k = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        return np.unique(self.items[np.repeat(first, count) + k])
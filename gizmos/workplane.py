@@ -176,9 +176,9 @@ class VIEW3D_GT_slvs_workplane(Gizmo):
         if kind in ("border", "interior"):
             new_hover, preview = a, None  # a = workplane pick id
         elif kind == "mesh":
-            new_hover, preview = "", (a.name, b)  # a = object, b = face index
+            new_hover, preview = 0, (a.name, b)  # a = object, b = face index
         else:
-            new_hover, preview = "", None
+            new_hover, preview = 0, None
 
         changed = False
         if new_hover != selection.hover:
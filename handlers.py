@@ -67,6 +67,14 @@ def on_load_post(*args):
     from .utilities.validate import reset_cache
 
     reset_cache()
+    from . import curve_solver, refresh_scheduler
+    from .utilities import sketch_table, solve_cache
+    from .utilities.curve_data import reset_refresh_cache
+    refresh_scheduler.clear()
+    solve_cache.clear()
+    reset_refresh_cache()
+    curve_solver.reset_results()
+    sketch_table.invalidate()
     from .drawing import overlay, selection
     overlay.invalidate()
     selection.clear()
@@ -78,6 +86,10 @@ def on_load_post(*args):
     except Exception:
         logger.exception("Legacy sketch migration failed")
 
+    # Bring driven/animated dimensions in line with the loaded frame.
+    if context.scene:
+        _solve_scene_sketches(context, context.scene)
+
 
 def on_depsgraph_update(scene, depsgraph):
     from . import global_data
@@ -112,19 +124,15 @@ def on_depsgraph_update(scene, depsgraph):
             return
 
         global_data.needs_solve = False
-        from .curve_solver import solve_system
+        from . import refresh_scheduler
         from .model.sketch_ref import get_active_sketch
-        from .utilities.curve_data import refresh_curve_geometry
 
-        context = bpy.context
-        sketch = get_active_sketch(context)
-        if solve_system(context, sketch=sketch) and sketch:
-            # The solver writes point positions in place, which does not make
-            # the Geometry Nodes modifier re-evaluate; force a topology rebuild
-            # so the generated mesh matches the solved geometry (operators that
-            # solve do this themselves; this covers the depsgraph-driven path,
-            # e.g. editing a dimension value).
-            refresh_curve_geometry(sketch)
+        # The solver writes point positions in place, which does not make
+        # the Geometry Nodes modifier re-evaluate; refresh it too so the
+        # generated mesh matches the solved geometry (this covers the
+        # depsgraph-driven path, e.g. editing a dimension value). Merged with
+        # whatever the operator that caused the update already requested.
+        refresh_scheduler.request(get_active_sketch(bpy.context))
 
     if global_data.needs_redraw:
         global_data.needs_redraw = False
@@ -147,16 +155,46 @@ def on_frame_change(scene, depsgraph=None):
     if global_data.stateful_op_running:
         return
 
-    from .curve_solver import solve_system
+    _solve_scene_sketches(bpy.context, scene, depsgraph)
+
+
+def _solve_scene_sketches(context, scene, depsgraph=None):
+    """Re-solve every sketch of the scene, in parallel when the solver pool is
+    enabled in the preferences (see solver_pool). Sketches whose inputs were
+    solved before are restored from the baked frames or the solve cache
+    instead."""
     from .model.sketch_ref import get_sketches
+    from .solver_pool import _has_curves, solve_sketches
+    from .utilities import solve_bake, solve_cache
     from .utilities.curve_data import refresh_curve_geometry
     from .utilities.projection_anchor import refresh_projection_for_sketch
 
-    context = bpy.context
     depsgraph = depsgraph or context.evaluated_depsgraph_get()
+    solved = []
+    misses = []
     for sketch in get_sketches(scene):
         refresh_projection_for_sketch(sketch, depsgraph, force=True)
-        if solve_system(context, sketch=sketch):
+        if not _has_curves(sketch):
+            misses.append((sketch, None))
+            continue
+        ok = solve_bake.lookup(context, scene, sketch)
+        if ok is not None:
+            solved.append((sketch, ok))
+            continue
+        ok, key = solve_cache.lookup(context, scene, sketch)
+        if ok is None:
+            misses.append((sketch, key))
+        else:
+            solved.append((sketch, ok))
+
+    oks = solve_sketches(context, [sketch for sketch, _key in misses])
+    for (sketch, key), ok in zip(misses, oks):
+        solve_cache.store(sketch, key, ok)
+        solved.append((sketch, ok))
+    solve_bake.record(scene, solved)
+
+    for sketch, ok in solved:
+        if ok:
             refresh_curve_geometry(sketch)
 
 
@@ -193,3 +231,11 @@ def register():
 
 def unregister():
     unregister_handlers()
+
+    from . import refresh_scheduler
+    from .solver_pool import shutdown
+    from .utilities import solve_cache
+
+    refresh_scheduler.clear()
+    shutdown()
+    solve_cache.clear()
@@ -94,9 +94,9 @@ class SlvsAngle(DimensionalConstraint, PropertyGroup):
     curve_id_1: StringProperty(name="Curve ID 1", default="")
     curve_id_2: StringProperty(name="Curve ID 2", default="")
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-        h1 = handle_map.get(self.curve_id_1)
-        h2 = handle_map.get(self.curve_id_2)
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        h1 = table.get(self.curve_id_1)
+        h2 = table.get(self.curve_id_2)
         if h1 is None or h2 is None:
             return None
         return solvesys.angle(group, h1, h2, math.degrees(self.value), wp, self.setting)
@@ -156,7 +156,7 @@ class SlvsGenericEntity:
         if value:
             selection.hover = self.slvs_index
         else:
-            selection.hover = ""
+            selection.hover = 0
 
     @property
     def selected(self):
@@ -2,10 +2,13 @@
 
 CurveRef and its typed subclasses (PointRef, LineRef, ArcRef, CircleRef)
 wrap a (sketch, curve_id) pair and provide read/write access to geometry
-stored in Blender's native Curves attributes.
+stored in Blender's native Curves attributes. They take a hex id or a key
+(see ``utilities.sketch_table``), and hand out the hex id as ``curve_id`` --
+the form constraint properties store -- and the key as ``key``.
 
 Use the ``curve_ref()`` factory to get the right subclass for existing curves.
-Use ``PointRef.create()``, ``LineRef.create()``, etc. to create new curves.
+Use ``PointRef.create()``, ``LineRef.create()``, etc. to create new curves,
+and ``create_many()`` to create a lot of them at once.
 """
 
 import math
@@ -13,6 +16,7 @@ import math
 from mathutils import Matrix, Vector
 
 from ..utilities.math import pol2cart, range_2pi
+from ..utilities.sketch_table import to_hex, to_key
 
 # ---------------------------------------------------------------------------
 # Base
@@ -29,7 +33,7 @@ class CurveRef:
 
     def __init__(self, sketch, curve_id):
         self._sketch = sketch
-        self._curve_id = curve_id
+        self._curve_id = to_hex(curve_id) if isinstance(curve_id, int) else curve_id
         self._curve_data = None
         self._idx = None
         self._curve_slice = None
@@ -61,6 +65,10 @@ class CurveRef:
     def curve_id(self):
         return self._curve_id
 
+    @property
+    def key(self):
+        return to_key(self._curve_id)
+
     # -- Type checks (overridden by subclasses) --
 
     def is_point(self):
@@ -279,95 +287,35 @@ def _invalidate(sketch):
 
 
 def _build_arc_bezier(curve_data, curve_idx, center, start_co, end_co, is_cyclic=False):
-    """Compute and set bezier positions + handles for an arc or circle curve."""
-    from ..utilities.constants import FULL_TURN, HALF_TURN
-
-    curve_slice = curve_data.curves[curve_idx]
-    n_points = curve_slice.points_length
-    first = curve_slice.points[0].index
-
-    center_2d = Vector((center[0], center[1]))
-    radius = (Vector((start_co[0], start_co[1])) - center_2d).length
-    if radius < 1e-6:
-        return
-
-    if is_cyclic:
-        angle_per_segment = FULL_TURN / n_points
-        segment_count = n_points
-        start_angle = 0.0
-    else:
-        s = Vector((start_co[0], start_co[1])) - center_2d
-        e = Vector((end_co[0], end_co[1])) - center_2d
-        total_angle = range_2pi(math.atan2(e[1], e[0]) - math.atan2(s[1], s[0]))
-        segment_count = n_points - 1
-        if segment_count == 0:
-            return
-        angle_per_segment = total_angle / segment_count
-        start_angle = math.atan2(s[1], s[0])
-
-    # Bezier handle offset
-    n = FULL_TURN / angle_per_segment if angle_per_segment != 0 else 0
-    if n == 0:
-        return
-    q = (4 / 3) * math.tan(HALF_TURN / (2 * n))
-    base_offset = Vector((radius, q * radius))
-
-    # Compute all point positions on the arc
-    positions = []
-    for i in range(n_points):
-        a = start_angle + angle_per_segment * i
-        positions.append(center_2d + Vector((radius * math.cos(a), radius * math.sin(a))))
+    """Compute and set bezier positions + handles for an arc or circle curve.
 
-    # Set positions
-    for i in range(n_points):
-        curve_data.points[first + i].position = positions[i].to_3d()
+    Single-curve front end of ``arc_bezier_geometry``; only this curve's points
+    are touched, so they're written one by one rather than by a whole-domain
+    foreach_set (rebuild_segments batches many curves that way).
+    """
+    from ..utilities.curve_data import arc_bezier_geometry
 
-    locations = list(positions)
-    if is_cyclic:
-        locations.append(locations[0])
+    curve_slice = curve_data.curves[curve_idx]
+    point_idx, pos, left, right = arc_bezier_geometry(
+        (curve_slice.points[0].index,),
+        (curve_slice.points_length,),
+        (center[:2],),
+        (start_co[:2],),
+        (end_co[:2],),
+        (is_cyclic,),
+    )
+    point_idx = point_idx.tolist()
+    for i, (x, y) in zip(point_idx, pos.tolist()):
+        curve_data.points[i].position = (x, y, 0.0)
 
     attrs = curve_data.attributes
     hl = attrs.get("handle_left")
     hr = attrs.get("handle_right")
     if not hl or not hr:
         return
-
-    bezier_indices = list(range(first, first + n_points))
-    if is_cyclic:
-        bezier_indices.append(first)
-
-    from mathutils import Matrix as _Matrix
-    for seg in range(segment_count):
-        loc1, loc2 = locations[seg], locations[seg + 1]
-        b1_idx, b2_idx = bezier_indices[seg], bezier_indices[seg + 1]
-
-        for i, loc in enumerate((loc1, loc2)):
-            pos = loc - center_2d
-            angle = math.atan2(pos[1], pos[0])
-            offset = base_offset.copy()
-            if i == 1:
-                offset[1] *= -1
-            offset.rotate(_Matrix.Rotation(angle, 2))
-            coord = (center_2d + offset).to_3d()
-            if i == 0:
-                hr.data[b1_idx].vector = coord
-            else:
-                hl.data[b2_idx].vector = coord
-
-        if not is_cyclic:
-            if seg == 0:
-                pos = loc1 - center_2d
-                angle = math.atan2(pos[1], pos[0])
-                offset = base_offset.copy()
-                offset[1] *= -1
-                offset.rotate(_Matrix.Rotation(angle, 2))
-                hl.data[b1_idx].vector = (center_2d + offset).to_3d()
-            if seg == segment_count - 1:
-                pos = loc2 - center_2d
-                angle = math.atan2(pos[1], pos[0])
-                offset = base_offset.copy()
-                offset.rotate(_Matrix.Rotation(angle, 2))
-                hr.data[b2_idx].vector = (center_2d + offset).to_3d()
+    for i, (lx, ly), (rx, ry) in zip(point_idx, left.tolist(), right.tolist()):
+        hl.data[i].vector = (lx, ly, 0.0)
+        hr.data[i].vector = (rx, ry, 0.0)
 
 
 # ---------------------------------------------------------------------------
@@ -801,6 +749,288 @@ class CircleRef(CurveRef):
         return CircleRef(sketch, cid)
 
 
+# ---------------------------------------------------------------------------
+# Bulk creation
+# ---------------------------------------------------------------------------
+
+class CreatedCurves:
+    """Refs to the curves made by one ``create_many`` call, per kind."""
+
+    __slots__ = ("points", "lines", "arcs", "circles")
+
+    def __init__(self):
+        self.points = []
+        self.lines = []
+        self.arcs = []
+        self.circles = []
+
+
+def _endpoint_columns(refs, point_words, point_co):
+    """Identity words (m, 4) and 2D positions (m, 2) of segment endpoints.
+
+    ``refs`` holds indices into the points created by the same call or
+    existing PointRefs.
+    """
+    import numpy as np
+
+    from ..utilities.curve_data import _hex_to_pairs
+
+    if refs.dtype.kind not in "iu" and not any(
+        isinstance(ref, CurveRef) for ref in refs.tolist()
+    ):
+        refs = refs.astype(np.int64)
+    if refs.dtype.kind in "iu":
+        return point_words[refs], point_co[refs]
+
+    words = np.empty((len(refs), 4), dtype=np.int32)
+    co = np.empty((len(refs), 2), dtype=np.float64)
+    for i, ref in enumerate(refs.tolist()):
+        if isinstance(ref, CurveRef):
+            lo, hi = _hex_to_pairs(ref.curve_id)
+            words[i] = lo + hi
+            co[i] = ref.co
+        else:
+            words[i] = point_words[ref]
+            co[i] = point_co[ref]
+    return words, co
+
+
+def _rows(values, width):
+    """``values`` as an (n, width) array; object dtype if it holds refs."""
+    import numpy as np
+
+    if values is None:
+        return np.empty((0, width), dtype=np.int64)
+    array = np.asarray(values)
+    if array.dtype.kind not in "iuf":
+        array = np.asarray(values, dtype=object)
+    return array.reshape(-1, width)
+
+
+def _mint_ids(n):
+    """``n`` fresh curve ids as (n, 4) int32 words and as hex strings."""
+    import secrets
+
+    import numpy as np
+
+    raw = secrets.token_bytes(16 * n)
+    # Word k of an id is bits 32k..32k+31, as _pairs_to_hex reads them
+    words = np.frombuffer(raw, dtype="<u4").reshape(n, 4).view(np.int32)
+    hex_ids = [
+        f"{int.from_bytes(raw[16 * i:16 * i + 16], 'little'):032x}"
+        for i in range(n)
+    ]
+    return words, hex_ids
+
+
+def create_many(
+    sketch, points=None, lines=None, arcs=None, circles=None, construction=False
+):
+    """Create many curves at once and return their refs.
+
+    ``PointRef.create`` and friends add one curve and write its attributes
+    item by item, so building a large sketch with them is quadratic. This adds
+    every curve with a single ``add_curves``, fills the attributes with
+    ``foreach_set`` and invalidates the caches once.
+
+    Args:
+        sketch: The sketch to add to.
+        points: (N, 2) coordinates.
+        lines: (M, 2) start and end points.
+        arcs: (K, 3) center, start and end points.
+        circles: (C, 2) center point and radius.
+        construction: Whether the new curves are construction geometry.
+
+    Points referenced by lines, arcs and circles are indices into ``points``
+    or existing PointRefs.
+
+    Returns:
+        CreatedCurves with the new refs in input order.
+    """
+    import numpy as np
+
+    from ..model.constants import BezierHandleType, SketchCurveType
+    from ..utilities.constants import QUARTER_TURN
+    from ..utilities.curve_data import (
+        UUID_FIELDS,
+        arc_bezier_geometry,
+        ensure_standard_attributes,
+    )
+    from ..utilities.sketch_table import get_table
+
+    created = CreatedCurves()
+    curve_data = _ensure_curve_data(sketch)
+    if curve_data is None:
+        return created
+
+    point_co = _rows(points, 2).astype(np.float64)
+    line_rows = _rows(lines, 2)
+    arc_rows = _rows(arcs, 3)
+    circle_rows = _rows(circles, 2)
+    counts = (len(point_co), len(line_rows), len(arc_rows), len(circle_rows))
+    n_new = sum(counts)
+    if not n_new:
+        return created
+    n_pt, n_ln, n_arc, n_cir = counts
+    ends = np.cumsum(counts).tolist()
+    point_slice = slice(0, ends[0])
+    line_slice = slice(ends[0], ends[1])
+    arc_slice = slice(ends[1], ends[2])
+    circle_slice = slice(ends[2], ends[3])
+
+    words, hex_ids = _mint_ids(n_new)
+    point_words = words[point_slice]
+
+    def endpoints(refs):
+        return _endpoint_columns(refs, point_words, point_co)
+
+    ln_start, ln_end = endpoints(line_rows[:, 0]), endpoints(line_rows[:, 1])
+    arc_ct, arc_start, arc_end = (endpoints(arc_rows[:, k]) for k in range(3))
+    cir_ct = endpoints(circle_rows[:, 0])
+    radii = circle_rows[:, 1].astype(np.float64)
+
+    # Arc point counts follow ArcRef.create: one bezier segment per quarter turn
+    sv = arc_start[1] - arc_ct[1]
+    ev = arc_end[1] - arc_ct[1]
+    sweep = np.mod(
+        np.arctan2(ev[:, 1], ev[:, 0]) - np.arctan2(sv[:, 1], sv[:, 0]), 2 * np.pi
+    )
+    arc_sizes = np.ceil(sweep / QUARTER_TURN).astype(np.int64) + 1
+    sizes = np.concatenate(
+        (
+            np.ones(n_pt, dtype=np.int64),
+            np.full(n_ln, 2, dtype=np.int64),
+            arc_sizes,
+            np.full(n_cir, 4, dtype=np.int64),
+        )
+    )
+    # In the order of counts
+    kinds = np.array(
+        [
+            SketchCurveType.POINT,
+            SketchCurveType.LINE,
+            SketchCurveType.ARC,
+            SketchCurveType.CIRCLE,
+        ],
+        dtype=np.int32,
+    )
+    types = np.repeat(kinds, counts)
+
+    # Default names continue each type's count, like default_curve_name
+    existing = get_table(curve_data, values=False).types
+    name_start = {
+        ctype: int(np.count_nonzero(existing == ctype)) for ctype in kinds.tolist()
+    }
+
+    base = len(curve_data.curves)
+    base_point = len(curve_data.points)
+    curve_data.add_curves(sizes.tolist())
+    if n_ln or n_arc or n_cir:
+        curve_data.set_types(type="BEZIER")
+    ensure_standard_attributes(curve_data)
+
+    n_curves = len(curve_data.curves)
+    n_points = len(curve_data.points)
+    first = np.zeros(n_new, dtype=np.int64)
+    np.cumsum(sizes[:-1], out=first[1:])
+    first += base_point
+    attrs = curve_data.attributes
+
+    def patch(name, prop, width, dtype, fill):
+        """Read an attribute, let ``fill`` write the new items, write it back."""
+        attr = attrs.get(name)
+        if not attr:
+            return
+        domain_len = n_points if attr.domain == "POINT" else n_curves
+        data = np.empty(domain_len * width, dtype=dtype)
+        attr.data.foreach_get(prop, data)
+        fill(data.reshape(domain_len, width) if width > 1 else data)
+        attr.data.foreach_set(prop, data.ravel())
+
+    def new_curves(values):
+        def fill(data):
+            data[base:] = values
+
+        return fill
+
+    def new_points(values):
+        def fill(data):
+            data[base_point:] = values
+
+        return fill
+
+    # -- Point domain: positions and handles --
+    positions = np.zeros((n_points - base_point, 3), dtype=np.float32)
+    local_first = first - base_point
+    positions[local_first[point_slice], :2] = point_co
+    line_first = local_first[line_slice]
+    positions[line_first, :2] = ln_start[1]
+    positions[line_first + 1, :2] = ln_end[1]
+    # Line handles sit on their points; point curves keep zero handles
+    left = positions.copy()
+    left[local_first[point_slice]] = 0.0
+    right = left.copy()
+
+    cir_start = cir_ct[1] + np.column_stack((radii, np.zeros(n_cir)))
+    bez_idx, bez_pos, bez_left, bez_right = arc_bezier_geometry(
+        local_first[ends[1] :],
+        sizes[ends[1] :],
+        np.concatenate((arc_ct[1], cir_ct[1])),
+        np.concatenate((arc_start[1], cir_start)),
+        np.concatenate((arc_end[1], cir_start)),
+        types[ends[1] :] == SketchCurveType.CIRCLE,
+    )
+    positions[bez_idx, :2] = bez_pos
+    left[bez_idx, :2] = bez_left
+    right[bez_idx, :2] = bez_right
+
+    patch("position", "vector", 3, np.float32, new_points(positions))
+    patch("handle_left", "vector", 3, np.float32, new_points(left))
+    patch("handle_right", "vector", 3, np.float32, new_points(right))
+    # Segment points get free handles; the point curves come first
+    handle_types = np.full(n_points - base_point, BezierHandleType.FREE, np.int32)
+    handle_types[:n_pt] = 0
+    patch("handle_type_left", "value", 1, np.int32, new_points(handle_types))
+    patch("handle_type_right", "value", 1, np.int32, new_points(handle_types))
+
+    # -- Curve domain: type, flags and identity --
+    patch("sketch_type", "value", 1, np.int32, new_curves(types))
+    patch("construction", "value", 1, bool, new_curves(construction))
+    patch("fixed", "value", 1, bool, new_curves(False))
+    patch("visible", "value", 1, bool, new_curves(True))
+    patch("cyclic", "value", 1, bool, new_curves(types == SketchCurveType.CIRCLE))
+
+    id_words = {field: np.zeros((n_new, 4), dtype=np.int32) for field in UUID_FIELDS}
+    id_words["curve_id"][:] = words
+    id_words["start_point_id"][line_slice] = ln_start[0]
+    id_words["end_point_id"][line_slice] = ln_end[0]
+    id_words["center_point_id"][arc_slice] = arc_ct[0]
+    id_words["start_point_id"][arc_slice] = arc_start[0]
+    id_words["end_point_id"][arc_slice] = arc_end[0]
+    id_words["center_point_id"][circle_slice] = cir_ct[0]
+    for field, values in id_words.items():
+        patch(f".{field}_lo", "value", 2, np.int32, new_curves(values[:, :2]))
+        patch(f".{field}_hi", "value", 2, np.int32, new_curves(values[:, 2:]))
+
+    # STRING attributes have no foreach_set
+    name_attr = attrs.get("name")
+    if name_attr:
+        labels = dict(zip(kinds.tolist(), ("Point", "Line", "Arc", "Circle")))
+        for i, ctype in enumerate(types.tolist()):
+            name_start[ctype] += 1
+            name = f"{labels[ctype]} {name_start[ctype]}"
+            name_attr.data[base + i].value = name.encode()
+
+    _invalidate(sketch)
+    curve_data.update_tag()
+
+    created.points = [PointRef(sketch, cid) for cid in hex_ids[point_slice]]
+    created.lines = [LineRef(sketch, cid) for cid in hex_ids[line_slice]]
+    created.arcs = [ArcRef(sketch, cid) for cid in hex_ids[arc_slice]]
+    created.circles = [CircleRef(sketch, cid) for cid in hex_ids[circle_slice]]
+    return created
+
+
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
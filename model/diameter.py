@@ -83,8 +83,8 @@ class SlvsDiameter(DimensionalConstraint, PropertyGroup):
 
     curve_id_1: StringProperty(name="Curve ID 1", default="")
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-        h1 = handle_map.get(self.curve_id_1)
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        h1 = table.get(self.curve_id_1)
         if h1 is None:
             return None
         return solvesys.diameter(group, h1, self.diameter)
@@ -139,68 +139,54 @@ class SlvsDistance(DimensionalConstraint, PropertyGroup):
     curve_id_1: StringProperty(name="Curve ID 1", default="")
     curve_id_2: StringProperty(name="Curve ID 2", default="")
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-        from ..utilities.curve_data import get_curve_data, get_curve_position, get_uuid
-        from ..model.constants import SketchCurveType
-        import bpy
-
-        h1 = handle_map.get(self.curve_id_1)
-        h2 = handle_map.get(self.curve_id_2)
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        c1, c2 = self.curve_id_1, self.curve_id_2
+        h1 = table.get(c1)
+        h2 = table.get(c2)
         if h1 is None or h2 is None:
             return None
 
-        sketch = self._get_sketch()
-        cd, idx1, _ = get_curve_data(sketch, self.curve_id_1)
-        _, idx2, _ = get_curve_data(sketch, self.curve_id_2)
-        if cd is None:
+        t1 = table.type(c1)
+        if t1 is None:
             return None
 
-        type_attr = cd.attributes.get("sketch_type")
-
-        t1 = type_attr.data[idx1].value
-        t2 = type_attr.data[idx2].value if idx2 is not None else -1
-
-        value = self.get_value()
+        # get_value(), with use_flipping() answered from the table
+        value = self.value
+        if self.flip and not table.is_curve(c1) and table.is_line(c2):
+            value *= -1
 
         # Line entity1 → use start point as e1
-        if t1 == SketchCurveType.LINE:
-            sp_id = get_uuid(cd, "start_point_id", idx1)
-            h1 = handle_map.get(sp_id)
+        if table.is_line(c1):
+            h1 = table.get(table.start_point(c1))
             if h1 is None:
                 return None
 
         # Curve/arc entity1 → distance from center + radius offset
-        if t1 in (SketchCurveType.ARC, SketchCurveType.CIRCLE):
-            ct_id = get_uuid(cd, "center_point_id", idx1)
-            ct_handle = handle_map.get(ct_id)
-            ct_pos = get_curve_position(sketch, ct_id)
-            if ct_handle and ct_pos:
-                from mathutils import Vector
-                curve_slice = cd.curves[idx1]
-                edge_pos = Vector(cd.points[curve_slice.points[0].index].position)
-                radius = (edge_pos - Vector(ct_pos)).length
+        if table.is_curve(c1):
+            ct_handle = table.get(table.center_point(c1))
+            radius = table.radius(c1)
+            if ct_handle and radius is not None:
                 return solvesys.distance(group, ct_handle, h2, value + radius, wp)
             return None
 
         # Point-to-line or point-to-point
-        if t2 == SketchCurveType.LINE:
+        if table.is_line(c2):
             return solvesys.distance(group, h1, h2, value, wp)
 
-        if t2 == SketchCurveType.POINT:
+        if table.is_point(c2):
             alignment = self.align
-            if self.use_align() and alignment != "NONE":
-                p1_pos = get_curve_position(sketch, self.curve_id_1)
-                p2_pos = get_curve_position(sketch, self.curve_id_2)
-                if p1_pos and p2_pos:
-                    p = solvesys.add_point_2d(group, p2_pos[0], p1_pos[1], wp)
-                    handles = []
-                    handles.append(solvesys.horizontal(group, p, wp, entityB=h2))
-                    handles.append(solvesys.vertical(group, p, wp, entityB=h1))
-                    base = h1 if alignment == "VERTICAL" else h2
-                    handles.append(solvesys.distance(group, p, base, value, wp))
-                    return handles
-
-            return solvesys.distance(group, h1, h2, value, wp)
+            if alignment != "NONE":
+                p1_pos = table.position(c1)
+                p2_pos = table.position(c2)
+                p = solvesys.add_point_2d(
+                    group, float(p2_pos[0]), float(p1_pos[1]), wp
+                )
+                handles = []
+                handles.append(solvesys.horizontal(group, p, wp, entityB=h2))
+                handles.append(solvesys.vertical(group, p, wp, entityB=h1))
+                base = h1 if alignment == "VERTICAL" else h2
+                handles.append(solvesys.distance(group, p, base, value, wp))
+                return handles
 
         return solvesys.distance(group, h1, h2, value, wp)
 
@@ -58,12 +58,16 @@ class SlvsEqual(GenericConstraint, PropertyGroup):
             or (r1.is_circle() and r2.is_line())
         )
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-        h1 = handle_map.get(self.curve_id_1)
-        h2 = handle_map.get(self.curve_id_2)
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        h1 = table.get(self.curve_id_1)
+        h2 = table.get(self.curve_id_2)
         if h1 is None or h2 is None:
             return None
-        if not self._compatible(self.ref(1), self.ref(2)):
+        # See _compatible
+        c1, c2 = self.curve_id_1, self.curve_id_2
+        if (table.is_line(c1) and table.is_circle(c2)) or (
+            table.is_circle(c1) and table.is_line(c2)
+        ):
             self.failed = True
             return None
         kwargs = {}
@@ -133,7 +133,7 @@ class SketcherProps(PropertyGroup):
             del scene[key]
 
     def purge_stale_data(self):
-        selection.hover = ""
+        selection.hover = 0
         selection.selected.clear()
         global_data.batches.clear()
         for e in self.entities.all:
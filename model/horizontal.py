@@ -48,9 +48,9 @@ class SlvsHorizontal(GenericConstraint, PropertyGroup):
 
         return solvesys.horizontal(group, self.entity1.py_data, wp, **kwargs)
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
         """Create solvespace constraint from curve_id handles."""
-        h1 = handle_map.get(self.curve_id_1)
+        h1 = table.get(self.curve_id_1)
         if h1 is None:
             return None
 
@@ -60,12 +60,11 @@ class SlvsHorizontal(GenericConstraint, PropertyGroup):
         # point-based constraint without a resolvable partner -- feeding that to
         # the single-line form makes solvespace treat a point as a line and
         # crash Blender (issue #342), so skip anything we can't build cleanly.
-        ref1 = self.ref(1)
         kwargs = {}
-        if ref1 and ref1.is_line():
+        if table.is_line(self.curve_id_1):
             pass  # single-line form
-        elif ref1 and ref1.is_point():
-            h2 = handle_map.get(self.curve_id_2) if self.curve_id_2 else None
+        elif table.is_point(self.curve_id_1):
+            h2 = table.get(self.curve_id_2) if self.curve_id_2 else None
             if h2 is None:
                 self.failed = True
                 return None
@@ -45,10 +45,10 @@ class SlvsSymmetry(GenericConstraint, PropertyGroup):
     curve_id_2: StringProperty(name="Curve ID 2", default="")
     curve_id_3: StringProperty(name="Curve ID 3", default="")
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-        h1 = handle_map.get(self.curve_id_1)
-        h2 = handle_map.get(self.curve_id_2)
-        h3 = handle_map.get(self.curve_id_3)
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        h1 = table.get(self.curve_id_1)
+        h2 = table.get(self.curve_id_2)
+        h3 = table.get(self.curve_id_3)
         if h1 is None or h2 is None or h3 is None:
             return None
         kwargs = {}
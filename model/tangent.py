@@ -53,46 +53,29 @@ class SlvsTangent(GenericConstraint, PropertyGroup):
     curve_id_1: StringProperty(name="Curve ID 1", default="")
     curve_id_2: StringProperty(name="Curve ID 2", default="")
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
-
-        from ..model.constants import SketchCurveType
-        from ..utilities.curve_data import get_curve_data, get_curve_position, get_uuid
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
+        from mathutils import Vector
 
-        h1 = handle_map.get(self.curve_id_1)
-        h2 = handle_map.get(self.curve_id_2)
+        c1, c2 = self.curve_id_1, self.curve_id_2
+        h1 = table.get(c1)
+        h2 = table.get(c2)
         if h1 is None or h2 is None:
             return None
-
-        sketch = self._get_sketch()
-        cd1, idx1, _ = get_curve_data(sketch, self.curve_id_1)
-        cd2, idx2, _ = get_curve_data(sketch, self.curve_id_2)
-        if cd1 is None or cd2 is None:
+        if table.type(c1) is None or table.type(c2) is None:
             return None
 
-        type_attr = cd1.attributes.get("sketch_type")
-
-        t1 = type_attr.data[idx1].value
-        t2 = type_attr.data[idx2].value
-
-        is_curve1 = t1 in (SketchCurveType.ARC, SketchCurveType.CIRCLE)
-        is_curve2 = t2 in (SketchCurveType.ARC, SketchCurveType.CIRCLE)
-        is_line2 = t2 == SketchCurveType.LINE
-
-        if is_curve1 and is_line2:
+        if table.is_curve(c1) and table.is_line(c2):
             # Curve-line tangent
-            ct_id = get_uuid(cd1, "center_point_id", idx1)
-            ct_handle = handle_map.get(ct_id)
-            sp_id = get_uuid(cd2, "start_point_id", idx2)
-            ep_id = get_uuid(cd2, "end_point_id", idx2)
-
-            ct_pos = get_curve_position(sketch, ct_id)
-            sp_pos = get_curve_position(sketch, sp_id)
-            ep_pos = get_curve_position(sketch, ep_id)
-            if not all((ct_handle, ct_pos, sp_pos, ep_pos)):
+            ct_id = table.center_point(c1)
+            ct_handle = table.get(ct_id)
+            ct_pos = table.position(ct_id)
+            sp_pos = table.position(table.start_point(c2))
+            ep_pos = table.position(table.end_point(c2))
+            if ct_handle is None or any(
+                pos is None for pos in (ct_pos, sp_pos, ep_pos)
+            ):
                 return None
 
-            from mathutils import Vector
-
             orig = Vector(sp_pos[:2])
             coords = (Vector(ct_pos[:2]) - orig).project(
                 Vector(ep_pos[:2]) - orig
@@ -105,26 +88,22 @@ class SlvsTangent(GenericConstraint, PropertyGroup):
                 solvesys.perpendicular(group, h2, line, workplane=wp),
             )
 
-        elif is_curve1 and is_curve2:
+        elif table.is_curve(c1) and table.is_curve(c2):
             # Curve-curve tangent
-            ct1_id = get_uuid(cd1, "center_point_id", idx1)
-            ct2_id = get_uuid(cd2, "center_point_id", idx2)
-            ct1_handle = handle_map.get(ct1_id)
-            ct2_handle = handle_map.get(ct2_id)
-            ct1_pos = get_curve_position(sketch, ct1_id)
-            ct2_pos = get_curve_position(sketch, ct2_id)
-            if not all((ct1_handle, ct2_handle, ct1_pos, ct2_pos)):
+            ct1_id = table.center_point(c1)
+            ct2_id = table.center_point(c2)
+            ct1_handle = table.get(ct1_id)
+            ct2_handle = table.get(ct2_id)
+            ct1_pos = table.position(ct1_id)
+            ct2_pos = table.position(ct2_id)
+            if ct1_handle is None or ct2_handle is None:
+                return None
+            if ct1_pos is None or ct2_pos is None:
                 return None
 
-            from mathutils import Vector
-
-            curve1 = cd1.curves[idx1]
-            curve2 = cd2.curves[idx2]
-            edge1 = Vector(cd1.points[curve1.points[0].index].position[:2])
-            edge2 = Vector(cd2.points[curve2.points[0].index].position[:2])
-            radius1 = (edge1 - Vector(ct1_pos[:2])).length
-            radius2 = (edge2 - Vector(ct2_pos[:2])).length
-            coords = _curve_curve_tangent_seed(ct1_pos, ct2_pos, radius1, radius2)
+            coords = _curve_curve_tangent_seed(
+                ct1_pos, ct2_pos, table.radius(c1), table.radius(c2)
+            )
             p = solvesys.add_point_2d(group, coords.x, coords.y, wp)
             line = solvesys.add_line_2d(group, ct1_handle, ct2_handle, wp)
             return (
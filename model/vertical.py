@@ -47,9 +47,9 @@ class SlvsVertical(GenericConstraint, PropertyGroup):
 
         return solvesys.vertical(group, self.entity1.py_data, wp, **kwargs)
 
-    def create_slvs_data_from_curves(self, solvesys, handle_map, wp, group):
+    def create_slvs_data_from_curves(self, solvesys, table, wp, group):
         """Create solvespace constraint from curve_id handles."""
-        h1 = handle_map.get(self.curve_id_1)
+        h1 = table.get(self.curve_id_1)
         if h1 is None:
             return None
 
@@ -57,12 +57,11 @@ class SlvsVertical(GenericConstraint, PropertyGroup):
         # not from the presence of a second curve id. A point-based constraint
         # with no resolvable partner would otherwise be passed as the single-line
         # form and crash the solver on old/corrupt files (issue #342).
-        ref1 = self.ref(1)
         kwargs = {}
-        if ref1 and ref1.is_line():
+        if table.is_line(self.curve_id_1):
             pass  # single-line form
-        elif ref1 and ref1.is_point():
-            h2 = handle_map.get(self.curve_id_2) if self.curve_id_2 else None
+        elif table.is_point(self.curve_id_1):
+            h2 = table.get(self.curve_id_2) if self.curve_id_2 else None
             if h2 is None:
                 self.failed = True
                 return None
@@ -8,6 +8,8 @@ modules = [
     "context_menu",
     "solver_state",
     "solve",
+    "bake",
+    "record_solver",
     "update",
     "tweak",
     "copy_paste",
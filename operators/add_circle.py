@@ -5,7 +5,7 @@ from bpy.types import Context, Operator
 from mathutils import Vector
 from mathutils.geometry import intersect_point_line
 
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..model.curve_ref import CircleRef
 from ..stateful_operator.state import state_from_args
@@ -93,7 +93,7 @@ class View3D_OT_slvs_add_circle2d(Operator, Operator2d):
 
         if succeede:
             if self.has_coincident():
-                solve_system(context, sketch=self.sketch)
+                refresh_scheduler.request(self.sketch, refresh=False)
 
 
 register, unregister = register_stateops_factory((View3D_OT_slvs_add_circle2d,))
@@ -3,7 +3,7 @@ import logging
 from bpy.types import Operator, Context
 from bpy.props import FloatProperty
 
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..stateful_operator.utilities.register import register_stateops_factory
 from .base_constraint import GenericConstraintOp
@@ -110,9 +110,10 @@ class VIEW3D_OT_slvs_merge_points(Operator):
                 curve_ref(sketch, cid).remove()
 
         deselect_all(context)
-        selection.selected.append(target.curve_id)
+        selection.selected.append(target.key)
 
-        solve_system(context, sketch)
+        refresh_scheduler.request(sketch, refresh=False)
+        refresh_scheduler.flush(context, sketch)
         refresh(context)
 
         n = len(duplicates)
@@ -144,10 +145,14 @@ class VIEW3D_OT_slvs_add_coincident(Operator, GenericConstraintOp):
 
             merge_points(context, p1, p2)
             from ..model.sketch_ref import get_active_sketch
-            solve_system(context, get_active_sketch(context))
+            refresh_scheduler.request(get_active_sketch(context), refresh=False)
             break
         return True
 
+    def snapshot_scope(self):
+        # Merging points removes curves and retargets existing constraints
+        return None, None
+
     def main(self, context: Context):
         # Implicitly merge points
         if self.handle_merge(context):
@@ -4,7 +4,7 @@ from bpy.props import BoolProperty
 from bpy.types import Context, Operator
 from mathutils import Vector
 
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..model.curve_ref import LineRef
 from ..stateful_operator.state import state_from_args
@@ -89,7 +89,7 @@ class View3D_OT_slvs_add_line2d(Operator, Operator2d):
 
         if succeede:
             if self.has_coincident() or self.has_alignment:
-                solve_system(context, sketch=self.sketch)
+                refresh_scheduler.request(self.sketch, refresh=False)
 
 
 register, unregister = register_stateops_factory((View3D_OT_slvs_add_line2d,))
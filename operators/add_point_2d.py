@@ -7,8 +7,9 @@ from ..drawing import selection
 from ..declarations import Operators
 from ..stateful_operator.utilities.register import register_stateops_factory
 from ..stateful_operator.state import state_from_args
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..model.curve_ref import PointRef
+from ..utilities.sketch_table import to_hex
 from .base_2d import Operator2d
 
 logger = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ class View3D_OT_slvs_add_point2d(Operator, Operator2d):
         # Store hovered curve_id for auto-coincident
         hovered = selection.hover
         if hovered and self._check_constrain(context, hovered):
-            self.state_data["hovered"] = hovered
+            self.state_data["hovered"] = to_hex(hovered)
 
         self.add_coincident(context, self.target, self.state, self.state_data)
         return True
@@ -53,7 +54,7 @@ class View3D_OT_slvs_add_point2d(Operator, Operator2d):
 
         if succeede:
             if self.has_coincident():
-                solve_system(context, sketch=self.sketch)
+                refresh_scheduler.request(self.sketch, refresh=False)
             self.sketch.geometry_solved = False
 
 
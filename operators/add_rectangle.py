@@ -5,7 +5,7 @@ from bpy.types import Operator, Context
 from ..declarations import Operators
 from ..stateful_operator.utilities.register import register_stateops_factory
 from ..stateful_operator.state import state_from_args
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..model.curve_ref import PointRef, LineRef
 from .base_2d import Operator2d
 from .constants import types_point_2d
@@ -96,7 +96,7 @@ class View3D_OT_slvs_add_rectangle(Operator, Operator2d):
 
         if succeede:
             if self.has_coincident():
-                solve_system(context, sketch=self.sketch)
+                refresh_scheduler.request(self.sketch, refresh=False)
             self.sketch.geometry_solved = False
 
     def create_point(self, context: Context, values, state, state_data):
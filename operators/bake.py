@@ -0,0 +1,94 @@
+from bpy.props import IntProperty
+from bpy.types import Context, Operator
+from bpy.utils import register_classes_factory
+
+from ..declarations import Operators
+from ..utilities import solve_bake, solve_cache
+
+
+def _step_frames(context, frames):
+    """Set every frame of ``frames`` (frame_change_post solves each), then go
+    back to the current frame."""
+    scene = context.scene
+    wm = context.window_manager
+    current = scene.frame_current
+    wm.progress_begin(0, len(frames))
+    try:
+        for i, frame in enumerate(frames):
+            scene.frame_set(frame)
+            wm.progress_update(i)
+    finally:
+        scene.frame_set(current)
+        wm.progress_end()
+
+
+class _FrameRange:
+    frame_start: IntProperty(name="Start Frame")
+    frame_end: IntProperty(name="End Frame")
+
+    def invoke(self, context: Context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def frames(self):
+        if self.frame_end < self.frame_start:
+            self.report({"WARNING"}, "End frame is before start frame")
+            return None
+        return range(self.frame_start, self.frame_end + 1)
+
+
+class View3D_OT_slvs_bake_solve_cache(_FrameRange, Operator):
+    """Solve every frame of a range once so scrubbing and playback over it
+    are served from the solve cache"""
+
+    bl_idname = Operators.BakeSolveCache
+    bl_label = "Bake Solve Cache"
+
+    def execute(self, context: Context):
+        frames = self.frames()
+        if frames is None:
+            return {"CANCELLED"}
+        _step_frames(context, frames)
+
+        stats = solve_cache.stats()
+        self.report(
+            {"INFO"},
+            "Baked {} frames, {} cached solves ({:.1f} MB)".format(
+                len(frames), stats["entries"], stats["nbytes"] / 2**20
+            ),
+        )
+        return {"FINISHED"}
+
+
+class View3D_OT_slvs_bake_solve_file(_FrameRange, Operator):
+    """Solve every frame of a range and store the results in a file next to
+    the .blend, used instead of solving while the sketches don't change"""
+
+    bl_idname = Operators.BakeSolveFile
+    bl_label = "Bake Solves to File"
+
+    def execute(self, context: Context):
+        path = solve_bake.bake_path()
+        if not path:
+            self.report({"WARNING"}, "Save the file before baking")
+            return {"CANCELLED"}
+        frames = self.frames()
+        if frames is None:
+            return {"CANCELLED"}
+
+        solve_bake.begin()
+        try:
+            _step_frames(context, frames)
+        finally:
+            count = solve_bake.end(context.scene, path)
+
+        self.report(
+            {"INFO"}, "Baked {} frames of {} sketches".format(len(frames), count)
+        )
+        return {"FINISHED"}
+
+
+register, unregister = register_classes_factory(
+    (View3D_OT_slvs_bake_solve_cache, View3D_OT_slvs_bake_solve_file)
+)
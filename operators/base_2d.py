@@ -39,8 +39,7 @@ class Operator2d(GenericEntityOp):
             },
         }
         if obj and obj.data:
-            snap["curve_data"] = self._snapshot_curve_data(obj.data)
-            snap["constraints"] = self._snapshot_constraints(obj.data)
+            snap.update(self._snapshot_sketch(obj.data))
         return snap
 
     def restore_snapshot(self, context: Context, snapshot):
@@ -54,15 +53,24 @@ class Operator2d(GenericEntityOp):
         name = snapshot.get("active_name")
         obj = bpy.data.objects.get(name) if name else None
         if obj and obj.data and "curve_data" in snapshot:
-            self._restore_curve_data(obj.data, snapshot["curve_data"])
-            # Clear then restore: an empty constraints snapshot means "the sketch
-            # had none", and _restore_constraints early-returns on empty -- so a
-            # constraint added during the preview must be removed here, or it
-            # would survive the undo (the pre-draw state had zero constraints).
-            for coll in obj.data.sketch_constraints.get_lists():
-                while len(coll) > 0:
-                    coll.remove(0)
-            self._restore_constraints(obj.data, snapshot.get("constraints", {}))
+            restored = self._restore_curve_data(obj.data, snapshot["curve_data"])
+            if "constraint_counts" in snapshot:
+                # Only drop the added constraints along with the geometry they
+                # were solved on
+                if restored:
+                    self._truncate_constraints(
+                        obj.data, snapshot["constraint_counts"]
+                    )
+            else:
+                # Clear then restore: an empty constraints snapshot means "the
+                # sketch had none", and _restore_constraints early-returns on
+                # empty -- so a constraint added during the preview must be
+                # removed here, or it would survive the undo (the pre-draw
+                # state had zero constraints).
+                for coll in obj.data.sketch_constraints.get_lists():
+                    while len(coll) > 0:
+                        coll.remove(0)
+                self._restore_constraints(obj.data, snapshot.get("constraints", {}))
 
         # Re-apply dimensional values last (see base restore_snapshot / #564).
         for key, value in snapshot.get("constraint_values", {}).items():
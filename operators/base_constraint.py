@@ -3,12 +3,11 @@ import logging
 from bpy.props import BoolProperty
 from bpy.types import Context
 
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..model.sketch_ref import get_active_constraints
 from ..model.types import SlvsConstraints
 from ..stateful_operator.state import state_from_args
 from ..utilities.bpy import setprop
-from ..utilities.curve_data import refresh_curve_geometry
 from ..utilities.select import deselect_all
 from ..utilities.view import refresh
 from .base_2d import Operator2d
@@ -85,6 +84,11 @@ class GenericConstraintOp(Operator2d):
 
         return states
 
+    def snapshot_scope(self):
+        # Adding a constraint appends to its collection; the solve only moves
+        # points and handles
+        return {"handle_left", "handle_right"}, {self.type.lower()}
+
     def _current_constraint_value(self, _context, _coords):
         return self.value
 
@@ -125,9 +129,10 @@ class GenericConstraintOp(Operator2d):
         self.sync_settings()
 
         deselect_all(context)
-        solve_system(context, sketch=self.sketch)
-        if self.sketch:
-            refresh_curve_geometry(self.sketch)
+        # Solved inline: previews (and redo-panel value edits) show the
+        # constrained geometry right away
+        refresh_scheduler.request(self.sketch)
+        refresh_scheduler.flush(context, self.sketch)
         refresh(context)
         self.initialized = True
         return hasattr(self, "target") and bool(self.target)
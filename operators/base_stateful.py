@@ -1,15 +1,16 @@
 from typing import Any, Optional
 
 import bpy
-import numpy as np
 from bpy.props import FloatVectorProperty
 from bpy.types import Context
 
-from .. import global_data
+from .. import global_data, refresh_scheduler
 from ..drawing import selection
 from ..model.types import SlvsGenericEntity, SlvsNormal3D, SlvsPoint2D, SlvsPoint3D
 from ..serialize import scene_from_dict, scene_to_dict
 from ..stateful_operator.integration import StatefulOperator
+from ..utilities.curve_snapshot import CurveDataSnapshot
+from ..utilities.sketch_table import to_hex
 from .utilities import get_hovered
 
 
@@ -93,7 +94,7 @@ class GenericEntityOp(StatefulOperator):
         if not hovered and hasattr(self, "_check_constrain"):
             hover = selection.hover
             if hover and self._check_constrain(context, hover):
-                hovered_cid = hover
+                hovered_cid = to_hex(hover)
 
         data["hovered"] = hovered_cid
         data["type"] = type(hovered) if hovered else None
@@ -294,105 +295,64 @@ class GenericEntityOp(StatefulOperator):
     def on_before_redo_states(self, context: Context):
         selection.ignore_list.clear()
 
-    @staticmethod
-    def _snapshot_curve_data(curve_data):
-        """Snapshot a hair_curves object's geometry and attributes."""
-        n_curves = len(curve_data.curves)
-        if n_curves == 0:
-            return {"n_curves": 0}
-
-        n_points = len(curve_data.points)
+    def _end(self, context: Context, succeede, *args, **kwargs):
+        retval = super()._end(context, succeede, *args, **kwargs)
+        # The undo step is pushed once FINISHED is returned: run the solve
+        # requested from main/fini now rather than from the scheduler's timer
+        if succeede:
+            from ..model.sketch_ref import get_active_sketch
 
-        point_counts = np.zeros(n_curves, dtype=np.int32)
-        curve_data.curves.foreach_get("points_length", point_counts)
+            refresh_scheduler.flush(context, get_active_sketch(context))
+        return retval
 
-        positions = np.zeros(n_points * 3, dtype=np.float32)
-        curve_data.points.foreach_get("position", positions)
+    def snapshot_scope(self):
+        """What the operator's preview changes, so its undo snapshots record
+        only that.
 
-        attrs = {}
-        for attr in curve_data.attributes:
-            if attr.name == "position":
-                continue
-            domain_len = n_points if attr.domain == "POINT" else n_curves
-            if attr.data_type == "FLOAT_VECTOR":
-                data = np.zeros(domain_len * 3, dtype=np.float32)
-                attr.data.foreach_get("vector", data)
-            elif attr.data_type == "BOOLEAN":
-                data = np.zeros(domain_len, dtype=np.bool_)
-                attr.data.foreach_get("value", data)
-            elif attr.data_type in ("INT", "INT8"):
-                data = np.zeros(domain_len, dtype=np.int32)
-                attr.data.foreach_get("value", data)
-            elif attr.data_type in ("INT32_2D", "INT16_2D"):
-                data = np.zeros(domain_len * 2, dtype=np.int32)
-                attr.data.foreach_get("value", data)
-            elif attr.data_type == "FLOAT":
-                data = np.zeros(domain_len, dtype=np.float32)
-                attr.data.foreach_get("value", data)
-            elif attr.data_type == "STRING":
-                from ..utilities.curve_data import get_str_attr
-
-                data = [get_str_attr(attr, i) for i in range(domain_len)]
-            else:
-                continue
-            attrs[attr.name] = {
-                "data": data,
-                "type": attr.data_type,
-                "domain": attr.domain,
+        Returns ``(attributes, constraints)``: the names of the curve
+        attributes it writes besides point positions, and of the constraint
+        collections it only appends to. None for either records all of it.
+        """
+        return None, None
+
+    def _snapshot_sketch(self, curve_data):
+        """Snapshot one sketch's curve data and constraints within the
+        operator's ``snapshot_scope``."""
+        attributes, constraints = self.snapshot_scope()
+        snap = {"curve_data": CurveDataSnapshot(curve_data, attributes=attributes)}
+        if constraints is None:
+            snap["constraints"] = self._snapshot_constraints(curve_data)
+        else:
+            sc = curve_data.sketch_constraints
+            snap["constraint_counts"] = {
+                name: len(sc.get_list(name)) for name in constraints
             }
+        return snap
 
-        return {
-            "n_curves": n_curves,
-            "point_counts": point_counts,
-            "positions": positions,
-            "attributes": attrs,
-        }
+    @staticmethod
+    def _truncate_constraints(curve_data, counts):
+        """Remove the constraints appended since ``counts`` were taken."""
+        sc = curve_data.sketch_constraints
+        for name, count in counts.items():
+            data_coll = sc.get_list(name)
+            while len(data_coll) > count:
+                data_coll.remove(len(data_coll) - 1)
 
     @staticmethod
-    def _restore_curve_data(curve_data, snapshot):
-        """Restore a hair_curves object from a snapshot."""
-        if snapshot["n_curves"] == 0:
-            if len(curve_data.curves) > 0:
-                curve_data.remove_curves()
-            return
+    def _snapshot_curve_data(curve_data):
+        """Snapshot a hair_curves object's geometry and attributes."""
+        return CurveDataSnapshot(curve_data)
 
-        # Fast path: when the topology is unchanged (e.g. an interactive move,
-        # which only shifts point positions), skip the expensive
-        # remove_curves/add_curves rebuild and just overwrite the data in place.
-        # This runs every mouse-move, so the rebuild otherwise scales the whole
-        # sketch's geometry per frame.
-        counts = snapshot["point_counts"]
-        same_topology = len(curve_data.curves) == snapshot["n_curves"] and len(
-            curve_data.points
-        ) == int(counts.sum())
-        if same_topology:
-            cur_counts = np.zeros(len(curve_data.curves), dtype=np.int32)
-            curve_data.curves.foreach_get("points_length", cur_counts)
-            same_topology = np.array_equal(cur_counts, counts)
-
-        if not same_topology:
-            if len(curve_data.curves) > 0:
-                curve_data.remove_curves()
-            curve_data.add_curves(counts.tolist())
-            curve_data.set_types(type="BEZIER")
-
-        curve_data.points.foreach_set("position", snapshot["positions"])
-
-        for name, attr_info in snapshot["attributes"].items():
-            attr = curve_data.attributes.get(name)
-            if not attr:
-                attr = curve_data.attributes.new(
-                    name, type=attr_info["type"], domain=attr_info["domain"]
-                )
-            if attr_info["type"] == "FLOAT_VECTOR":
-                attr.data.foreach_set("vector", attr_info["data"])
-            elif attr_info["type"] == "STRING":
-                for i, v in enumerate(attr_info["data"]):
-                    attr.data[i].value = v.encode() if isinstance(v, str) else v
-            else:
-                attr.data.foreach_set("value", attr_info["data"])
+    @staticmethod
+    def _restore_curve_data(curve_data, snapshot):
+        """Restore a hair_curves object from a snapshot.
 
-        curve_data.update_tag()
+        When the topology is unchanged (e.g. an interactive move, which only
+        shifts point positions) the data is overwritten in place instead of
+        rebuilt; this runs every mouse-move. Returns False if a partial
+        snapshot couldn't be restored.
+        """
+        return snapshot.restore(curve_data)
 
     @staticmethod
     def _snapshot_constraints(curve_data):
@@ -451,13 +411,10 @@ class GenericEntityOp(StatefulOperator):
         for sketch in get_sketches(context):
             obj = sketch.target_object
             if obj and obj.data:
-                curve_snapshots[obj.name] = {
-                    "curve_data": self._snapshot_curve_data(obj.data),
-                    "constraints": self._snapshot_constraints(obj.data),
-                }
+                curve_snapshots[obj.name] = self._snapshot_sketch(obj.data)
             else:
                 curve_snapshots[obj.name] = {
-                    "curve_data": {"n_curves": 0},
+                    "curve_data": CurveDataSnapshot(),
                     "constraints": {},
                 }
         return curve_snapshots
@@ -478,8 +435,16 @@ class GenericEntityOp(StatefulOperator):
 
             snap = curve_snapshots.get(obj.name)
             if snap:
-                self._restore_curve_data(obj.data, snap["curve_data"])
-                self._restore_constraints(obj.data, snap.get("constraints", {}))
+                restored = self._restore_curve_data(obj.data, snap["curve_data"])
+                if "constraint_counts" in snap:
+                    # Constraints without the geometry they were solved on
+                    # would be lost for good; keep both instead
+                    if restored:
+                        self._truncate_constraints(
+                            obj.data, snap["constraint_counts"]
+                        )
+                else:
+                    self._restore_constraints(obj.data, snap.get("constraints", {}))
             else:
                 if len(obj.data.curves) > 0:
                     obj.data.remove_curves()
@@ -498,6 +463,15 @@ class GenericEntityOp(StatefulOperator):
             },
         }
 
+    def release_snapshot(self, snapshot: Any) -> None:
+        """Hand the curve data buffers back to the snapshot pool."""
+        if not snapshot:
+            return
+        for snap in (snapshot, *snapshot.get("curves", {}).values()):
+            curve_data = snap.get("curve_data")
+            if curve_data is not None:
+                curve_data.release()
+
     def restore_snapshot(self, context: Context, snapshot: Any) -> None:
         """Restore sketcher state from serialized snapshot"""
         if not snapshot:
@@ -7,7 +7,7 @@ from mathutils import Vector
 from ..drawing import selection
 from ..model.curve_ref import PointRef, LineRef, ArcRef, CircleRef, CurveRef, curve_ref
 from ..utilities.view import refresh
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..stateful_operator.utilities.register import register_stateops_factory
 from ..stateful_operator.state import state_from_args
@@ -44,7 +44,7 @@ def _get_bevel_points(sketch, topo):
             continue
 
         if isinstance(ref, PointRef):
-            candidates.add(cid)
+            candidates.add(ref.curve_id)
         else:
             # Add endpoints of selected segments
             for attr in ("start_point_id", "end_point_id"):
@@ -231,7 +231,7 @@ class View3D_OT_slvs_bevel(Operator, Operator2d):
 
         refresh(context)
         sketch.geometry_solved = False
-        solve_system(context, sketch)
+        refresh_scheduler.request(sketch, refresh=False)
 
 
 register, unregister = register_stateops_factory((View3D_OT_slvs_bevel,))
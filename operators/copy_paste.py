@@ -13,6 +13,7 @@ from ..model.constants import SketchCurveType
 from ..utilities.curve_data import (
     get_curve_data, get_uuid, invalidate_curve_id_cache, UUID_FIELDS,
 )
+from ..utilities.sketch_table import to_key
 
 
 def _snapshot_curve(sketch, curve_id):
@@ -80,11 +81,12 @@ class View3D_OT_slvs_copy(Operator):
             return {"CANCELLED"}
 
         # Collect selected curve_ids and their point dependencies
-        all_cids = set(selection.selected)
-        for cid in list(all_cids):
-            ref = curve_ref(sketch, cid)
+        all_cids = set()
+        for key in selection.selected:
+            ref = curve_ref(sketch, key)
             if not ref.valid:
                 continue
+            all_cids.add(ref.curve_id)
             # Include relationship points
             for attr in ("start_point_id", "end_point_id", "center_point_id"):
                 pt_cid = ref._get_attr_value(attr, 0)
@@ -183,7 +185,7 @@ class View3D_OT_slvs_paste(Operator):
             # Select pasted curves (skip points)
             ctype = snap["curve_attrs"].get("sketch_type", -1)
             if ctype != SketchCurveType.POINT:
-                selection.selected.append(new_cid)
+                selection.selected.append(to_key(new_cid))
 
         invalidate_curve_id_cache(sketch)
         curve_data.update_tag()
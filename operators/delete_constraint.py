@@ -6,7 +6,7 @@ from bpy.props import IntProperty, StringProperty
 from bpy.types import Operator, Context
 
 from ..utilities.view import refresh
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..utilities.highlighting import HighlightElement
 
@@ -44,7 +44,9 @@ class View3D_OT_slvs_delete_constraint(Operator, HighlightElement):
         constraints.remove(constr)
 
         from ..model.sketch_ref import get_active_sketch
-        solve_system(context, sketch=get_active_sketch(context))
+        sketch = get_active_sketch(context)
+        refresh_scheduler.request(sketch, refresh=False)
+        refresh_scheduler.flush(context, sketch)
         refresh(context)
         return {"FINISHED"}
 
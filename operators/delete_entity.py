@@ -7,57 +7,34 @@ from bpy.types import Operator, Context
 from ..drawing import selection
 from ..model.sketch_ref import get_active_sketch
 from ..utilities.view import refresh
-from ..utilities.curve_data import remove_native_curve_by_id
+from ..utilities.curve_data import remove_native_curves_by_id
+from ..utilities.sketch_table import to_key
 from ..declarations import Operators
-from ..curve_solver import solve_system
+from .. import refresh_scheduler
 from ..utilities.highlighting import HighlightElement
 
 logger = logging.getLogger(__name__)
 
 
-def _get_dependent_curve_ids(sketch, curve_id):
-    """Find curve_ids that reference this curve_id via relationship attributes."""
-    from ..utilities.curve_data import get_uuid, has_uuid_field
-
-    if not sketch or not sketch.target_object or not sketch.target_object.data:
-        return []
-
-    cd = sketch.target_object.data
-    n = len(cd.curves)
-    if not has_uuid_field(cd, "curve_id"):
-        return []
-
-    deps = []
-    for i in range(n):
-        cid = get_uuid(cd, "curve_id", i)
-        if cid == curve_id:
-            continue
-        if get_uuid(cd, "start_point_id", i) == curve_id:
-            deps.append(cid)
-        elif get_uuid(cd, "end_point_id", i) == curve_id:
-            deps.append(cid)
-        elif get_uuid(cd, "center_point_id", i) == curve_id:
-            deps.append(cid)
-    return deps
-
-
-def _get_constraint_indices_for_curve_id(curve_id, context):
-    """Find constraints that reference a curve_id."""
+def _get_constraint_indices_for_curve_ids(curve_ids, context):
+    """Find constraints that reference any of ``curve_ids`` (hex ids or keys),
+    in one scan."""
     from ..model.sketch_ref import get_active_constraints
     constraints = get_active_constraints(context)
     if not constraints:
         return []
+    keys = {to_key(cid) for cid in curve_ids}
+    keys.discard(0)
     ret_list = []
 
     for data_coll in constraints.get_lists():
-        indices = []
-        for i, c in enumerate(data_coll):
-            if getattr(c, "curve_id_1", "") == curve_id:
-                indices.append(i)
-            elif getattr(c, "curve_id_2", "") == curve_id:
-                indices.append(i)
-            elif getattr(c, "curve_id_3", "") == curve_id:
-                indices.append(i)
+        indices = [
+            i
+            for i, c in enumerate(data_coll)
+            if to_key(getattr(c, "curve_id_1", "")) in keys
+            or to_key(getattr(c, "curve_id_2", "")) in keys
+            or to_key(getattr(c, "curve_id_3", "")) in keys
+        ]
         if indices:
             ret_list.append((data_coll, indices))
     return ret_list
@@ -91,27 +68,21 @@ class View3D_OT_slvs_delete_entity(Operator, HighlightElement):
         if not to_delete:
             return {"CANCELLED"}
 
-        for cid in to_delete:
-            self._delete_curve(context, sketch, cid)
+        # Everything referencing a deleted point goes with it
+        removed = remove_native_curves_by_id(sketch, to_delete, dependents=True)
+        for data_coll, indices in _get_constraint_indices_for_curve_ids(
+            removed, context
+        ):
+            for i in reversed(indices):
+                data_coll.remove(i)
 
         selection.selected.clear()
-        selection.hover = ""
+        selection.hover = 0
 
-        solve_system(context, sketch=sketch)
+        refresh_scheduler.request(sketch, refresh=False)
+        refresh_scheduler.flush(context, sketch)
         refresh(context)
         return {"FINISHED"}
 
-    def _delete_curve(self, context, sketch, curve_id):
-        deps = _get_dependent_curve_ids(sketch, curve_id)
-        if deps:
-            for dep_cid in deps:
-                self._delete_curve(context, sketch, dep_cid)
-
-        for data_coll, indices in _get_constraint_indices_for_curve_id(curve_id, context):
-            for i in reversed(indices):
-                data_coll.remove(i)
-
-        remove_native_curve_by_id(sketch, curve_id)
-
 
 register, unregister = register_classes_factory((View3D_OT_slvs_delete_entity,))
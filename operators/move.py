@@ -10,8 +10,8 @@ from ..model.curve_ref import curve_ref, PointRef
 from .base_2d import Operator2d
 from ..stateful_operator.state import state_from_args
 from ..stateful_operator.utilities.register import register_stateops_factory
-from ..curve_solver import solve_system
-from ..utilities.curve_data import refresh_curve_geometry, batch_update
+from .. import refresh_scheduler
+from ..utilities.curve_data import batch_update
 from ..utilities.view import get_pos_2d
 
 
@@ -29,7 +29,7 @@ def get_points(context: Context):
             continue
 
         if isinstance(ref, PointRef):
-            point_cids.add(cid)
+            point_cids.add(ref.curve_id)
         else:
             # Collect relationship points
             for attr in ("start_point_id", "end_point_id", "center_point_id"):
@@ -105,6 +105,7 @@ class View3D_OT_slvs_move(Operator, Operator2d):
 
         # Only the moved points changed, so scope the segment rebuild to them.
         moved_ids = {p.curve_id for p in points}
+        self._moved_ids = moved_ids
         with batch_update(self.sketch, point_ids=moved_ids):
             for point in points:
                 point.co = point.co + self.offset
@@ -114,8 +115,10 @@ class View3D_OT_slvs_move(Operator, Operator2d):
         if succeede:
             if self.sketch:
                 self.sketch.geometry_solved = False
-            solve_system(context, sketch=self.sketch)
-            refresh_curve_geometry(self.sketch)
+            # Only the components holding a moved point need re-solving.
+            refresh_scheduler.request(
+                self.sketch, changed_ids=getattr(self, "_moved_ids", None)
+            )
 
 
 register, unregister = register_stateops_factory((View3D_OT_slvs_move,))
@@ -10,13 +10,13 @@ import bpy
 from bpy.props import BoolProperty
 from bpy.types import Context, Operator
 
+from .. import refresh_scheduler
 from ..declarations import Operators
 from ..model.sketch_ref import get_active_sketch
 from ..stateful_operator.constants import mesh_element_types
 from ..stateful_operator.integration import StatefulOperator
 from ..stateful_operator.state import state_from_args
 from ..stateful_operator.utilities.register import register_stateops_factory
-from ..utilities.curve_data import refresh_curve_geometry
 from ..utilities.projection_anchor import project_mesh_element
 from .base_stateful import GenericEntityOp
 
@@ -77,10 +77,9 @@ class VIEW3D_OT_slvs_project_geometry(Operator, GenericEntityOp):
             sketch, source, elem, mesh_index, construction=self.construction
         )
         if n_points or n_lines:
-            refresh_curve_geometry(sketch)
+            refresh_scheduler.request(sketch)
             from .. import global_data
 
-            global_data.needs_solve = True
             global_data.needs_redraw = True
 
         self.target = sketch
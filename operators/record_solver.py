@@ -0,0 +1,45 @@
+import os
+
+import bpy
+from bpy.props import StringProperty
+from bpy.types import Context, Operator
+from bpy.utils import register_classes_factory
+
+from .. import solver_record
+from ..declarations import Operators
+from ..model.sketch_ref import get_active_sketch
+
+
+class View3D_OT_slvs_record_solver(Operator):
+    """Save the solver system of the active sketch to a file that
+    scripts/solver_replay.py can re-run outside Blender"""
+
+    bl_idname = Operators.RecordSolver
+    bl_label = "Record Solver System"
+
+    filepath: StringProperty(subtype="FILE_PATH")
+    filter_glob: StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context: Context):
+        return get_active_sketch(context) is not None
+
+    def invoke(self, context: Context, event):
+        sketch = get_active_sketch(context)
+        name = bpy.path.clean_name(sketch.name) + ".slvs.json"
+        self.filepath = os.path.join(bpy.path.abspath("//"), name)
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context: Context):
+        sketch = get_active_sketch(context)
+        doc = solver_record.capture(context, sketch)
+        solver_record.save(doc, self.filepath)
+        self.report(
+            {"INFO"},
+            "Recorded {} systems to {}".format(len(doc["systems"]), self.filepath),
+        )
+        return {"FINISHED"}
+
+
+register, unregister = register_classes_factory((View3D_OT_slvs_record_solver,))
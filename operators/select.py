@@ -6,6 +6,7 @@ from ..declarations import Operators
 from ..drawing import selection
 from ..utilities.highlighting import HighlightElement
 from ..utilities.select import deselect_all, mode_property, select_all
+from ..utilities.sketch_table import to_key
 from .utilities import select_extend, select_invert
 
 
@@ -21,8 +22,8 @@ class View3D_OT_slvs_select(Operator, HighlightElement):
     bl_idname = Operators.Select
     bl_label = "Select Sketch Entities"
 
-    # Selection keys are curve ids (see selection.selected); when unset the
-    # currently hovered curve id is used.
+    # Hex curve id of the curve to select; when unset the currently hovered
+    # curve is used. Selection holds curve keys (see selection.selected).
     index: StringProperty(name="Curve ID", default="")
     mode: mode_property
     # Alt+click: step to the next entity in the overlapping stack under the cursor
@@ -35,7 +36,9 @@ class View3D_OT_slvs_select(Operator, HighlightElement):
         if self.cycle and not selection.take_hover_lock():
             selection.cycle_hover(1)
         index = (
-            self.index if self.properties.is_property_set("index") else selection.hover
+            to_key(self.index)
+            if self.properties.is_property_set("index")
+            else selection.hover
         )
         hit = bool(index)
         mode = self.mode
@@ -44,9 +44,8 @@ class View3D_OT_slvs_trim(Operator, Operator2d):
     @staticmethod
     def _delete_segment(context, sketch, segment):
         """Delete a segment and its orphan endpoints."""
-        from ..operators.delete_entity import _get_constraint_indices_for_curve_id
-        from ..utilities.curve_data import remove_native_curve_by_id
-        from ..model.constants import SketchCurveType
+        from ..operators.delete_entity import _get_constraint_indices_for_curve_ids
+        from ..utilities.curve_data import remove_native_curves_by_id
 
         # Collect endpoint curve_ids
         endpoint_cids = set()
@@ -55,33 +54,18 @@ class View3D_OT_slvs_trim(Operator, Operator2d):
             if pt_cid:
                 endpoint_cids.add(pt_cid)
 
-        # Remove constraints referencing this segment
-        for data_coll, indices in _get_constraint_indices_for_curve_id(segment.curve_id, context):
+        # Remove the segment and whichever endpoints it leaves unreferenced
+        removed = remove_native_curves_by_id(
+            sketch, (segment.curve_id,), orphans=endpoint_cids
+        )
+
+        # Remove constraints referencing them
+        for data_coll, indices in _get_constraint_indices_for_curve_ids(
+            removed, context
+        ):
             for i in reversed(indices):
                 data_coll.remove(i)
 
-        # Remove the segment
-        segment.remove()
-
-        # Check which endpoints are now orphans
-        cd = sketch.data
-        if not cd:
-            return
-        n = len(cd.curves)
-
-        referenced = set()
-        type_attr = cd.attributes.get("sketch_type")
-        for i in range(n):
-            if type_attr and type_attr.data[i].value == SketchCurveType.POINT:
-                continue
-            referenced.add(get_uuid(cd, "start_point_id", i))
-            referenced.add(get_uuid(cd, "end_point_id", i))
-            referenced.add(get_uuid(cd, "center_point_id", i))
-
-        for cid in endpoint_cids:
-            if cid not in referenced:
-                remove_native_curve_by_id(sketch, cid)
-
     def main(self, context: Context):
         return True
 
@@ -2,8 +2,8 @@ import bpy
 from bpy.types import Context, Event, Operator
 from bpy.utils import register_classes_factory
 
-from .. import global_data
-from ..curve_solver import CurveSolver, solve_system
+from .. import global_data, refresh_scheduler
+from ..curve_solver import SolverSession
 from ..declarations import Operators
 from ..drawing import selection
 from ..drawing.snap import draw_snap_marker
@@ -13,7 +13,6 @@ from ..model.sketch_ref import get_active_sketch
 from ..utilities.curve_data import (
     get_curve_data,
     get_curve_type,
-    refresh_curve_geometry,
 )
 from ..utilities.view import (
     get_blender_snap_info,
@@ -93,7 +92,12 @@ class View3D_OT_slvs_tweak(Operator):
 
         self.depth = (pos - origin).length
 
+        # Build the solvespace system once for the whole drag; each mouse-move
+        # then only moves the drag pin and re-solves.
+        self._session = SolverSession(context, sketch, curve_id)
+
         self._register_snap_marker(context)
+        refresh_scheduler.drag_begin()
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
 
@@ -107,12 +111,16 @@ class View3D_OT_slvs_tweak(Operator):
                 and get_curve_type(self.sketch, self.curve_id) == SketchCurveType.POINT
             ):
                 PointRef(self.sketch, self.curve_id).fixed = True
+            self._session.end()
+            refresh_scheduler.drag_end()
             # Clean re-solve without the drag pin so the published dof/state
             # reflect the real system again (per-frame tweak solves don't publish
-            # dof, and a drag-onto-snap above just changed the true dof).
-            solve_system(context, sketch=self.sketch)
-            # Topology rebuild to trigger GN modifier refresh
-            refresh_curve_geometry(self.sketch)
+            # dof, and a drag-onto-snap above just changed the true dof). Only
+            # the dragged curve's component can have moved. Merged with the
+            # refresh of the last drag step, and run before the undo step is
+            # pushed.
+            refresh_scheduler.request(self.sketch, changed_ids={self.curve_id})
+            refresh_scheduler.flush(context, self.sketch)
             self._remove_snap_marker()
             context.window.cursor_modal_restore()
             return {"FINISHED"}
@@ -130,12 +138,11 @@ class View3D_OT_slvs_tweak(Operator):
             if pos is None:
                 return {"RUNNING_MODAL"}
 
-            solver = CurveSolver(context, self.sketch)
-            solver.tweak(self.curve_id, pos)
-            solver.solve()
+            self._session.drag(pos)
 
-            # Topology rebuild to trigger GN modifier refresh
-            refresh_curve_geometry(self.sketch)
+            # The overlay draws the solved points right away; the generated
+            # mesh follows at the drag refresh rate
+            refresh_scheduler.request(self.sketch, solve=False)
 
             context.area.tag_redraw()
 
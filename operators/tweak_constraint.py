@@ -61,9 +61,9 @@ class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
 
             self.tweak = True
             if event.type in _CANCEL and event.value == "PRESS":
-                return {"FINISHED"}
+                return self._finish(context)
             if event.type in _CONFIRM and event.value == "PRESS":
-                return {"FINISHED"}
+                return self._finish(context)
             if event.type == "LEFTMOUSE":
                 if event.value == "PRESS":
                     self._seen_press = True
@@ -79,7 +79,7 @@ class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
         if event.type == "LEFTMOUSE" and event.value == "RELEASE":
             if not self.tweak:
                 self.execute(context)
-            return {"FINISHED"}
+            return self._finish(context)
 
         if not self.tweak:
             return {"RUNNING_MODAL"}
@@ -134,16 +134,24 @@ class View3D_OT_slvs_tweak_constraint_value_pos(Operator):
         # entry: from_displayed_value + the update callback that re-solves).
         constr.value = value
 
+        # Solved right away, so the geometry follows the typed value
         sketch = get_active_sketch(context)
         if sketch:
-            from ..curve_solver import solve_system
-            from ..utilities.curve_data import refresh_curve_geometry
+            from .. import refresh_scheduler
 
-            if solve_system(context, sketch=sketch):
-                refresh_curve_geometry(sketch)
+            refresh_scheduler.request(sketch)
+            refresh_scheduler.flush(context, sketch)
         if context.area:
             context.area.tag_redraw()
 
+    def _finish(self, context: Context):
+        # The undo step is pushed once FINISHED is returned: settle the solve
+        # first
+        from .. import refresh_scheduler
+
+        refresh_scheduler.flush(context, get_active_sketch(context))
+        return {"FINISHED"}
+
     def execute(self, context: Context):
         bpy.ops.view3d.slvs_context_menu(type=self.type, index=self.index)
         return {"FINISHED"}
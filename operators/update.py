@@ -3,7 +3,7 @@ from bpy.props import BoolProperty
 from bpy.utils import register_classes_factory
 
 from ..declarations import Operators
-from ..utilities.curve_data import refresh_curve_geometry
+from .. import refresh_scheduler
 
 
 class VIEW3D_OT_update(Operator):
@@ -12,10 +12,8 @@ class VIEW3D_OT_update(Operator):
 
     def execute(self, context: Context):
         from ..model.sketch_ref import get_sketches
-        from ..curve_solver import solve_system
         for sketch in get_sketches(context):
-            solve_system(context, sketch=sketch)
-            refresh_curve_geometry(sketch)
+            refresh_scheduler.request(sketch)
         return {"FINISHED"}
 
 
@@ -5,8 +5,10 @@ from bpy.types import Context, Operator
 
 from ..drawing import selection
 from ..declarations import BLENDER_SELECT_TOOL, GizmoGroups, WorkSpaceTools
-from ..utilities.curve_data import refresh_curve_geometry, get_uuid, has_uuid_field
+from .. import refresh_scheduler
+from ..utilities.curve_data import has_uuid_field
 from ..utilities.preferences import get_prefs
+from ..utilities.sketch_table import get_table, to_key
 from ..model.sketch_ref import get_active_sketch
 
 logger = logging.getLogger(__name__)
@@ -18,12 +20,11 @@ def select_invert(context: Context):
         return
 
     curve_data = sketch.target_object.data
-    n = len(curve_data.curves)
     if not has_uuid_field(curve_data, "curve_id"):
         return
 
-    for i in range(n):
-        cid = get_uuid(curve_data, "curve_id", i)
+    table = get_table(curve_data, values=False)
+    for cid in table.key_list(curve_data, "curve_id"):
         if not cid:
             continue
         if cid in selection.selected:
@@ -47,26 +48,26 @@ def select_extend(context: Context):
     selected = set(selection.selected)
     to_add = set()
 
+    table = get_table(cd, values=False)
+    types = table.types.tolist()
+    cids = table.key_list(cd, "curve_id")
+    sps = table.key_list(cd, "start_point_id")
+    eps = table.key_list(cd, "end_point_id")
+    cps = table.key_list(cd, "center_point_id")
+
     for i in range(n):
-        cid = get_uuid(cd, "curve_id", i)
+        cid = cids[i]
         if not cid:
             continue
-        ctype = type_attr.data[i].value
-        sp = get_uuid(cd, "start_point_id", i)
-        ep = get_uuid(cd, "end_point_id", i)
-        cp = get_uuid(cd, "center_point_id", i)
-        rel_ids = {r for r in (sp, ep, cp) if r}
+        ctype = types[i]
+        rel_ids = {r for r in (sps[i], eps[i], cps[i]) if r}
 
         if ctype == SketchCurveType.POINT:
             # Point selected → select segments referencing it
             if cid in selected:
                 for j in range(n):
-                    j_cid = get_uuid(cd, "curve_id", j)
-                    j_sp = get_uuid(cd, "start_point_id", j)
-                    j_ep = get_uuid(cd, "end_point_id", j)
-                    j_cp = get_uuid(cd, "center_point_id", j)
-                    if cid in (j_sp, j_ep, j_cp):
-                        to_add.add(j_cid)
+                    if cid in (sps[j], eps[j], cps[j]):
+                        to_add.add(cids[j])
         else:
             # Segment selected → select its points
             if cid in selected:
@@ -79,7 +80,8 @@ def select_extend(context: Context):
     sketch = get_active_sketch(context)
     coincident = sketch.constraints.coincident if sketch else []
     for c in coincident:
-        c1, c2 = getattr(c, 'curve_id_1', ""), getattr(c, 'curve_id_2', "")
+        c1 = to_key(getattr(c, 'curve_id_1', ""))
+        c2 = to_key(getattr(c, 'curve_id_2', ""))
         if c1 in selected and c2:
             to_add.add(c2)
         if c2 in selected and c1:
@@ -96,13 +98,14 @@ def select_extend(context: Context):
 # Not sure if it's possible to force draw handlers...
 # Also note that a running modal operator might prevent redraws, avoid returning running_modal
 def ignore_hover(ref_or_id):
-    """Add a curve_id to the ignore list. Accepts CurveRef, curve_id int, or entity."""
+    """Add a curve to the ignore list. Accepts CurveRef, curve key, hex
+    curve_id, or entity."""
     from ..model.curve_ref import CurveRef
     ignore_list = selection.ignore_list
     if isinstance(ref_or_id, CurveRef):
-        ignore_list.append(ref_or_id.curve_id)
+        ignore_list.append(ref_or_id.key)
     elif isinstance(ref_or_id, (int, str)):
-        ignore_list.append(ref_or_id)
+        ignore_list.append(to_key(ref_or_id))
     else:
         # Legacy entity — use slvs_index
         ignore_list.append(ref_or_id.slvs_index)
@@ -221,7 +224,7 @@ def activate_sketch(context: Context, sketch_obj, operator: Operator):
         return {"FINISHED"}
 
     if last:
-        refresh_curve_geometry(last)
+        refresh_scheduler.request(last, solve=False)
 
     if sketch_obj is None and last:
         select_target_ob(context, last)
@@ -0,0 +1,188 @@
+"""Deferred, coalesced sketch solves and generated-mesh refreshes.
+
+One user action used to solve and refresh the same sketch several times: the
+tweak modal on every mouse move and again on release, the depsgraph handler
+reacting to the resulting data change, the frame-change handler... Callers
+now ``request`` a solve and/or refresh instead. Requests are merged per sketch
+and run together from a ``bpy.app.timers`` callback, which Blender runs from
+the event loop, so at most once per redraw.
+
+While a modal drag is active (``drag_begin``/``drag_end``) flushes are further
+limited to the ``drag_refresh_rate`` preference.
+
+Without an event loop (background mode: tests, headless renders) there is
+nothing to defer to and requests run immediately, unless they are made inside
+``batch()``, which holds them until the block ends.
+
+Operators that finish an undoable action ``flush`` their sketch before
+returning FINISHED, so the undo step records solved geometry.
+"""
+
+import time
+from contextlib import contextmanager
+
+import bpy
+
+DEFAULT_DRAG_RATE = 30
+
+# target_object name -> _Request
+_pending = {}
+
+_drag_depth = 0
+_batch_depth = 0
+_last_flush = 0.0
+
+
+class _Request:
+    __slots__ = ("solve", "changed_ids", "refresh")
+
+    def __init__(self):
+        self.solve = False
+        # Union of the changed curve ids of the merged solves, None for a full
+        # solve
+        self.changed_ids = set()
+        self.refresh = False
+
+    def merge(self, solve, changed_ids, refresh):
+        if solve:
+            if not self.solve:
+                self.changed_ids = set(changed_ids) if changed_ids else None
+            elif self.changed_ids is not None:
+                if changed_ids:
+                    self.changed_ids.update(changed_ids)
+                else:
+                    self.changed_ids = None
+            self.solve = True
+        self.refresh = self.refresh or refresh
+
+
+def _drag_interval():
+    from .utilities.preferences import get_prefs
+
+    try:
+        rate = get_prefs().drag_refresh_rate
+    except (AttributeError, KeyError):
+        rate = DEFAULT_DRAG_RATE
+    return 1.0 / rate if rate > 0 else 0.0
+
+
+def _deferred():
+    return _batch_depth > 0 or not bpy.app.background
+
+
+def request(sketch, solve=True, refresh=True, changed_ids=None):
+    """Ask for ``sketch`` to be solved (only the components holding
+    ``changed_ids`` if given) and/or its generated mesh to be refreshed.
+
+    Requests without a sketch (or its object) are ignored. The refresh only
+    happens when the solve, if any, succeeded.
+    """
+    if sketch is None or not sketch.target_object:
+        return
+    key = sketch.target_object.name
+    _pending.setdefault(key, _Request()).merge(solve, changed_ids, refresh)
+
+    if not _deferred():
+        flush()
+    elif _batch_depth == 0:
+        _schedule()
+
+
+def _schedule():
+    if bpy.app.timers.is_registered(_tick):
+        return
+    delay = 0.0
+    if _drag_depth:
+        delay = max(0.0, _last_flush + _drag_interval() - time.perf_counter())
+    bpy.app.timers.register(_tick, first_interval=delay)
+
+
+def _tick():
+    from . import global_data
+
+    # A stateful operator owns the data until it finishes (and requests again
+    # from its fini); try again shortly
+    if global_data.stateful_op_running:
+        return 0.05
+    flush()
+    return None
+
+
+def pending():
+    """Whether any request is waiting to be flushed."""
+    return bool(_pending)
+
+
+def flush(context=None, sketch=None):
+    """Run the pending requests now, only the one of ``sketch`` if given.
+
+    Returns ``{name: ok}`` for the sketches that were solved.
+    """
+    global _last_flush
+    if sketch is not None:
+        obj = sketch.target_object
+        if obj is None or obj.name not in _pending:
+            return {}
+        requests = [(obj.name, _pending.pop(obj.name))]
+    elif _pending:
+        requests = list(_pending.items())
+        _pending.clear()
+    else:
+        return {}
+    from .curve_solver import solve_system
+    from .model.sketch_ref import Sketch
+    from .utilities import curve_data
+
+    context = context or bpy.context
+    _last_flush = time.perf_counter()
+
+    results = {}
+    for name, req in requests:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        sketch = Sketch(obj)
+        ok = True
+        if req.solve:
+            ok = solve_system(context, sketch=sketch, changed_ids=req.changed_ids)
+            results[name] = ok
+        if req.refresh and ok:
+            curve_data.refresh_curve_geometry(sketch)
+    return results
+
+
+@contextmanager
+def batch():
+    """Hold the requests made in the block and flush them once at its end."""
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+    if _batch_depth == 0:
+        if bpy.app.background:
+            flush()
+        elif _pending:
+            _schedule()
+
+
+def drag_begin():
+    """Limit flushes to the drag refresh rate until ``drag_end``."""
+    global _drag_depth
+    _drag_depth += 1
+
+
+def drag_end():
+    global _drag_depth
+    _drag_depth = max(0, _drag_depth - 1)
+
+
+def clear():
+    """Drop pending requests and the timer (file load, unregister)."""
+    global _drag_depth, _batch_depth
+    _pending.clear()
+    _drag_depth = 0
+    _batch_depth = 0
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
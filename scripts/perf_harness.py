@@ -26,6 +26,7 @@ Two kinds of metric are reported:
 import cProfile
 import io
 import json
+import os
 import pstats
 import sys
 import time
@@ -59,6 +60,7 @@ picking = M.drawing.picking
 solve = M.curve_solver.solve_system
 
 import importlib  # noqa: E402
+import importlib.util  # noqa: E402
 
 validate = importlib.import_module(PKG + ".utilities.validate")
 
@@ -132,6 +134,95 @@ def _call_count(fn, iters, func_name):
     return total
 
 
+class _CountingRNA:
+    """Transparent proxy over an RNA struct/collection that counts per-element
+    access: integer subscripts (``coll[i]``) and items yielded by iteration.
+
+    Anything reached through the proxy -- attributes, method results -- is
+    proxied too, so a sketch wrapped around a proxied object counts every
+    per-item RNA access the code under test makes. Bulk ``foreach_get`` /
+    ``foreach_set`` calls pass straight through and are not counted.
+    """
+
+    __slots__ = ("_rna", "_counter")
+
+    def __init__(self, rna, counter):
+        object.__setattr__(self, "_rna", rna)
+        object.__setattr__(self, "_counter", counter)
+
+    def _wrap(self, value):
+        if isinstance(value, (bpy.types.bpy_struct, bpy.types.bpy_prop_collection)):
+            return _CountingRNA(value, self._counter)
+        if callable(value) and not isinstance(value, type):
+
+            def call(*args, **kwargs):
+                args = [_unwrap_rna(a) for a in args]
+                kwargs = {k: _unwrap_rna(v) for k, v in kwargs.items()}
+                return self._wrap(value(*args, **kwargs))
+
+            return call
+        return value
+
+    def __getattr__(self, name):
+        return self._wrap(getattr(self._rna, name))
+
+    def __setattr__(self, name, value):
+        setattr(self._rna, name, _unwrap_rna(value))
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            self._counter[0] += 1
+        return self._wrap(self._rna[key])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, int):
+            self._counter[0] += 1
+        self._rna[key] = _unwrap_rna(value)
+
+    def __contains__(self, key):
+        return key in self._rna
+
+    def __iter__(self):
+        for item in self._rna:
+            self._counter[0] += 1
+            yield self._wrap(item)
+
+    def __len__(self):
+        return len(self._rna)
+
+    def __bool__(self):
+        return bool(self._rna)
+
+    def __eq__(self, other):
+        return self._rna == _unwrap_rna(other)
+
+    def __hash__(self):
+        return hash(self._rna)
+
+
+def _unwrap_rna(value):
+    return value._rna if isinstance(value, _CountingRNA) else value
+
+
+def _rna_item_access(fn_of_sketch, sketch, iters):
+    """Per-element RNA accesses made by ``fn_of_sketch(proxy_sketch)`` over
+    ``iters`` calls (see ``_CountingRNA``). Deterministic, like _call_count."""
+    counter = [0]
+    proxy = sr.Sketch(_CountingRNA(sketch.target_object, counter))
+    for _ in range(iters):
+        fn_of_sketch(proxy)
+    return counter[0]
+
+
+def _load_script(name):
+    """Import a sibling script (scripts/ is not a package)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name + ".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def _safe(metrics, key, thunk):
     """Record ``metrics[key] = thunk()``, but skip the metric if the code path
     it probes doesn't exist yet.
@@ -140,11 +231,19 @@ def _safe(metrics, key, thunk):
     commit may predate the optimization a given metric guards (e.g. the picking
     cache), so probing it would raise -- we omit the metric there rather than
     crash, and ``perf_compare.py`` shows it as new on the head side.
+
+    A thunk measuring several metrics returns them as a dict, merged into
+    ``metrics``; ``key`` (e.g. ``"solve_<phase>_ms"``) then only names them.
     """
     try:
-        metrics[key] = thunk()
+        value = thunk()
     except Exception as exc:  # pragma: no cover - version-robustness only
         print(f"skip metric {key!r}: {exc}", file=sys.stderr)
+        return
+    if isinstance(value, dict):
+        metrics.update(value)
+    else:
+        metrics[key] = value
 
 
 def _table():
@@ -190,6 +289,29 @@ def _metrics():
 
     # -- wall-clock (informational trend; machine-dependent) --
     metrics["build_ms"] = round(_timeit(lambda: rd.build(sk, ts, True), 30), 4)
+
+    # What a selection/hover change costs the overlay: a repaint of the
+    # extracted data, not a build.
+    def _paint_ms():
+        data = rd.build(sk, ts, True)
+        return round(_timeit(lambda: rd.paint(data, ts, True), 30), 4)
+
+    _safe(metrics, "paint_ms", _paint_ms)
+
+    # JSON_SIZE small holes seen from afar: adaptive tessellation draws each at
+    # the coarsest level of detail instead of ARC_SEGMENTS segments.
+    def _far_hole_segments():
+        holes = _new_sketch()
+        cr.create_many(
+            holes,
+            points=[(i % 10, i // 10) for i in range(JSON_SIZE)],
+            circles=[(i, 0.1) for i in range(JSON_SIZE)],
+        )
+        lods = rd.arc_lods(holes, lambda w: (w[:, :2] * 20.0, [True] * len(w)))
+        return len(rd.build(holes, ts, True, lods).segments)
+
+    _safe(metrics, "far_hole_segments", _far_hole_segments)
+
     metrics["solve_ms"] = round(_timeit(lambda: solve(bpy.context, sketch=sk), 10), 4)
     metrics["refresh_ms"] = round(_timeit(lambda: cd.refresh_curve_geometry(sk), 10), 4)
 
@@ -202,13 +324,13 @@ def _metrics():
     _safe(
         metrics,
         "build_hex_calls",
-        lambda: _call_count(lambda: rd.build(sk, ts, True), 10, "_pairs_to_hex"),
+        lambda: _call_count(lambda: rd.build(sk, ts, True), 10, "to_hex"),
     )
     solve(bpy.context, sketch=sk)  # warm
     _safe(
         metrics,
         "solve_hex_calls",
-        lambda: _call_count(lambda: solve(bpy.context, sketch=sk), 5, "_pairs_to_hex"),
+        lambda: _call_count(lambda: solve(bpy.context, sketch=sk), 5, "to_hex"),
     )
 
     # 20 hovers on unchanged geometry must trigger ONE extraction (the first),
@@ -231,6 +353,80 @@ def _metrics():
         lambda: _call_count(lambda: solve(bpy.context, sketch=sk), 3, "get_curve_data"),
     )
 
+    # CurveSolver reads curve types/flags/positions with foreach_get and writes
+    # solved positions back with one foreach_set; only the slvs calls remain
+    # per-element. If a pass reverts to per-curve RNA access (data[i].value,
+    # curves[i].points[0], points[i].position) this jumps by ~N per solve.
+    solve(bpy.context, sketch=sk)  # warm
+    _safe(
+        metrics,
+        "solve_rna_item_access",
+        lambda: _rna_item_access(lambda p: solve(bpy.context, sketch=p), sk, 3),
+    )
+
+    # Per-phase breakdown of solve_ms (CurveSolver build, slvs solve, write-back,
+    # segment rebuild, legacy sync); the mean over the solves kept per sketch.
+    def _solve_phases():
+        timings = importlib.import_module(PKG + ".utilities.solve_timings")
+        timings.clear()
+        for _ in range(10):
+            solve(bpy.context, sketch=sk)
+        mean = timings.mean(sk)
+        return {f"solve_{name}_ms": round(mean[name], 4) for name in timings.PHASES}
+
+    _safe(metrics, "solve_<phase>_ms", _solve_phases)
+
+    # Recorded solver systems replayed straight into slvs: this sketch's own
+    # system and the offline corpus in scripts/solver_corpus. Isolates solver
+    # time from the add-on work around it (see scripts/solver_replay.py);
+    # replay_chain_build_ms is the time spent building the system for slvs.
+    def _replay_corpus():
+        replay = _load_script("solver_replay")
+        record = importlib.import_module(PKG + ".solver_record")
+        path = os.path.join(bpy.app.tempdir, "perf_chain.json")
+        record.save(record.capture(bpy.context, sk), path)
+        chain = replay.replay_file(path)
+        out = {
+            "replay_chain_ms": sum(r["ms"] for r in chain),
+            "replay_chain_build_ms": sum(r["build_ms"] for r in chain),
+        }
+        for path in replay.recordings([replay.CORPUS]):
+            name = os.path.splitext(os.path.basename(path))[0]
+            results = replay.replay_file(path)
+            out[f"replay_{name}_ms"] = sum(r["ms"] for r in results)
+        return out
+
+    _safe(metrics, "replay_<recording>_ms", _replay_corpus)
+
+    # A refresh after a solve that only moved points tags the curve data for
+    # re-evaluation instead of rebuilding its topology: 0 rebuilds here. If the
+    # topology signature check breaks, every refresh rebuilds (reads 10).
+    cd.refresh_curve_geometry(sk)  # warm
+    _safe(
+        metrics,
+        "refresh_topology_rebuilds",
+        lambda: _call_count(
+            lambda: (solve(bpy.context, sketch=sk), cd.refresh_curve_geometry(sk)),
+            10,
+            "_rebuild_curve_topology",
+        ),
+    )
+
+    # One user action requests a solve and refresh from several places (a drag
+    # step, its release, the depsgraph handler); the scheduler merges them per
+    # sketch. Five requests in one batch run one solve.
+    def _scheduled_solves():
+        sched = importlib.import_module(PKG + ".refresh_scheduler")
+
+        def requests():
+            with sched.batch():
+                for _ in range(5):
+                    sched.request(sk)
+
+        return _call_count(requests, 1, "solve_system")
+
+    _safe(metrics, "scheduler_solves_per_action", _scheduled_solves)
+
     # A 2D draw operator's per-mouse-move undo snapshot is scoped to the active
     # sketch and must NOT re-serialize the whole scene. Add a second sketch so a
     # regression to the full-scene snapshot is visible, then count scene_to_dict
@@ -248,6 +444,109 @@ def _metrics():
 
     _safe(metrics, "draw_snapshot_scene_calls", _draw_snapshot_scene_calls)
 
+    # Undo snapshot cost of a 2D draw operator (records everything) against a
+    # constraint operator's delta snapshot (appended constraints and point
+    # data only): time per snapshot and the memory it holds.
+    def _snapshot_costs():
+        import tracemalloc
+
+        snap = importlib.import_module(PKG + ".utilities.curve_snapshot")
+        op2d = importlib.import_module(PKG + ".operators.base_2d")
+        opc = importlib.import_module(PKG + ".operators.base_constraint")
+        sr.set_active_sketch(bpy.context, sk.target_object)
+        delta_cls = type("_Probe", (opc.GenericConstraintOp,), {"type": "DISTANCE"})
+        out = {}
+        for kind, cls in (("full", op2d.Operator2d), ("delta", delta_cls)):
+            probe = cls.__new__(cls)
+            out[f"snapshot_{kind}_ms"] = round(
+                _timeit(
+                    lambda: probe.release_snapshot(probe.create_snapshot(bpy.context)),
+                    10,
+                ),
+                4,
+            )
+            snap.pool.clear()
+            tracemalloc.start()
+            kept = probe.create_snapshot(bpy.context)
+            out[f"snapshot_{kind}_kb"] = round(
+                tracemalloc.get_traced_memory()[0] / 1024, 1
+            )
+            tracemalloc.stop()
+            probe.release_snapshot(kept)
+        return out
+
+    _safe(metrics, "snapshot_<kind>_ms", _snapshot_costs)
+
+    # Interactive operators snapshot and restore the sketch's curve data each
+    # preview step; buffers come from a pool, so warm cycles allocate none.
+    def _snapshot_allocations():
+        snap = importlib.import_module(PKG + ".utilities.curve_snapshot")
+        cd_ = sk.target_object.data
+        snap.CurveDataSnapshot(cd_).release()  # warm
+        before = snap.pool.allocations
+        for _ in range(10):
+            s = snap.CurveDataSnapshot(cd_)
+            s.restore(cd_)
+            s.release()
+        return snap.pool.allocations - before
+
+    _safe(metrics, "snapshot_allocations", _snapshot_allocations)
+
+    # The overlay's signature and rebuild read the sketch table's value
+    # columns once per frame between them. If a consumer goes back to its own
+    # reads, or the frame stops sharing, this reads 2+ per frame.
+    def _table_loads_per_frame():
+        table = importlib.import_module(PKG + ".utilities.sketch_table")
+
+        def frame():
+            with table.frame():
+                rd.overlay_signature(sk, True, ())
+                rd.build(sk, ts, True)
+
+        frame()  # warm
+        return _call_count(frame, 10, "load_values") / 10
+
+    _safe(metrics, "table_loads_per_frame", _table_loads_per_frame)
+
+    # Full segment rebuilds (as after every solve) on unchanged connectivity
+    # must reuse the weld ids and seeds: 0. Recomputing on every call reads 10.
+    cd.rebuild_segments(sk)  # warm
+    _safe(
+        metrics,
+        "merge_id_recomputes",
+        lambda: _call_count(
+            lambda: cd.rebuild_segments(sk), 10, "compute_generated_id_seeds"
+        ),
+    )
+
+    # Building a chain of JSON_SIZE segments one curve at a time (add_curves and
+    # per-item attribute writes each) against one create_many call.
+    def _create_costs():
+        import math
+
+        coords = [
+            (math.cos(i) * i * 0.1, math.sin(i) * i * 0.1)
+            for i in range(JSON_SIZE + 1)
+        ]
+        pairs = [(i, i + 1) for i in range(JSON_SIZE)]
+
+        def single():
+            sketch = _new_sketch()
+            with cd.batch_update(sketch):
+                pts = [cr.PointRef.create(sketch, co) for co in coords]
+                for a, b in pairs:
+                    cr.LineRef.create(sketch, pts[a], pts[b])
+
+        def bulk():
+            cr.create_many(_new_sketch(), points=coords, lines=pairs)
+
+        return {
+            "create_single_ms": round(_timeit(single, 3), 4),
+            "create_many_ms": round(_timeit(bulk, 3), 4),
+        }
+
+    _safe(metrics, "create_<kind>_ms", _create_costs)
+
     return {"size": JSON_SIZE, "metrics": metrics}
 
 
@@ -0,0 +1,108 @@
+"""Replay recorded solvespace systems outside Blender and time them.
+
+Recordings are written by the "Record Solver System" debug operator (or
+``solver_record.capture``/``save``); each holds the slvs call stream of every
+component of a sketch. Plain Python, needs only the slvs module:
+
+    python3 scripts/solver_replay.py recording.json [more.json | dir ...]
+      --repeat N  solve each system N times, report the fastest (default 5)
+      --json      emit machine-readable results instead of the table
+
+A directory argument replays every ``*.json`` in it, e.g. the benchmark corpus
+in ``scripts/solver_corpus``.
+
+"ms" is the time spent in ``slvs.solve_sketch`` alone; "build ms" is the time
+spent replaying the calls that set the system up.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS = os.path.join(ROOT, "scripts", "solver_corpus")
+
+# Load the worker by path: the add-on package itself needs Blender
+_spec = importlib.util.spec_from_file_location(
+    "solver_worker", os.path.join(ROOT, "solver_worker.py")
+)
+solver_worker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(solver_worker)
+
+
+def recordings(paths):
+    """Expand directories to the recordings they contain."""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".json"):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def replay_file(path, repeat=5):
+    """Solve every system of the recording at ``path`` ``repeat`` times.
+
+    Returns one result per system: the fastest time spent in the solve itself
+    (ms) and in building the system beforehand (build_ms), the result code,
+    dof and number of failed constraints.
+    """
+    doc = solver_worker.load_recording(path)
+    results = []
+    for system in doc["systems"]:
+        best = best_build = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            reply = solver_worker.replay(system["calls"], system["group"])
+            elapsed = (time.perf_counter() - start) * 1000.0
+            solve_ms, build_ms = reply["ms"], elapsed - reply["ms"]
+            best = solve_ms if best is None else min(best, solve_ms)
+            best_build = build_ms if best_build is None else min(best_build, build_ms)
+        results.append(
+            {
+                "ms": round(best, 4),
+                "build_ms": round(best_build, 4),
+                "result": reply["result"]["result"],
+                "dof": reply["result"].get("dof", 0),
+                "failed": len(reply["failed"]),
+                "calls": len(system["calls"]),
+            }
+        )
+    return results
+
+
+def main(argv):
+    repeat = 5
+    if "--repeat" in argv:
+        i = argv.index("--repeat")
+        repeat = int(argv[i + 1])
+        del argv[i : i + 2]
+    as_json = "--json" in argv
+    paths = [a for a in argv if not a.startswith("--")] or [CORPUS]
+
+    report = {}
+    for path in recordings(paths):
+        report[os.path.basename(path)] = replay_file(path, repeat)
+
+    if as_json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return 0
+    print(
+        f"{'recording':<32} {'sys':>4} {'calls':>6} {'ms':>9} {'build ms':>9} "
+        f"{'code':>5} {'dof':>4}"
+    )
+    for name, systems in report.items():
+        for i, r in enumerate(systems):
+            print(
+                f"{name:<32} {i:>4} {r['calls']:>6} {r['ms']:>9.3f} "
+                f"{r['build_ms']:>9.3f} {r['result']:>5} {r['dof']:>4}"
+                + (f"  {r['failed']} failed" if r["failed"] else "")
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,317 @@
+"""Solve many sketches at once in a pool of solvespace worker processes.
+
+Frame changes (and file load) re-solve every sketch in the scene, which with
+many driven sketches is far too slow to do one after the other on the main
+thread. With more than one solver process configured in the add-on
+preferences, each sketch component's system is built as plain data instead:
+``SlvsRecorder`` stands in for the ``slvs`` module while ``CurveSolver`` builds
+it, the recorded call streams are solved concurrently by ``solver_worker``
+processes, and the replies are written back on the main thread through the
+regular ``CurveSolver`` result path.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from .curve_solver import (
+    CurveSolver,
+    _plan_components,
+    _publish_components,
+    solve_system,
+)
+from .utilities import solve_timings
+
+logger = logging.getLogger(__name__)
+
+WORKER_PATH = os.path.join(os.path.dirname(__file__), "solver_worker.py")
+
+
+class _Param:
+    """A parameter of a recorded call's return value."""
+
+    __slots__ = ("call", "k")
+
+    def __init__(self, call, k):
+        self.call = call
+        self.k = k
+
+    def __eq__(self, other):
+        if not isinstance(other, _Param):
+            return NotImplemented
+        return (self.call, self.k) == (other.call, other.k)
+
+    def __hash__(self):
+        return hash((self.call, self.k))
+
+
+class _ParamList:
+    __slots__ = ("call",)
+
+    def __init__(self, call):
+        self.call = call
+
+    def __getitem__(self, k):
+        return _Param(self.call, k)
+
+
+class _Ref:
+    """Stand-in for the handle dict a recorded slvs call would have returned.
+
+    Supports the ``["param"][k]`` / ``.get("h")`` access the solver code uses;
+    the ref itself doubles as the handle.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __getitem__(self, key):
+        if key == "param":
+            return _ParamList(self.index)
+        if key == "h":
+            return self
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        if not isinstance(other, _Ref):
+            return NotImplemented
+        return self.index == other.index
+
+    def __hash__(self):
+        return hash(self.index)
+
+
+def _encode(value):
+    if isinstance(value, _Ref):
+        return {"$ref": value.index}
+    if isinstance(value, _Param):
+        return {"$param": [value.call, value.k]}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+class SlvsRecorder:
+    """Records slvs calls as plain data (see ``solver_worker`` for the format)."""
+
+    recording = True
+
+    def __init__(self):
+        self.calls = []
+
+    def clear_sketch(self):
+        self.calls.clear()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.calls.append(
+                [
+                    name,
+                    [_encode(a) for a in args],
+                    {k: _encode(v) for k, v in kwargs.items()},
+                ]
+            )
+            return _Ref(len(self.calls) - 1)
+
+        return record
+
+
+class _ReplayedSystem:
+    """A worker's reply, read back through the slvs interface by ``_run``."""
+
+    def __init__(self, reply):
+        self._result = reply["result"]
+        self._failed = [_Ref(i) for i in reply["failed"]]
+        self._params = {int(i): values for i, values in reply["params"].items()}
+
+    def solve_sketch(self, group, compute_failed=True):
+        return self._result, self._failed
+
+    def get_param_value(self, param):
+        return self._params[param.call][param.k]
+
+
+def _slvs_path():
+    """sys.path entry the workers need to import the bundled slvs module."""
+    import slvs
+
+    path = os.path.dirname(slvs.__file__)
+    if os.path.basename(slvs.__file__).startswith("__init__."):
+        path = os.path.dirname(path)
+    return path
+
+
+class _WorkerPool:
+    def __init__(self, size):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_slvs_path(), env.get("PYTHONPATH")) if p
+        )
+        self.size = size
+        self._procs = [
+            subprocess.Popen(
+                [sys.executable, "-u", WORKER_PATH],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
+            for _ in range(size)
+        ]
+
+    def alive(self):
+        return all(p.poll() is None for p in self._procs)
+
+    def run(self, jobs):
+        """Solve ``jobs`` across the workers; replies in job order."""
+        # Hand every worker its share before reading any reply, so they all
+        # solve at the same time. A worker reads its whole line before writing,
+        # so this can't deadlock on full pipes.
+        busy = []
+        for w, proc in enumerate(self._procs):
+            chunk = jobs[w :: self.size]
+            if chunk:
+                proc.stdin.write(json.dumps({"jobs": chunk}) + "\n")
+                proc.stdin.flush()
+                busy.append((w, proc))
+
+        replies = [None] * len(jobs)
+        for w, proc in busy:
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError("solver worker exited")
+            reply = json.loads(line)
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            replies[w :: self.size] = reply["results"]
+        return replies
+
+    def close(self):
+        for proc in self._procs:
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=1)
+            except Exception:
+                proc.kill()
+
+
+_pool = None
+
+
+def _get_pool(size):
+    global _pool
+    if _pool is not None and (_pool.size != size or not _pool.alive()):
+        shutdown()
+    if _pool is None:
+        _pool = _WorkerPool(size)
+    return _pool
+
+
+def shutdown():
+    """Stop the worker processes (restarted on demand)."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
+def _pool_size():
+    from .utilities.preferences import get_prefs
+
+    try:
+        return get_prefs().solver_processes
+    except (AttributeError, KeyError):
+        return 1
+
+
+def _has_curves(sketch):
+    return (
+        sketch
+        and sketch.target_object
+        and sketch.target_object.data
+        and len(sketch.target_object.data.curves) > 0
+    )
+
+
+def _solve_serial(context, sketches):
+    return [solve_system(context, sketch=sketch) for sketch in sketches]
+
+
+def solve_sketches(context, sketches):
+    """Solve every sketch in ``sketches``, returning one result per sketch.
+
+    Runs in the worker pool when more than one solver process is configured,
+    otherwise (or if the pool fails) one after the other like ``solve_system``.
+    """
+    sketches = list(sketches)
+    size = _pool_size()
+    if size < 2 or len(sketches) < 2:
+        return _solve_serial(context, sketches)
+
+    plans = []
+    jobs = []
+    for sketch in sketches:
+        if not _has_curves(sketch):
+            plans.append(None)
+            continue
+        timings = {}
+        with solve_timings.collect(timings):
+            results, pending = _plan_components(sketch, None)
+            solvers = []
+            for comp in pending:
+                solver = CurveSolver(
+                    context,
+                    sketch,
+                    component=comp,
+                    standalone=False,
+                    solvesys=SlvsRecorder(),
+                )
+                solver._build()
+                jobs.append(
+                    {"calls": solver.solvesys.calls, "group": solver.group_sketch}
+                )
+                solvers.append((comp, solver))
+        plans.append((results, solvers, timings))
+
+    start = time.perf_counter()
+    try:
+        replies = iter(_get_pool(size).run(jobs)) if jobs else iter(())
+    except Exception:
+        logger.exception("Solver pool failed, solving sketches serially")
+        shutdown()
+        return _solve_serial(context, sketches)
+    # The workers solve concurrently, attribute their wall time by job count.
+    per_job = (time.perf_counter() - start) / len(jobs) if jobs else 0.0
+
+    oks = []
+    for sketch, plan in zip(sketches, plans):
+        if plan is None:
+            oks.append(True)
+            continue
+        results, solvers, timings = plan
+        timings["solve_sketch"] = per_job * len(solvers)
+        with solve_timings.collect(timings):
+            solved_ids = set()
+            for comp, solver in solvers:
+                solver.solvesys = _ReplayedSystem(next(replies))
+                solver._run()
+                results[comp.key] = (solver.result_code, solver.dof)
+                if solver.ok:
+                    solved_ids |= comp.curve_ids
+            oks.append(_publish_components(context, sketch, results, solved_ids, None))
+        solve_timings.push(sketch, timings)
+    return oks
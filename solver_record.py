@@ -0,0 +1,65 @@
+"""Record the solvespace systems of a sketch to a file.
+
+A slow or failing solve is hard to reproduce without the user's .blend. This
+captures the exact slvs call stream ``CurveSolver`` builds for each of a
+sketch's components -- optionally with the dragged pin of a tweak -- as a
+versioned JSON document that ``scripts/solver_replay.py`` re-runs against
+slvs outside Blender. Recordings dropped into ``scripts/solver_corpus`` are
+benchmarked by the perf harness.
+"""
+
+import json
+
+from .curve_solver import CurveSolver, _plan_components
+from .solver_pool import SlvsRecorder
+from .solver_worker import RECORDING_FORMAT, RECORDING_VERSION
+from .utilities.sketch_table import to_key
+
+
+def capture(context, sketch, tweak=None):
+    """Record the systems a full solve of ``sketch`` would build.
+
+    ``tweak`` is an optional ``(curve_id or key, world position)`` to include the pin
+    of a drag, as built for every tweak step. Returns the recording document.
+    """
+    _results, pending = _plan_components(sketch, None)
+    # Building a system resets (and may set) the constraints' failed flags,
+    # the very diagnostics a recording is made to investigate: keep them
+    constraints = [c for comp in pending for c in comp.constraints]
+    failed = [c.failed for c in constraints]
+    systems = []
+    try:
+        for comp in pending:
+            solver = CurveSolver(
+                context,
+                sketch,
+                component=comp,
+                standalone=False,
+                solvesys=SlvsRecorder(),
+            )
+            if tweak and to_key(tweak[0]) in comp.curve_ids:
+                solver.tweak(*tweak)
+            solver._build()
+            systems.append(
+                {
+                    "calls": solver.solvesys.calls,
+                    "group": solver.group_sketch,
+                    "curves": len(comp.curve_ids),
+                    "constraints": len(comp.constraints),
+                }
+            )
+    finally:
+        for c, flag in zip(constraints, failed):
+            if c.failed != flag:
+                c.failed = flag
+    return {
+        "format": RECORDING_FORMAT,
+        "version": RECORDING_VERSION,
+        "sketch": sketch.name,
+        "systems": systems,
+    }
+
+
+def save(doc, path):
+    with open(path, "w") as f:
+        json.dump(doc, f, separators=(",", ":"))
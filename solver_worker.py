@@ -0,0 +1,120 @@
+"""Standalone solvespace worker.
+
+Replays a recorded stream of ``slvs`` calls (see ``solver_pool.SlvsRecorder``)
+and solves it. This module must stay importable without Blender and without
+the add-on package: ``solver_pool`` runs it as a plain script in worker
+processes (``python solver_worker.py``), exchanging one JSON message per line
+over stdin/stdout.
+
+Call stream format -- a list of ``[name, args, kwargs]``. An argument that
+refers to the value returned by an earlier call is ``{"$ref": i}`` (``i`` is
+that call's index); one that refers to a parameter of it is
+``{"$param": [i, k]}`` (``k`` indexes the returned ``param`` list).
+"""
+
+import json
+import sys
+import time
+
+# Recorded systems saved to disk (see solver_record), replayable outside
+# Blender with scripts/solver_replay.py. Bump RECORDING_VERSION whenever the
+# call stream format changes.
+RECORDING_FORMAT = "cad_sketcher.slvs_calls"
+RECORDING_VERSION = 1
+
+
+def _resolve(value, returns):
+    if isinstance(value, dict):
+        if "$ref" in value:
+            return returns[value["$ref"]]
+        if "$param" in value:
+            i, k = value["$param"]
+            return returns[i]["param"][k]
+    if isinstance(value, list):
+        return [_resolve(v, returns) for v in value]
+    return value
+
+
+def replay(calls, group):
+    """Replay ``calls`` into a fresh slvs system and solve ``group``.
+
+    Returns a plain-data result: the solver's result dict, the indices of the
+    calls that produced a failed constraint, the solved value of every
+    parameter by call index (``{i: [values]}``) and the time spent in
+    ``solve_sketch`` (``ms``), excluding building the system.
+    """
+    import slvs
+
+    slvs.clear_sketch()
+    returns = []
+    for name, args, kwargs in calls:
+        args = [_resolve(a, returns) for a in args]
+        kwargs = {k: _resolve(v, returns) for k, v in kwargs.items()}
+        returns.append(getattr(slvs, name)(*args, **kwargs))
+
+    start = time.perf_counter()
+    result = slvs.solve_sketch(group, True)
+    solve_ms = (time.perf_counter() - start) * 1000.0
+    failed = []
+    if isinstance(result, dict):
+        retval = result
+    else:
+        retval, *rest = result
+        if rest and isinstance(rest[0], (list, tuple)):
+            failed = rest[0]
+
+    # Entities (add_*) and constraints are numbered independently, and
+    # solvespace only reports constraint handles as failed.
+    constraint_calls = {
+        ret["h"]: i
+        for i, ((name, _args, _kwargs), ret) in enumerate(zip(calls, returns))
+        if not name.startswith("add_") and isinstance(ret, dict) and "h" in ret
+    }
+    params = {
+        i: [slvs.get_param_value(p) if p else 0.0 for p in ret["param"]]
+        for i, ret in enumerate(returns)
+        if isinstance(ret, dict) and "param" in ret
+    }
+    return {
+        "result": retval,
+        "failed": [constraint_calls[h] for h in failed if h in constraint_calls],
+        "params": params,
+        "ms": solve_ms,
+    }
+
+
+def load_recording(path):
+    """Read a recording written by ``solver_record.save``.
+
+    Raises ValueError for files that aren't recordings or were written by an
+    unsupported format version.
+    """
+    with open(path) as f:
+        doc = json.load(f)
+    if not isinstance(doc, dict) or doc.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"{path}: not a solver recording")
+    if doc.get("version") != RECORDING_VERSION:
+        raise ValueError(
+            f"{path}: recording version {doc.get('version')} is not supported "
+            f"(expected {RECORDING_VERSION})"
+        )
+    return doc
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout):
+    """Worker loop: each input line is ``{"jobs": [{"calls", "group"}, ...]}``,
+    answered by one line ``{"results": [...]}`` (or ``{"error": msg}``)."""
+    for line in stdin:
+        if not line.strip():
+            continue
+        try:
+            jobs = json.loads(line)["jobs"]
+            reply = {"results": [replay(j["calls"], j["group"]) for j in jobs]}
+        except Exception as e:
+            reply = {"error": repr(e)}
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    serve()
@@ -68,6 +68,15 @@ class StatefulOperatorLogic(_StateMachineMixin):
         """Restore state from a snapshot produced by ``create_snapshot``."""
         pass
 
+    def release_snapshot(self, snapshot: Any) -> None:
+        """Called when a snapshot is dropped, to free resources it holds."""
+        pass
+
+    def _drop_snapshot(self):
+        if self._state_snapshot is not None:
+            self.release_snapshot(self._state_snapshot)
+        self._state_snapshot = None
+
     def on_before_redo_states(self, context: Context):
         """Called before ``redo_states`` during undo/redo cycles.
 
@@ -598,7 +607,7 @@ class StatefulOperatorLogic(_StateMachineMixin):
                 bpy.ops.ed.undo_push(message="Cancelled: " + self.bl_label)
                 bpy.ops.ed.undo()
 
-        self._state_snapshot = None
+        self._drop_snapshot()
         return {"FINISHED"} if succeede else {"CANCELLED"}
 
     # -------------------------------------------------------------------------
@@ -619,7 +628,7 @@ class StatefulOperatorLogic(_StateMachineMixin):
             self.set_state_pointer(None, index=i)
         self._state_data.clear()
         self._numeric = NumericInput()
-        self._state_snapshot = None
+        self._drop_snapshot()
 
     def _take_last_state_pointer(self):
         """Return (last_index, implicit_values, type_metadata) for the last pointer state."""
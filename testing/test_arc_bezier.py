@@ -0,0 +1,80 @@
+"""Tests for the batched arc/circle bezier rebuild (curve_data.arc_bezier_geometry).
+
+rebuild_segments rebuilds every arc and circle of a solve in one vectorized
+pass, while creating a single curve goes through the per-curve
+``_build_arc_bezier`` front end. Both must produce the same geometry: control
+points on the circle and handles on its tangent at the standard
+``4/3 * tan(step / 4) * r`` distance.
+"""
+
+import math
+
+import numpy as np
+
+from ..utilities.curve_data import arc_bezier_geometry, rebuild_segments
+from .utils import Sketch2dTestCase
+
+
+def _read(cd, name, prop):
+    coll = cd.points if name == "position" else cd.attributes[name].data
+    out = np.empty(len(cd.points) * 3, dtype=np.float32)
+    coll.foreach_get(prop, out)
+    return out.reshape(-1, 3)
+
+
+class TestArcBezier(Sketch2dTestCase):
+    def _geometry(self):
+        cd = self.sketch.target_object.data
+        return (
+            _read(cd, "position", "position"),
+            _read(cd, "handle_left", "vector"),
+            _read(cd, "handle_right", "vector"),
+        )
+
+    def test_batched_rebuild_matches_per_curve(self):
+        for i, sweep in enumerate((30, 135, 250, 359)):
+            a = math.radians(sweep)
+            x = 6.0 * i
+            ct = self.add_point((x, 0))
+            start = self.add_point((x + 2, 0))
+            end = self.add_point((x + 2 * math.cos(a), 2 * math.sin(a)))
+            self.add_arc(ct, start, end)
+        self.add_circle(self.add_point((0, 10)), 1.5)
+        self.add_circle(self.add_point((5, 10)), 0.5)
+        expected = self._geometry()
+
+        cd = self.sketch.target_object.data
+        zeros = np.zeros(len(cd.points) * 3, dtype=np.float32)
+        cd.attributes["handle_left"].data.foreach_set("vector", zeros)
+        cd.attributes["handle_right"].data.foreach_set("vector", zeros)
+        rebuild_segments(self.sketch)
+
+        for got, want in zip(self._geometry(), expected):
+            np.testing.assert_allclose(got, want, atol=1e-5)
+
+    def test_handles_are_tangent(self):
+        first, counts = (0,), (3,)
+        idx, pos, left, right = arc_bezier_geometry(
+            first, counts, ((1.0, 1.0),), ((3.0, 1.0),), ((1.0, 3.0),), (False,)
+        )
+        self.assertEqual(idx.tolist(), [0, 1, 2])
+        radial = pos - (1.0, 1.0)
+        np.testing.assert_allclose(np.hypot(*radial.T), 2.0)
+        step = math.radians(45)
+        length = (4 / 3) * math.tan(step / 4) * 2.0
+        for handle in (left, right):
+            offset = handle - pos
+            np.testing.assert_allclose(np.hypot(*offset.T), length)
+            np.testing.assert_allclose((offset * radial).sum(axis=1), 0, atol=1e-12)
+
+    def test_degenerate_curves_are_skipped(self):
+        idx, pos, _left, _right = arc_bezier_geometry(
+            (0, 4, 8),
+            (2, 1, 4),
+            ((0, 0), (0, 0), (0, 0)),
+            ((0, 0), (1, 0), (1, 0)),
+            ((1, 1), (0, 1), (1, 0)),
+            (False, False, False),
+        )
+        self.assertEqual(len(idx), 0)
+        self.assertEqual(pos.shape, (0, 2))
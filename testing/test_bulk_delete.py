@@ -0,0 +1,49 @@
+"""Tests for bulk curve removal (curve_data.remove_native_curves_by_id)."""
+
+from ..model.curve_ref import curve_ref
+from ..utilities.curve_data import get_curve_index, remove_native_curves_by_id
+from .utils import Sketch2dTestCase
+
+
+class TestBulkDelete(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        self.a = self.add_point((0, 0))
+        self.b = self.add_point((2, 0))
+        self.c = self.add_point((2, 2))
+        self.ab = self.add_line(self.a, self.b)
+        self.bc = self.add_line(self.b, self.c)
+        self.curves = self.sketch.target_object.data.curves
+
+    def _exists(self, ref):
+        return get_curve_index(self.sketch, ref.curve_id) is not None
+
+    def test_removes_targets_and_keeps_survivor_names(self):
+        names = {r.curve_id: r.name for r in (self.a, self.b, self.c)}
+        removed = remove_native_curves_by_id(
+            self.sketch, [self.ab.curve_id, self.bc.curve_id]
+        )
+        self.assertEqual(set(removed), {self.ab.key, self.bc.key})
+        self.assertEqual(len(self.curves), 3)
+        for cid, name in names.items():
+            self.assertEqual(curve_ref(self.sketch, cid).name, name)
+
+    def test_dependents(self):
+        removed = remove_native_curves_by_id(
+            self.sketch, [self.a.curve_id], dependents=True
+        )
+        self.assertEqual(set(removed), {self.a.key, self.ab.key})
+        self.assertTrue(self._exists(self.bc))
+        self.assertTrue(self._exists(self.b))
+
+    def test_orphans(self):
+        endpoints = {self.a.curve_id, self.b.curve_id}
+        remove_native_curves_by_id(self.sketch, [self.ab.curve_id], orphans=endpoints)
+        # b is still used by bc
+        self.assertFalse(self._exists(self.a))
+        self.assertTrue(self._exists(self.b))
+        self.assertEqual(len(self.curves), 3)
+
+    def test_unknown_ids(self):
+        self.assertEqual(remove_native_curves_by_id(self.sketch, ["", "ff" * 16]), [])
+        self.assertEqual(len(self.curves), 5)
@@ -22,7 +22,7 @@ class TestConstraintOperators(Sketch2dTestCase):
     def _select(self, *refs):
         selection.selected.clear()
         for r in refs:
-            selection.selected.append(r.curve_id)
+            selection.selected.append(r.key)
 
     # -- two selected lines -> parallel constraint ---------------------------
     def test_parallel_from_two_selected_lines(self):
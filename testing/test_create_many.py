@@ -0,0 +1,69 @@
+"""Tests for bulk curve creation (model.curve_ref.create_many)."""
+
+import numpy as np
+
+from ..model.curve_ref import create_many
+from ..utilities.curve_data import compute_merge_ids, get_curve_index
+from .utils import Sketch2dTestCase
+
+
+class TestCreateMany(Sketch2dTestCase):
+    def test_matches_single_creation(self):
+        created = create_many(
+            self.sketch,
+            points=[(0, 0), (2, 0), (1, 1), (3, 3)],
+            lines=[(0, 1)],
+            arcs=[(2, 0, 1)],
+            circles=[(3, 0.5)],
+        )
+        self.assertEqual(
+            [
+                len(created.points),
+                len(created.lines),
+                len(created.arcs),
+                len(created.circles),
+            ],
+            [4, 1, 1, 1],
+        )
+        p0, p1, p2, p3 = created.points
+        line, arc, circle = created.lines[0], created.arcs[0], created.circles[0]
+
+        self.assertEqual(line.p1, p0)
+        self.assertEqual(line.p2, p1)
+        self.assertAlmostEqual(line.length, 2.0, places=5)
+        self.assertEqual(arc.ct, p2)
+        self.assertAlmostEqual(arc.radius, (p0.co - p2.co).length, places=5)
+        self.assertEqual(circle.ct, p3)
+        self.assertAlmostEqual(circle.radius, 0.5, places=5)
+        self.assertTrue(circle.is_closed())
+
+        # Same layout and attributes as the one-at-a-time path
+        reference = self.add_arc(p2, p0, p1)
+        curves = self.sketch.target_object.data.curves
+        arc_idx = get_curve_index(self.sketch, arc.curve_id)
+        ref_idx = get_curve_index(self.sketch, reference.curve_id)
+        self.assertEqual(curves[arc_idx].points_length, curves[ref_idx].points_length)
+        self.assertEqual(p0.name, "Point 1")
+        self.assertEqual(p3.name, "Point 4")
+        self.assertEqual(arc.name, "Arc 1")
+        self.assertEqual(reference.name, "Arc 2")
+
+    def test_connects_existing_points(self):
+        a = self.add_point((0, 0), fixed=True)
+        created = create_many(
+            self.sketch, points=[(4, 0)], lines=[(a, 0)], construction=True
+        )
+        line = created.lines[0]
+        self.assertEqual(line.p1, a)
+        self.assertEqual(line.p2, created.points[0])
+        self.assertTrue(line.construction)
+        self.assertTrue(compute_merge_ids(self.sketch))
+
+    def test_accepts_arrays(self):
+        n = 50
+        coords = np.column_stack((np.arange(n + 1), np.zeros(n + 1)))
+        pairs = np.column_stack((np.arange(n), np.arange(1, n + 1)))
+        created = create_many(self.sketch, points=coords, lines=pairs)
+        self.assertEqual(len(self.sketch.target_object.data.curves), 2 * n + 1)
+        self.assertEqual(len({ln.curve_id for ln in created.lines}), n)
+        self.assertAlmostEqual(created.lines[-1].p2.co.x, n, places=5)
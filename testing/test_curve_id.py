@@ -35,6 +35,10 @@ class TestCurveIdCodec(BgsTestCase):
         # per-curve read and bulk read must both match, and agree with each other
         self.assertEqual([cd.get_uuid(cv, "curve_id", i) for i in range(len(cases))], cases)
         self.assertEqual(cd.read_uuid_list(cv, "curve_id"), cases)
+        # and so must the int keys used internally
+        self.assertEqual(
+            cd.read_uuid_keys(cv, "curve_id"), [int(u, 16) for u in cases]
+        )
 
     def test_empty_id_is_unset(self):
         cv = self._fresh(1)
@@ -53,8 +57,8 @@ class TestCurveIdSurvival(Sketch2dTestCase):
     """Identity survives the geometry-rebuild paths."""
 
     def test_ids_survive_geometry_refresh(self):
-        # refresh_curve_geometry rebuilds topology (remove+add curves). The id
-        # attributes must be preserved, or endpoints resolve to (0, 0).
+        # A full refresh_curve_geometry rebuilds topology (remove+add curves).
+        # The id attributes must be preserved, or endpoints resolve to (0, 0).
         p1 = self.add_point((3.0, 4.0))
         p2 = self.add_point((5.0, 6.0))
         line = self.add_line(p1, p2)
@@ -62,7 +66,7 @@ class TestCurveIdSurvival(Sketch2dTestCase):
         obj = self.sketch.target_object
         before = cd.read_uuid_list(obj.data, "curve_id")
 
-        cd.refresh_curve_geometry(self.sketch)
+        cd.refresh_curve_geometry(self.sketch, full=True)
 
         after = cd.read_uuid_list(obj.data, "curve_id")
         self.assertEqual(before, after)
@@ -0,0 +1,127 @@
+"""Tests for the pooled curve data snapshots (utilities.curve_snapshot)."""
+
+import numpy as np
+
+from ..utilities.curve_data import get_curve_index
+from ..utilities.curve_snapshot import BufferPool, CurveDataSnapshot
+from .utils import Sketch2dTestCase
+
+
+class TestCurveDataSnapshot(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        self.p1 = self.add_point((0, 0), fixed=True)
+        self.p2 = self.add_point((2, 1))
+        self.add_line(self.p1, self.p2)
+        self.curve_data = self.sketch.target_object.data
+
+    def test_restore_in_place(self):
+        snapshot = CurveDataSnapshot(self.curve_data)
+        self.p2.co = (7.0, 3.0)
+        snapshot.restore(self.curve_data)
+        self.assertAlmostEqual(self.p2.co.x, 2.0, places=5)
+        self.assertAlmostEqual(self.p2.co.y, 1.0, places=5)
+
+    def test_restore_rebuilds_changed_topology(self):
+        n_curves = len(self.curve_data.curves)
+        snapshot = CurveDataSnapshot(self.curve_data)
+        self.add_point((5, 5))
+        snapshot.restore(self.curve_data)
+        self.assertEqual(len(self.curve_data.curves), n_curves)
+        self.assertAlmostEqual(self.p2.co.x, 2.0, places=5)
+
+    def test_partial_snapshot(self):
+        snapshot = CurveDataSnapshot(self.curve_data, attributes={"handle_left"})
+        self.assertIn("handle_left", snapshot.attributes)
+        # Curve attributes outside the scope are skipped
+        self.assertNotIn("name", snapshot.attributes)
+        self.assertNotIn("sketch_type", snapshot.attributes)
+        self.p2.co = (7.0, 3.0)
+        self.assertTrue(snapshot.restore(self.curve_data))
+        self.assertAlmostEqual(self.p2.co.x, 2.0, places=5)
+
+        # Can't bring back curves it didn't record
+        self.add_point((5, 5))
+        self.assertFalse(snapshot.restore(self.curve_data))
+
+    def test_release_reuses_buffers(self):
+        pool = BufferPool()
+        snapshot = CurveDataSnapshot(self.curve_data, pool=pool)
+        self.assertGreater(snapshot.nbytes, 0)
+        allocations = pool.allocations
+
+        snapshot.release()
+        self.assertEqual(snapshot.nbytes, 0)
+        for _ in range(3):
+            CurveDataSnapshot(self.curve_data, pool=pool).release()
+        self.assertEqual(pool.allocations, allocations)
+
+    def test_pool_is_keyed_by_dtype_and_size(self):
+        pool = BufferPool()
+        buffer = pool.take(np.float32, 6)
+        pool.give(buffer)
+        self.assertIsNot(pool.take(np.int32, 6), buffer)
+        self.assertIsNot(pool.take(np.float32, 9), buffer)
+        self.assertIs(pool.take(np.float32, 6), buffer)
+
+    def _resize_arc(self):
+        """Give a new arc two more points, like a solve re-segmenting it."""
+        arc = self.add_arc(
+            self.add_point((5, 0)), self.add_point((6, 0)), self.add_point((5, 1))
+        )
+        counts = np.empty(len(self.curve_data.curves), dtype=np.int32)
+        self.curve_data.curves.foreach_get("points_length", counts)
+        snapshot = CurveDataSnapshot(
+            self.curve_data, attributes={"handle_left", "handle_right"}
+        )
+        sizes = counts.tolist()
+        sizes[get_curve_index(self.sketch, arc.curve_id)] += 2
+        self.curve_data.resize_curves(sizes)
+        return snapshot, counts
+
+    def test_partial_snapshot_restores_point_counts(self):
+        names = [d.value for d in self.curve_data.attributes["name"].data]
+        snapshot, counts = self._resize_arc()
+        self.assertTrue(snapshot.restore(self.curve_data))
+
+        restored = np.empty_like(counts)
+        self.curve_data.curves.foreach_get("points_length", restored)
+        np.testing.assert_array_equal(restored, counts)
+        self.assertEqual(
+            [d.value for d in self.curve_data.attributes["name"].data], names
+        )
+
+    def test_constraints_follow_restore(self):
+        from ..operators.base_2d import Operator2d
+        from ..operators.base_stateful import GenericEntityOp
+
+        class _Op:
+            _restore_curve_data = staticmethod(GenericEntityOp._restore_curve_data)
+            _truncate_constraints = staticmethod(GenericEntityOp._truncate_constraints)
+
+        def restore(snapshot):
+            Operator2d.restore_snapshot(
+                _Op(),
+                self.context,
+                {
+                    "active_name": self.sketch.target_object.name,
+                    "constraint_values": {},
+                    "curve_data": snapshot,
+                    "constraint_counts": {"horizontal": 0},
+                },
+            )
+            return len(self.curve_data.sketch_constraints.horizontal)
+
+        line = self.add_line(self.add_point((0, 2)), self.add_point((1, 3)))
+
+        # Re-segmented arcs are restored, so the added constraint goes
+        snapshot, _counts = self._resize_arc()
+        self.sketch.constraints.add_horizontal(curve_id_1=line.curve_id)
+        self.assertEqual(restore(snapshot), 0)
+
+        # Added curves can't be undone by a partial snapshot: the constraint
+        # stays with the geometry solved for it
+        snapshot = CurveDataSnapshot(self.curve_data, attributes=set())
+        self.sketch.constraints.add_horizontal(curve_id_1=line.curve_id)
+        self.add_point((9, 9))
+        self.assertEqual(restore(snapshot), 1)
@@ -9,6 +9,7 @@ the active sketch exactly and never touches other sketches.
 
 from ..model.curve_ref import LineRef, PointRef
 from ..model.sketch_ref import set_active_sketch
+from ..operators.add_distance import View3D_OT_slvs_add_distance
 from ..operators.add_rectangle import View3D_OT_slvs_add_rectangle
 from .utils import Sketch2dTestCase, make_operator_double
 
@@ -69,3 +70,35 @@ class TestDrawSnapshot(Sketch2dTestCase):
         op.restore_snapshot(self.context, snap)
         self.assertEqual(len(other.target_object.data.curves), grown)
         self.assertGreater(grown, other_count)
+
+
+class TestDeltaSnapshot(Sketch2dTestCase):
+    """Constraint operators only append a constraint, so their snapshot records
+    collection lengths and point data instead of every constraint."""
+
+    def _op(self):
+        op = make_operator_double(View3D_OT_slvs_add_distance)()
+        op._state_data = {}
+        return op
+
+    def test_restore_removes_appended_constraint(self):
+        set_active_sketch(self.context, self.sketch.target_object)
+        sc = self.sketch.constraints
+        p0 = self.add_point((0, 0), fixed=True)
+        p1 = self.add_point((2, 0))
+        line = self.add_line(p0, p1)
+        sc.add_horizontal(curve_id_1=line.curve_id)
+
+        op = self._op()
+        snap = op.create_snapshot(self.context)
+        self.assertNotIn("constraints", snap)
+        self.assertEqual(snap["constraint_counts"], {"distance": 0})
+        self.assertTrue(snap["curve_data"].partial)
+
+        sc.add_distance(init=True, curve_id_1=line.curve_id)
+        p1.co = (3.0, 0.0)
+        op.restore_snapshot(self.context, snap)
+
+        self.assertEqual(len(sc.distance), 0)
+        self.assertEqual(len(sc.horizontal), 1)
+        self.assertAlmostEqual(p1.co.x, 2.0, places=5)
@@ -58,8 +58,8 @@ class TestEqual(Sketch2dTestCase):
         circle = self.add_circle(pc, 1.0)
 
         selection.selected.clear()
-        selection.selected.append(circle.curve_id)
-        selection.selected.append(line.curve_id)
+        selection.selected.append(circle.key)
+        selection.selected.append(line.key)
 
         h = OpHarness(VIEW3D_OT_slvs_add_equal, self.sketch, self.context)
         h.prefill()
@@ -119,3 +119,47 @@ class TestMergeIds(Sketch2dTestCase):
         added_b = self.add_point((5, 0))
         self.add_line(added_a, added_b)
         self.assertEqual(kept_seeds(), baseline)
+
+    def test_seeds_fold_uuid_words(self):
+        """Vectorized seeds match the scalar FNV-1a fold of the id words."""
+        from ..utilities.curve_data import (
+            SOURCE_CURVE_ID_ATTR,
+            _u32,
+            get_curve_index,
+        )
+
+        a = self.add_point((0, 0))
+        b = self.add_point((1, 0))
+        line = self.add_line(a, b)
+        cd = self.sketch.target_object.data
+        index = get_curve_index(self.sketch, line.curve_id)
+        words = [
+            cd.attributes[".curve_id_lo"].data[index].value[0],
+            cd.attributes[".curve_id_lo"].data[index].value[1],
+            cd.attributes[".curve_id_hi"].data[index].value[0],
+            cd.attributes[".curve_id_hi"].data[index].value[1],
+        ]
+        expected = 0x811C9DC5
+        for word in words:
+            expected = ((expected ^ _u32(word)) * 0x01000193) & 0xFFFFFFFF
+        seed = cd.attributes[SOURCE_CURVE_ID_ATTR].data[index].value
+        self.assertEqual(_u32(seed), expected or 1)
+
+    def test_skipped_until_connectivity_changes(self):
+        from ..utilities import curve_data
+
+        a = self.add_point((0, 0))
+        b = self.add_point((1, 0))
+        self.add_line(a, b)
+        cd = self.sketch.target_object.data
+        self.assertTrue(curve_data.compute_merge_ids(self.sketch))
+
+        # Clobber the ids: an unchanged structure leaves them alone ...
+        mid = cd.attributes["merge_id"]
+        mid.data[0].value = -7
+        self.assertTrue(curve_data.compute_merge_ids(self.sketch))
+        self.assertEqual(mid.data[0].value, -7)
+
+        # ... a new segment recomputes them.
+        self.add_line(b, self.add_point((2, 0)))
+        self.assertNotIn(-7, [d.value for d in cd.attributes["merge_id"].data])
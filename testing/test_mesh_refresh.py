@@ -31,9 +31,9 @@ class TestMeshRefresh(Sketch2dTestCase):
         orig_solve = curve_solver.solve_system
         orig_refresh = cd_mod.refresh_curve_geometry
 
-        def counting_solve(context, sketch=None):
+        def counting_solve(context, sketch=None, **kwargs):
             solves[0] += 1
-            return orig_solve(context, sketch=sketch)
+            return orig_solve(context, sketch=sketch, **kwargs)
 
         def counting_refresh(sketch):
             refreshes[0] += 1
@@ -56,3 +56,47 @@ class TestMeshRefresh(Sketch2dTestCase):
         self.assertGreaterEqual(refreshes[0], 1)
         # ...and it did not runaway-recurse (refresh mutates curve data).
         self.assertLess(solves[0], 20)
+
+
+class TestInPlaceRefresh(Sketch2dTestCase):
+    """Refreshing after a solve only rebuilds topology when it changed."""
+
+    def _count_rebuilds(self, fn):
+        calls = [0]
+        orig = cd_mod._rebuild_curve_topology
+
+        def counting(sketch):
+            calls[0] += 1
+            return orig(sketch)
+
+        cd_mod._rebuild_curve_topology = counting
+        try:
+            fn()
+        finally:
+            cd_mod._rebuild_curve_topology = orig
+        return calls[0]
+
+    def test_value_change_skips_rebuild(self):
+        a = self.add_point((0, 0), fixed=True)
+        b = self.add_point((5, 0))
+        self.add_line(a, b)
+        cd_mod.refresh_curve_geometry(self.sketch)
+
+        def move_and_refresh():
+            b.co = (6.0, 1.0)
+            self.solve()
+            cd_mod.refresh_curve_geometry(self.sketch)
+
+        self.assertEqual(self._count_rebuilds(move_and_refresh), 0)
+        self.assertAlmostEqual(b.co.x, 6.0, places=4)
+
+    def test_topology_change_rebuilds(self):
+        a = self.add_point((0, 0))
+        b = self.add_point((5, 0))
+        cd_mod.refresh_curve_geometry(self.sketch)
+
+        def add_and_refresh():
+            self.add_line(a, b)
+            cd_mod.refresh_curve_geometry(self.sketch)
+
+        self.assertEqual(self._count_rebuilds(add_and_refresh), 1)
@@ -2,8 +2,9 @@
 
 Picking replaces the GPU id-buffer: it projects the active sketch's geometry and
 finds what's under the cursor / inside a box. The projection itself is
-viewport-bound, so it's stubbed here with a simple orthographic mapping to
-exercise the pick logic (point-over-edge priority, box overlap, ignore-list).
+viewport-bound, so it's stubbed here with a simple orthographic mapping (and its
+inverse onto the sketch plane) to exercise the pick logic (point-over-edge
+priority, box overlap, ignore-list).
 """
 
 import numpy as np
@@ -32,6 +33,14 @@ def _ortho_projection(world, region, rv3d):
     )
 
 
+def _ortho_unprojection(screen, region, rv3d, matrix):
+    """Inverse of ``_ortho_projection`` onto a sketch plane parallel to XY."""
+    screen = np.asarray(screen, dtype=float).reshape(-1, 2)
+    world = np.column_stack([screen / 10, np.zeros(len(screen)), np.ones(len(screen))])
+    local = world @ np.linalg.inv(matrix).T
+    return local[:, :2], np.ones(len(screen), bool)
+
+
 class TestPicking(Sketch2dTestCase):
     def setUp(self):
         super().setUp()
@@ -42,13 +51,14 @@ class TestPicking(Sketch2dTestCase):
         self.solve()
         refresh_curve_geometry(self.sketch)
         self.ctx = _FakeContext(self.scene)
-        self._orig = picking._project_points_to_region
+        self._orig = picking._project_points_to_region, picking._region_to_plane
         picking._project_points_to_region = _ortho_projection
+        picking._region_to_plane = _ortho_unprojection
 
     def tearDown(self):
-        picking._project_points_to_region = self._orig
+        picking._project_points_to_region, picking._region_to_plane = self._orig
         selection.ignore_list = []
-        selection.hover = ""
+        selection.hover = 0
         selection.hover_candidates = []
         selection.hover_locked = False
         super().tearDown()
@@ -57,19 +67,19 @@ class TestPicking(Sketch2dTestCase):
         # At point b's location (40, 0) the point and the line's endpoint overlap:
         # both are candidates, point first (grabbable vertex over edge).
         ranked = picking.pick_ranked(self.ctx, (40, 0))
-        self.assertEqual(ranked[0], self.b.curve_id)
-        self.assertIn(self.line.curve_id, ranked)
+        self.assertEqual(ranked[0], self.b.key)
+        self.assertIn(self.line.key, ranked)
         self.assertGreaterEqual(len(ranked), 2)
 
     def test_update_hover_keeps_cycled_choice(self):
         # Hover the stack (nearest = point b), cycle to the line, then re-hover the
         # same spot: the cycled choice must survive rather than snap back to nearest.
-        selection.hover = ""
+        selection.hover = 0
         picking.update_hover(self.ctx, (40, 0))
-        self.assertEqual(selection.hover_candidates[0], self.b.curve_id)
+        self.assertEqual(selection.hover_candidates[0], self.b.key)
         self.assertTrue(selection.cycle_hover(1))
-        self.assertEqual(selection.hover, self.line.curve_id)
-        self.assertEqual(picking.update_hover(self.ctx, (40, 0)), self.line.curve_id)
+        self.assertEqual(selection.hover, self.line.key)
+        self.assertEqual(picking.update_hover(self.ctx, (40, 0)), self.line.key)
 
     def test_cycle_hover_wraps_and_noops(self):
         selection.hover_candidates = ["a", "b", "c"]
@@ -103,31 +113,31 @@ class TestPicking(Sketch2dTestCase):
 
     def test_moving_off_element_clears_lock(self):
         # A wheel lock must not persist once the cursor leaves the stack.
-        selection.hover = self.b.curve_id
+        selection.hover = self.b.key
         selection.hover_locked = True
         picking.update_hover(self.ctx, (1000, 1000))  # over nothing
         self.assertFalse(selection.hover_locked)
 
     def test_point_takes_priority_over_edge(self):
         # Cursor over point b's screen location (40, 0).
-        self.assertEqual(picking.pick(self.ctx, (40, 0)), self.b.curve_id)
+        self.assertEqual(picking.pick(self.ctx, (40, 0)), self.b.key)
 
     def test_edge_picked_away_from_vertices(self):
         # Mid-line (20, 0): no point within radius -> the line is picked.
-        self.assertEqual(picking.pick(self.ctx, (20, 0)), self.line.curve_id)
+        self.assertEqual(picking.pick(self.ctx, (20, 0)), self.line.key)
 
     def test_empty_returns_nothing(self):
-        self.assertEqual(picking.pick(self.ctx, (1000, 1000)), "")
+        self.assertEqual(picking.pick(self.ctx, (1000, 1000)), 0)
 
     def test_box_selects_overlapping(self):
         ids = set(picking.pick_box(self.ctx, (-10, -10), (60, 60)))
-        self.assertIn(self.a.curve_id, ids)
-        self.assertIn(self.b.curve_id, ids)
-        self.assertIn(self.line.curve_id, ids)
+        self.assertIn(self.a.key, ids)
+        self.assertIn(self.b.key, ids)
+        self.assertIn(self.line.key, ids)
 
     def test_ignore_list_respected(self):
-        selection.ignore_list = [self.b.curve_id]
-        self.assertNotEqual(picking.pick(self.ctx, (40, 0)), self.b.curve_id)
+        selection.ignore_list = [self.b.key]
+        self.assertNotEqual(picking.pick(self.ctx, (40, 0)), self.b.key)
 
     def test_cache_reuses_on_hover_and_refreshes_on_geometry_change(self):
         # First pick populates the cache; a second pick (mouse just moved, no
@@ -146,6 +156,66 @@ class TestPicking(Sketch2dTestCase):
         c = self.add_point((4, 4))
         line2 = self.add_line(self.b, c)
         self.solve()
-        self.assertEqual(picking.pick(self.ctx, (40, 40)), c.curve_id)
+        self.assertEqual(picking.pick(self.ctx, (40, 40)), c.key)
         self.assertIsNot(picking._pick_cache[self.sketch.target_object.name][1], cached)
         self.assertTrue(line2.valid)
+
+    def _add_far_cluster(self):
+        far = [self.add_point((100 + i, 100)) for i in range(20)]
+        refresh_curve_geometry(self.sketch)
+        return far
+
+    def test_far_elements_are_not_projected(self):
+        # A distant cluster: the grid index keeps picking at the origin from
+        # projecting its elements at all.
+        far = self._add_far_cluster()
+        projected = []
+
+        def counting(world, region, rv3d):
+            projected.append(len(world))
+            return _ortho_projection(world, region, rv3d)
+
+        picking._project_points_to_region = counting
+        self.assertEqual(picking.pick(self.ctx, (0, 0)), self.a.key)
+        self.assertLess(sum(projected), len(far))
+        self.assertEqual(
+            set(picking.pick_box(self.ctx, (-10, -10), (60, 60))),
+            {self.a.key, self.b.key, self.line.key},
+        )
+
+    def test_far_tiles_are_not_projected(self):
+        # With the cursor rays missing the sketch plane (an edge-on view),
+        # picking falls back to the tiles: only the far tile's corners are
+        # projected, not its elements.
+        picking._region_to_plane = lambda screen, *args: (
+            np.zeros((len(screen), 2)),
+            np.zeros(len(screen), bool),
+        )
+        far = self._add_far_cluster()
+        projected = []
+
+        def counting(world, region, rv3d):
+            projected.append(len(world))
+            return _ortho_projection(world, region, rv3d)
+
+        picking._project_points_to_region = counting
+        self.assertEqual(picking.pick(self.ctx, (0, 0)), self.a.key)
+        # Points projected for the pick itself (beyond the 8-corner tile boxes)
+        data = picking._pick_cache[self.sketch.target_object.name][1]
+        n_tiles = len(data.tile_bounds)
+        self.assertLess(sum(projected) - 8 * n_tiles, len(far))
+
+    def test_boxes_outside_view(self):
+        from ..utilities.view import _boxes_outside_view
+
+        class _View:
+            perspective_matrix = np.identity(4)
+
+        boxes = np.array([
+            [(-0.5, -0.5, 0), (0.5, 0.5, 0)],  # inside
+            [(5, 5, 0), (6, 6, 0)],  # off to the side
+            [(-5, -5, 0), (5, 5, 0)],  # around the whole view
+        ])
+        self.assertEqual(
+            _boxes_outside_view(boxes, _View()).tolist(), [False, True, False]
+        )
@@ -25,7 +25,7 @@ class TestSelectionPrefill(Sketch2dTestCase):
 
     def _select_only(self, ref):
         selection.selected.clear()
-        selection.selected.append(ref.curve_id)
+        selection.selected.append(ref.key)
 
     def _a_point(self):
         return self.add_point((3.0, 4.0))
@@ -146,8 +146,8 @@ class TestSelectionPrefill(Sketch2dTestCase):
         p_start = self.add_point((0.0, 0.0))
         p_end = self.add_point((4.0, 0.0))
         selection.selected.clear()
-        selection.selected.append(p_start.curve_id)
-        selection.selected.append(p_end.curve_id)
+        selection.selected.append(p_start.key)
+        selection.selected.append(p_end.key)
 
         h = self._harness(View3D_OT_slvs_add_line2d)
         h.prefill()
@@ -0,0 +1,49 @@
+"""Tests for the array-based line rebuild of curve_data.rebuild_segments."""
+
+import numpy as np
+
+from ..utilities.curve_data import get_curve_index, rebuild_segments
+from .utils import Sketch2dTestCase
+
+
+class TestLineRebuild(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        self.a = self.add_point((0, 0))
+        self.b = self.add_point((3, 0))
+        self.c = self.add_point((3, 4))
+        self.ab = self.add_line(self.a, self.b)
+        self.bc = self.add_line(self.b, self.c)
+        self.curve_data = self.sketch.target_object.data
+
+    def _line_points(self, line, name="position"):
+        cd = self.curve_data
+        coll = cd.points if name == "position" else cd.attributes[name].data
+        prop = "position" if name == "position" else "vector"
+        data = np.empty(len(cd.points) * 3, dtype=np.float32)
+        coll.foreach_get(prop, data)
+        first = cd.curves[get_curve_index(self.sketch, line.curve_id)].points[0].index
+        return data.reshape(-1, 3)[first : first + 2, :2]
+
+    def _move_raw(self, point, co):
+        # Bypass PointRef.co, which rebuilds on its own
+        idx = get_curve_index(self.sketch, point.curve_id)
+        index = self.curve_data.curves[idx].points[0].index
+        self.curve_data.points[index].position = (co[0], co[1], 0.0)
+
+    def test_lines_follow_points(self):
+        self._move_raw(self.b, (5, 1))
+        rebuild_segments(self.sketch)
+        for name in ("position", "handle_left", "handle_right"):
+            ab = self._line_points(self.ab, name)
+            bc = self._line_points(self.bc, name)
+            np.testing.assert_allclose(ab, [(0, 0), (5, 1)])
+            np.testing.assert_allclose(bc, [(5, 1), (3, 4)])
+
+    def test_scoped_rebuild_only_touches_referencing_lines(self):
+        self._move_raw(self.a, (-1, 0))
+        self._move_raw(self.c, (3, 7))
+        rebuild_segments(self.sketch, point_ids={self.a.curve_id})
+        np.testing.assert_allclose(self._line_points(self.ab), [(-1, 0), (3, 0)])
+        # bc doesn't reference a, so it still ends at c's old position
+        np.testing.assert_allclose(self._line_points(self.bc), [(3, 0), (3, 4)])
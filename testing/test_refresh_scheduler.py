@@ -0,0 +1,82 @@
+"""Tests for the coalescing solve/refresh scheduler (refresh_scheduler)."""
+
+from .. import curve_solver, refresh_scheduler
+from ..utilities import curve_data as cd_mod
+from .utils import Sketch2dTestCase
+
+
+class TestRefreshScheduler(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        refresh_scheduler.clear()
+        self.a = self.add_point((0, 0), fixed=True)
+        self.b = self.add_point((5, 0))
+        self.add_line(self.a, self.b)
+
+        self.solves = []
+        self.refreshes = [0]
+        orig_solve = curve_solver.solve_system
+        orig_refresh = cd_mod.refresh_curve_geometry
+
+        def counting_solve(context, sketch=None, changed_ids=None):
+            self.solves.append(changed_ids)
+            return orig_solve(context, sketch=sketch, changed_ids=changed_ids)
+
+        def counting_refresh(sketch):
+            self.refreshes[0] += 1
+            return orig_refresh(sketch)
+
+        curve_solver.solve_system = counting_solve
+        cd_mod.refresh_curve_geometry = counting_refresh
+        self.addCleanup(setattr, curve_solver, "solve_system", orig_solve)
+        self.addCleanup(setattr, cd_mod, "refresh_curve_geometry", orig_refresh)
+
+    def test_requests_are_merged_per_sketch(self):
+        a, b = self.a.curve_id, self.b.curve_id
+        with refresh_scheduler.batch():
+            refresh_scheduler.request(self.sketch, changed_ids={a})
+            refresh_scheduler.request(self.sketch, refresh=False, changed_ids={b})
+            refresh_scheduler.request(self.sketch, solve=False)
+            self.assertTrue(refresh_scheduler.pending())
+            self.assertEqual(self.solves, [])
+
+        self.assertFalse(refresh_scheduler.pending())
+        self.assertEqual(self.solves, [{a, b}])
+        self.assertEqual(self.refreshes[0], 1)
+
+    def test_full_solve_wins(self):
+        with refresh_scheduler.batch():
+            refresh_scheduler.request(self.sketch, changed_ids={self.b.curve_id})
+            refresh_scheduler.request(self.sketch)
+        self.assertEqual(self.solves, [None])
+
+    def test_refresh_only(self):
+        with refresh_scheduler.batch():
+            refresh_scheduler.request(self.sketch, solve=False)
+            refresh_scheduler.request(self.sketch, solve=False)
+        self.assertEqual(self.solves, [])
+        self.assertEqual(self.refreshes[0], 1)
+
+    def test_background_requests_run_immediately(self):
+        # No event loop to defer to outside of a batch
+        refresh_scheduler.request(self.sketch)
+        self.assertFalse(refresh_scheduler.pending())
+        self.assertEqual(len(self.solves), 1)
+
+    def test_flush_one_sketch(self):
+        # Operators settle their own sketch before returning FINISHED
+        with refresh_scheduler.batch():
+            refresh_scheduler.request(self.sketch)
+            self.assertEqual(
+                refresh_scheduler.flush(sketch=self.sketch),
+                {self.sketch.target_object.name: True},
+            )
+            self.assertFalse(refresh_scheduler.pending())
+            self.assertEqual(refresh_scheduler.flush(sketch=self.sketch), {})
+        self.assertEqual(len(self.solves), 1)
+
+    def test_request_without_sketch_is_ignored(self):
+        with refresh_scheduler.batch():
+            refresh_scheduler.request(None)
+            self.assertFalse(refresh_scheduler.pending())
+        self.assertEqual(self.solves, [])
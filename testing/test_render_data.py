@@ -6,9 +6,12 @@ extracted into the right buckets and that the change-signature both stays stable
 and detects the changes that must invalidate cached batches.
 """
 
+import numpy as np
+
 from ..drawing import render_data, selection
 from ..utilities.curve_data import read_uuid_list, refresh_curve_geometry
 from ..utilities.preferences import get_prefs
+from ..utilities.sketch_table import to_key
 from .utils import Sketch2dTestCase
 
 
@@ -24,18 +27,43 @@ class TestRenderData(Sketch2dTestCase):
         self.solve()
         refresh_curve_geometry(self.sketch)
 
-    def test_extraction_buckets(self):
+    def test_extraction_arrays(self):
         self._build_point_line_circle()
         data = render_data.build(self.sketch, self._ts(), is_active=True)
 
-        n_points = sum(len(v) for v in data.point_buckets.values())
-        n_line_verts = sum(len(v) for v in data.line_buckets.values())
+        self.assertEqual(data.points.shape, (3, 3))  # the three point curves
+        self.assertEqual(len(data.point_curve), 3)
+        # line + tessellated circle
+        n_segments = 1 + render_data.ARC_SEGMENTS
+        self.assertEqual(data.segments.shape, (n_segments, 2, 3))
+        self.assertEqual(len(data.segment_color), n_segments)
+        self.assertEqual(len({data.curve_ids[i] for i in data.segment_curve}), 2)
+        self.assertFalse(data.segment_construction.any())
 
-        self.assertEqual(n_points, 3)  # the three point curves
-        self.assertEqual(len(data.point_ids), 3)
-        self.assertGreater(n_line_verts, 2)  # line + tessellated circle
-        self.assertEqual(n_line_verts % 2, 0)  # LINES come in pairs
-        self.assertEqual(len(data.segment_ids), n_line_verts // 2)
+    def test_colors_follow_state(self):
+        self._build_point_line_circle()
+        ts = self._ts()
+        cd = self.sketch.target_object.data
+        selected = to_key(read_uuid_list(cd, "curve_id")[1])
+        selection.clear()
+        selection.selected.append(selected)
+        try:
+            data = render_data.build(self.sketch, ts, is_active=True)
+        finally:
+            selection.clear()
+
+        for k, curve in enumerate(data.point_curve):
+            color = data.colors[data.point_color[k]]
+            if data.curve_ids[curve] == selected:
+                expected = ts.selected
+                self.assertAlmostEqual(
+                    data.point_size[k], render_data.POINT_SIZE_SELECTED, places=5
+                )
+            elif curve == 0:
+                expected = ts.fixed
+            else:
+                expected = ts.default
+            np.testing.assert_allclose(color, tuple(expected), atol=1e-6)
 
     def test_signature_stable_and_invalidates(self):
         self._build_point_line_circle()
@@ -53,7 +81,7 @@ class TestRenderData(Sketch2dTestCase):
         # Selecting a curve must change the signature. Selection is transient
         # runtime state (the selection module), not a persisted attribute.
         self.assertEqual(base, render_data.overlay_signature(self.sketch, True, ()))
-        cid = read_uuid_list(cd, "curve_id")[0]
+        cid = to_key(read_uuid_list(cd, "curve_id")[0])
         selection.clear()
         selection.selected.append(cid)
         try:
@@ -101,7 +129,7 @@ class TestRenderData(Sketch2dTestCase):
         selection.clear()
         try:
             inactive = render_data.overlay_signature(self.sketch, False, ())
-            selection.hover = "abc123"
+            selection.hover = 0xABC123
             self.assertEqual(
                 inactive,
                 render_data.overlay_signature(self.sketch, False, ()),
@@ -109,9 +137,71 @@ class TestRenderData(Sketch2dTestCase):
             )
             # The active sketch, by contrast, must react to hover.
             active = render_data.overlay_signature(self.sketch, True, ())
-            selection.hover = "def456"
+            selection.hover = 0xDEF456
             self.assertNotEqual(
                 active, render_data.overlay_signature(self.sketch, True, ())
             )
         finally:
             selection.clear()
+
+    def test_paint_updates_appearance_only(self):
+        """A selection change repaints the extracted data in place: colours and
+        point sizes follow, positions are untouched."""
+        self._build_point_line_circle()
+        ts = self._ts()
+        selection.clear()
+        data = render_data.build(self.sketch, ts, is_active=True)
+        points, segments = data.points, data.segments
+        before = render_data.appearance_signature(True, ())
+
+        selection.selected.extend(data.curve_ids)
+        try:
+            self.assertNotEqual(before, render_data.appearance_signature(True, ()))
+            render_data.paint(data, ts, is_active=True)
+        finally:
+            selection.clear()
+
+        self.assertIs(data.points, points)
+        self.assertIs(data.segments, segments)
+        # All selected: only the two selected colours (fixed or not) remain
+        self.assertTrue((data.point_color >= 4).all())
+        self.assertTrue((data.segment_color >= 4).all())
+        np.testing.assert_allclose(data.point_size, render_data.POINT_SIZE_SELECTED)
+
+    def test_arc_lods_follow_screen_radius(self):
+        """Arcs get more segments the larger they project, in quantized levels."""
+        self._build_point_line_circle()
+        ts = self._ts()
+
+        def zoom(pixels_per_unit):
+            def project(world):
+                return world[:, :2] * pixels_per_unit, np.ones(len(world), bool)
+
+            return render_data.arc_lods(self.sketch, project)
+
+        far, near = zoom(2.0), zoom(2000.0)
+        self.assertEqual(far.max(), 0)
+        self.assertGreater(near.max(), far.max())
+
+        for lods in (far, near):
+            data = render_data.build(self.sketch, ts, is_active=True, lods=lods)
+            # the line + the circle at its level
+            expected = 1 + render_data.ARC_LOD_SEGMENTS[lods.max()]
+            self.assertEqual(len(data.segments), expected)
+
+    def test_tiles_bound_their_elements(self):
+        self._build_point_line_circle()
+        data = render_data.build(self.sketch, self._ts(), is_active=True)
+        tiles = data.tile_bounds
+        eps = 1e-5
+
+        lo, hi = tiles[data.point_tile, 0], tiles[data.point_tile, 1]
+        self.assertTrue(((data.points >= lo - eps) & (data.points <= hi + eps)).all())
+        lo, hi = tiles[data.segment_tile, 0], tiles[data.segment_tile, 1]
+        self.assertTrue((data.segments.min(axis=1) >= lo - eps).all())
+        self.assertTrue((data.segments.max(axis=1) <= hi + eps).all())
+
+        # The table-only sketch bounds cover the extraction
+        bounds = render_data.sketch_bounds(self.sketch)
+        self.assertTrue((bounds[0] <= data.bounds[0] + eps).all())
+        self.assertTrue((bounds[1] >= data.bounds[1] - eps).all())
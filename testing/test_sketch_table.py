@@ -0,0 +1,76 @@
+"""Tests for the columnar sketch table (utilities.sketch_table)."""
+
+import numpy as np
+
+from ..model.constants import SketchCurveType
+from ..utilities import sketch_table
+from ..utilities.curve_data import get_curve_index, read_uuid_list
+from .utils import Sketch2dTestCase
+
+
+class TestSketchTable(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        self.p1 = self.add_point((0, 0), fixed=True)
+        self.p2 = self.add_point((2, 1), construction=True)
+        self.line = self.add_line(self.p1, self.p2)
+        self.curve_data = self.sketch.target_object.data
+
+    def test_columns_match_curve_data(self):
+        table = sketch_table.get_table(self.curve_data)
+        ids = read_uuid_list(self.curve_data, "curve_id")
+        i1, i2, il = (ids.index(r.curve_id) for r in (self.p1, self.p2, self.line))
+
+        self.assertEqual(table.n_curves, len(self.curve_data.curves))
+        self.assertEqual(table.types[i1], SketchCurveType.POINT)
+        self.assertEqual(table.types[il], SketchCurveType.LINE)
+        self.assertEqual(table.counts[il], 2)
+        self.assertTrue(table.flags["fixed"][i1])
+        self.assertTrue(table.flags["construction"][i2])
+        self.assertTrue(table.flags["visible"].all())
+        np.testing.assert_allclose(table.positions[table.first[i2], :2], (2, 1))
+        self.assertEqual(table.ids(self.curve_data), ids)
+        self.assertTrue(table.words(self.curve_data, "curve_id")[i1].any())
+
+    def test_structure_is_cached_until_invalidated(self):
+        table = sketch_table.get_table(self.curve_data, values=False)
+        self.assertIs(sketch_table.get_table(self.curve_data, values=False), table)
+
+        self.add_point((5, 5))
+        table2 = sketch_table.get_table(self.curve_data)
+        self.assertIsNot(table2, table)
+        self.assertEqual(table2.n_curves, table.n_curves + 1)
+        self.assertGreater(table2.version, table.version)
+
+    def test_values_are_read_fresh_outside_a_frame(self):
+        table = sketch_table.get_table(self.curve_data)
+        version = table.version
+        self.p2.co = (7.0, 3.0)
+        table = sketch_table.get_table(self.curve_data)
+        self.assertGreater(table.version, version)
+        self.assertIn(7.0, table.positions[:, 0])
+
+    def test_frame_shares_one_read(self):
+        with sketch_table.frame():
+            version = sketch_table.get_table(self.curve_data).version
+            self.assertEqual(sketch_table.get_table(self.curve_data).version, version)
+
+            sketch_table.values_changed(self.curve_data)
+            self.assertGreater(sketch_table.get_table(self.curve_data).version, version)
+
+    def test_keys(self):
+        table = sketch_table.get_table(self.curve_data, values=False)
+        ids = read_uuid_list(self.curve_data, "curve_id")
+        keys = table.key_list(self.curve_data, "curve_id")
+        self.assertEqual([sketch_table.to_hex(k) for k in keys], ids)
+        self.assertEqual(sketch_table.to_key(ids[0]), keys[0])
+
+        mask = sketch_table.keys_in(
+            table.keys(self.curve_data, "curve_id"), [self.p2.curve_id]
+        )
+        self.assertEqual(np.flatnonzero(mask).tolist(), [ids.index(self.p2.curve_id)])
+
+        # Lookups take either form
+        index = get_curve_index(self.sketch, self.line.curve_id)
+        key = sketch_table.to_key(self.line.curve_id)
+        self.assertEqual(get_curve_index(self.sketch, key), index)
@@ -0,0 +1,75 @@
+"""Tests for baked solves in a sidecar file (utilities.solve_bake).
+
+Frames solved while baking are written to disk and restored instead of solved
+later, but only while the sketch's constraints and the frame's inputs still
+match what was baked.
+"""
+
+import os
+import tempfile
+from unittest import mock
+
+from mathutils import Vector
+
+from .. import handlers
+from ..utilities import solve_bake, solve_cache
+from .utils import Sketch2dTestCase
+
+
+class TestSolveBake(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        solve_cache.clear()
+        origin = self.add_point((0, 0), fixed=True)
+        self.end = self.add_point((1.0, 0.2))
+        self.line = self.add_line(origin, self.end)
+        sc = self.sketch.constraints
+        sc.add_horizontal(curve_id_1=self.line.curve_id)
+        self.distance = sc.add_distance(
+            init=True, value=1.0, curve_id_1=self.line.curve_id
+        )
+
+        tmp = tempfile.mkdtemp()
+        self.path = os.path.join(tmp, "test.blend" + solve_bake.SUFFIX)
+        patcher = mock.patch.object(solve_bake, "bake_path", return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(os.remove, self.path)
+
+    def _frame(self, frame, value):
+        scene = self.context.scene
+        scene.frame_current = frame
+        self.distance.value = value
+        handlers._solve_scene_sketches(self.context, scene)
+
+    def _bake(self):
+        solve_bake.begin()
+        self._frame(1, 2.0)
+        solved = Vector(self.end.co)
+        self._frame(2, 3.0)
+        solve_bake.end(self.context.scene, self.path)
+        return solved
+
+    def _restore_frame_1(self):
+        scene = self.context.scene
+        scene.frame_current = 1
+        self.distance.value = 2.0
+        return solve_bake.lookup(self.context, scene, self.sketch)
+
+    def test_baked_frame_is_restored(self):
+        solved = self._bake()
+        self.end.co = (0.5, 0.5)
+        self.assertTrue(self._restore_frame_1())
+        self.assertLess((Vector(self.end.co) - solved).length, 1e-6)
+
+    def test_changed_inputs_are_solved(self):
+        self._bake()
+        scene = self.context.scene
+        scene.frame_current = 1
+        self.distance.value = 2.5
+        self.assertIsNone(solve_bake.lookup(self.context, scene, self.sketch))
+
+    def test_changed_constraints_are_solved(self):
+        self._bake()
+        self.sketch.constraints.add_vertical(curve_id_1=self.line.curve_id)
+        self.assertIsNone(self._restore_frame_1())
@@ -0,0 +1,90 @@
+"""Tests for the animation solve cache (utilities.solve_cache).
+
+Frame changes look each sketch up by its dimension values and fixed positions
+before solving it. A hit has to restore exactly the geometry the solve
+produced, and nothing may be served once an edit solve could have changed
+what those inputs solve to.
+"""
+
+from unittest import mock
+
+from mathutils import Vector
+
+from ..curve_solver import solve_system
+from ..utilities import solve_cache
+from ..utilities.curve_data import get_curve_index
+from .utils import Sketch2dTestCase
+
+
+class TestSolveCache(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        solve_cache.clear()
+        origin = self.add_point((0, 0), fixed=True)
+        self.end = self.add_point((1.0, 0.2))
+        line = self.add_line(origin, self.end)
+        sc = self.sketch.constraints
+        sc.add_horizontal(curve_id_1=line.curve_id)
+        self.distance = sc.add_distance(init=True, value=1.0, curve_id_1=line.curve_id)
+
+    def _frame(self, value):
+        """Set the dimension the way a driver would and run a frame's solve;
+        returns whether it was a cache hit."""
+        self.distance.value = value
+        scene = self.context.scene
+        ok, key = solve_cache.lookup(self.context, scene, self.sketch)
+        if ok is not None:
+            return True
+        solve_cache.store(
+            self.sketch, key, solve_system(self.context, sketch=self.sketch)
+        )
+        return False
+
+    def test_hit_restores_solved_geometry(self):
+        self.assertFalse(self._frame(2.0))
+        solved = Vector(self.end.co)
+        self.assertFalse(self._frame(3.0))
+        self.assertTrue(self._frame(2.0))
+        self.assertLess((Vector(self.end.co) - solved).length, 1e-6)
+        self.assertEqual(self.sketch.solver_state, "OKAY")
+        self.assertEqual(solve_cache.stats()["hits"], 1)
+
+    def test_hit_resizes_resegmented_arcs(self):
+        ct = self.add_point((5, 5), fixed=True)
+        start = self.add_point((6, 5), fixed=True)
+        arc = self.add_arc(ct, start, self.add_point((5, 6), fixed=True))
+        self.assertFalse(self._frame(2.0))
+        cd = self.sketch.target_object.data
+        counts = [c.points_length for c in cd.curves]
+        solved = Vector(self.end.co)
+
+        # Resegmented since, as by a wider sweep on another frame
+        sizes = list(counts)
+        sizes[get_curve_index(self.sketch, arc.curve_id)] += 2
+        cd.resize_curves(sizes)
+        self.assertTrue(self._frame(2.0))
+        self.assertEqual([c.points_length for c in cd.curves], counts)
+        self.assertLess((Vector(self.end.co) - solved).length, 1e-6)
+
+    def test_changed_value_misses(self):
+        self.assertFalse(self._frame(2.0))
+        self.assertFalse(self._frame(2.5))
+        self.assertEqual(solve_cache.stats()["misses"], 2)
+
+    def test_edit_solve_invalidates(self):
+        self.assertFalse(self._frame(2.0))
+        solve_system(self.context, sketch=self.sketch)
+        self.assertFalse(self._frame(2.0))
+
+    def test_memory_cap_evicts_oldest(self):
+        with mock.patch.object(solve_cache, "_cap_bytes", return_value=1):
+            self._frame(2.0)
+            self.assertEqual(solve_cache.stats()["entries"], 0)
+
+        self._frame(2.0)
+        self._frame(3.0)
+        entry = solve_cache.stats()["nbytes"] // 2
+        with mock.patch.object(solve_cache, "_cap_bytes", return_value=entry * 2):
+            self._frame(4.0)
+        self.assertEqual(solve_cache.stats()["entries"], 2)
+        self.assertFalse(self._frame(2.0))
@@ -0,0 +1,61 @@
+"""Tests for the per-solve curve table constraints translate against.
+
+Constraint translation resolves curve types, point ids, positions and radii
+from ``CurveSolver.table`` -- it must not go back to the curve data per
+constraint, and must still produce the same solve.
+"""
+
+from unittest import mock
+
+from ..curve_solver import CurveSolver
+from ..model.constants import SketchCurveType
+from ..utilities import curve_data
+from .utils import Sketch2dTestCase
+
+
+class TestSolveTable(Sketch2dTestCase):
+    def _sketch(self):
+        sc = self.sketch.constraints
+        p1 = self.add_point((0, 0), fixed=True)
+        p2 = self.add_point((2.0, 0.3))
+        line = self.add_line(p1, p2)
+        circle = self.add_circle(self.add_point((1.0, 2.0)), 0.5)
+        sc.add_horizontal(curve_id_1=line.curve_id)
+        sc.add_distance(init=True, value=2.0, curve_id_1=line.curve_id)
+        sc.add_tangent(curve_id_1=circle.curve_id, curve_id_2=line.curve_id)
+        sc.add_distance(
+            init=True, value=1.0, curve_id_1=p1.curve_id, curve_id_2=p2.curve_id
+        )
+        return line, circle
+
+    def test_table_lookups(self):
+        line, circle = self._sketch()
+        solver = CurveSolver(self.context, self.sketch)
+        solver._build()
+        table = solver.table
+
+        self.assertEqual(table.type(line.curve_id), SketchCurveType.LINE)
+        self.assertTrue(table.is_circle(circle.curve_id))
+        self.assertIsNone(table.type("0" * 32))
+        self.assertAlmostEqual(table.radius(circle.curve_id), 0.5, places=5)
+        start = table.position(table.start_point(line.curve_id))
+        self.assertAlmostEqual(float(start[0]), 0.0)
+        self.assertIn(table.start_point(line.curve_id), table.point_handles)
+
+    def test_constraints_do_not_read_curve_data(self):
+        self._sketch()
+        solver = CurveSolver(self.context, self.sketch)
+        solver._init_workplane()
+        solver._init_geometry()
+        with mock.patch.object(
+            curve_data, "get_curve_data", wraps=curve_data.get_curve_data
+        ) as lookups:
+            solver._init_constraints()
+        self.assertEqual(lookups.call_count, 0)
+        self.assertFalse(any(c.failed for c in self.sketch.constraints.all))
+
+    def test_tangent_solves(self):
+        line, circle = self._sketch()
+        self.assertTrue(CurveSolver(self.context, self.sketch).solve())
+        # The line lies on the x axis, so the center is a radius away from it
+        self.assertAlmostEqual(abs(circle.ct.co.y), circle.radius, places=4)
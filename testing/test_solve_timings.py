@@ -0,0 +1,34 @@
+"""Tests for the per-phase solve timings (utilities.solve_timings)."""
+
+from ..curve_solver import solve_system
+from ..utilities import solve_timings
+from .utils import Sketch2dTestCase
+
+
+class TestSolveTimings(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        solve_timings.clear()
+        p1 = self.add_point((0, 0), fixed=True)
+        p2 = self.add_point((1.0, 0.2))
+        line = self.add_line(p1, p2)
+        self.sketch.constraints.add_horizontal(curve_id_1=line.curve_id)
+
+    def test_solve_records_every_phase(self):
+        solve_system(self.context, sketch=self.sketch)
+        timings = solve_timings.last(self.sketch)
+        self.assertEqual(set(timings), {*solve_timings.PHASES, "total"})
+        self.assertGreater(timings["solve_sketch"], 0.0)
+        self.assertGreaterEqual(
+            timings["total"], sum(timings[name] for name in solve_timings.PHASES)
+        )
+
+    def test_history_is_bounded(self):
+        for _ in range(solve_timings.HISTORY + 3):
+            solve_system(self.context, sketch=self.sketch)
+        self.assertEqual(len(solve_timings.history(self.sketch)), solve_timings.HISTORY)
+
+    def test_unmeasured_phases_are_ignored(self):
+        with solve_timings.phase("geometry"):
+            pass
+        self.assertIsNone(solve_timings.last(self.sketch))
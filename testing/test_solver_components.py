@@ -0,0 +1,93 @@
+"""Tests for per-component solving (utilities.components + solve_system).
+
+A sketch is split into islands that share no geometry or constraint and each
+island is solved on its own. These guard the decomposition itself, that the
+aggregated dof/state match what a whole-sketch solve reports, that a broken
+island no longer blocks the others, and that a partial solve leaves untouched
+islands alone.
+"""
+
+from mathutils import Vector
+
+from ..curve_solver import CurveSolver, solve_system
+from ..utilities.components import component_of, find_components
+from .utils import Sketch2dTestCase
+
+
+class TestSolverComponents(Sketch2dTestCase):
+    def _island(self, x, length=2.0):
+        """A line from a free point with a distance constraint: one island."""
+        p0 = self.add_point((x, 0))
+        p1 = self.add_point((x + 1, 0))
+        line = self.add_line(p0, p1)
+        self.sketch.constraints.add_distance(
+            init=True, value=length, curve_id_1=line.curve_id
+        )
+        return p0, p1, line
+
+    def test_disconnected_islands(self):
+        a = self._island(0)
+        b = self._island(10)
+        components = find_components(self.sketch)
+        self.assertEqual(len(components), 2)
+        self.assertIsNot(
+            component_of(components, a[2].curve_id),
+            component_of(components, b[2].curve_id),
+        )
+
+        self.sketch.constraints.add_distance(
+            init=True, curve_id_1=a[1].curve_id, curve_id_2=b[0].curve_id
+        )
+        self.assertEqual(len(find_components(self.sketch)), 1)
+
+    def test_fixed_point_does_not_join(self):
+        anchor = self.add_point((5, 5), fixed=True)
+        a = self._island(0)
+        b = self._island(10)
+        sc = self.sketch.constraints
+        sc.add_distance(init=True, curve_id_1=anchor.curve_id, curve_id_2=a[0].curve_id)
+        sc.add_distance(init=True, curve_id_1=anchor.curve_id, curve_id_2=b[0].curve_id)
+
+        components = find_components(self.sketch)
+        self.assertEqual(len(components), 2)
+        for comp in components:
+            self.assertIn(anchor.key, comp.curve_ids)
+            self.assertNotIn(anchor.key, comp.key)
+
+    def test_dof_matches_whole_sketch(self):
+        self._island(0)
+        self._island(10)
+        self.add_point((20, 0))
+        self.add_circle((30, 0), 1.0)
+        self.add_arc((40, 0), (41, 0), (40, 1))
+        self.solve()
+        per_component = self.sketch.dof
+
+        CurveSolver(self.context, self.sketch).solve()
+        self.assertEqual(per_component, self.sketch.dof)
+
+    def test_failure_is_isolated(self):
+        p0, p1, line = self._island(0)
+        self.sketch.constraints.add_distance(
+            init=True, value=5.0, curve_id_1=line.curve_id
+        )
+        q0, q1, other = self._island(10, length=3.0)
+
+        self.assertFalse(self.sketch.solve(self.context))
+        self.assertEqual(self.sketch.solver_state, "INCONSISTENT")
+        self.assertAlmostEqual(other.length, 3.0, places=5)
+
+    def test_partial_solve_skips_untouched(self):
+        p0, p1, line = self._island(0)
+        q0, q1, other = self._island(10)
+        self.solve()
+
+        p1.co = Vector((p1.co.x + 1, p1.co.y))
+        q1.co = Vector((q1.co.x + 1, q1.co.y))
+        untouched = Vector(q1.co)
+        self.assertTrue(
+            solve_system(self.context, sketch=self.sketch, changed_ids={p1.curve_id})
+        )
+        self.assertAlmostEqual(line.length, 2.0, places=5)
+        self.assertLess((Vector(q1.co) - untouched).length, 1e-9)
+        self.assertEqual(self.sketch.solver_state, "OKAY")
@@ -0,0 +1,80 @@
+"""Tests for solving sketches from recorded plain-data systems (solver_pool).
+
+The pool path builds each system with ``SlvsRecorder`` instead of slvs, solves
+it in a ``solver_worker`` and writes the reply back through ``CurveSolver``.
+These guard that this round trip lands on the same geometry and feedback as
+solving in-process, both replayed directly and through real worker processes.
+"""
+
+from unittest import mock
+
+from mathutils import Vector
+
+from .. import solver_pool, solver_worker
+from ..curve_solver import CurveSolver
+from .utils import Sketch2dTestCase
+
+
+class TestSolverPool(Sketch2dTestCase):
+    def _square(self, sketch_offset=0.0):
+        sc = self.sketch.constraints
+        pts = [
+            self.add_point((sketch_offset + x, y), fixed=(x, y) == (0, 0))
+            for x, y in ((0, 0), (1.2, 0.1), (1.1, 0.9), (-0.1, 1.0))
+        ]
+        lines = [self.add_line(pts[i], pts[(i + 1) % 4]) for i in range(4)]
+        sc.add_horizontal(curve_id_1=lines[0].curve_id)
+        sc.add_vertical(curve_id_1=lines[1].curve_id)
+        sc.add_horizontal(curve_id_1=lines[2].curve_id)
+        sc.add_distance(init=True, value=2.0, curve_id_1=lines[0].curve_id)
+        return pts
+
+    def _replayed(self):
+        recorder = solver_pool.SlvsRecorder()
+        solver = CurveSolver(self.context, self.sketch, solvesys=recorder)
+        solver._build()
+        reply = solver_worker.replay(solver.solvesys.calls, solver.group_sketch)
+        solver.solvesys = solver_pool._ReplayedSystem(reply)
+        return solver._run()
+
+    def test_replay_matches_in_process_solve(self):
+        pts = self._square()
+        self.assertTrue(self._replayed())
+        replayed = [Vector(p.co) for p in pts]
+        dof = self.sketch.dof
+
+        CurveSolver(self.context, self.sketch).solve()
+        for p, co in zip(pts, replayed):
+            self.assertLess((Vector(p.co) - co).length, 1e-6)
+        self.assertEqual(dof, self.sketch.dof)
+
+    def test_replay_flags_failed_constraints(self):
+        pts = self._square()
+        self.sketch.constraints.add_distance(
+            init=True,
+            value=3.0,
+            curve_id_1=pts[0].curve_id,
+            curve_id_2=pts[1].curve_id,
+        )
+        self.assertFalse(self._replayed())
+        self.assertEqual(self.sketch.solver_state, "INCONSISTENT")
+        all_c = self.sketch.target_object.data.sketch_constraints.all
+        self.assertTrue(any(c.failed for c in all_c))
+
+    def test_worker_pool_solves_sketches(self):
+        first = self.sketch
+        pts_a = self._square()
+        self.sketch = self.new_sketch()
+        pts_b = self._square(sketch_offset=5.0)
+        second = self.sketch
+
+        try:
+            with mock.patch.object(solver_pool, "_pool_size", return_value=2):
+                oks = solver_pool.solve_sketches(self.context, [first, second])
+        finally:
+            solver_pool.shutdown()
+
+        self.assertEqual(oks, [True, True])
+        for pts in (pts_a, pts_b):
+            self.assertAlmostEqual((pts[1].co - pts[0].co).length, 2.0, places=5)
+            self.assertAlmostEqual(pts[1].co.y, pts[0].co.y, places=5)
@@ -0,0 +1,64 @@
+"""Tests for recording solver systems to replayable files (solver_record)."""
+
+import json
+import os
+import tempfile
+
+from .. import solver_record, solver_worker
+from ..curve_solver import solve_system
+from .utils import Sketch2dTestCase
+
+
+class TestSolverRecord(Sketch2dTestCase):
+    def setUp(self):
+        super().setUp()
+        p1 = self.add_point((0, 0), fixed=True)
+        self.p2 = self.add_point((1.0, 0.2))
+        line = self.add_line(p1, self.p2)
+        sc = self.sketch.constraints
+        sc.add_horizontal(curve_id_1=line.curve_id)
+        sc.add_distance(init=True, value=2.0, curve_id_1=line.curve_id)
+
+        path = os.path.join(tempfile.mkdtemp(), "sketch.slvs.json")
+        self.path = path
+        self.addCleanup(os.remove, path)
+
+    def _replay(self):
+        doc = solver_worker.load_recording(self.path)
+        return [solver_worker.replay(s["calls"], s["group"]) for s in doc["systems"]]
+
+    def test_replay_matches_solve(self):
+        solver_record.save(solver_record.capture(self.context, self.sketch), self.path)
+        replies = self._replay()
+        self.assertTrue(solve_system(self.context, sketch=self.sketch))
+        self.assertEqual(len(replies), 1)
+        self.assertEqual(replies[0]["result"]["result"], 0)
+        self.assertEqual(replies[0]["result"]["dof"], self.sketch.dof)
+
+    def test_replay_times_solve(self):
+        solver_record.save(solver_record.capture(self.context, self.sketch), self.path)
+        ms = self._replay()[0]["ms"]
+        self.assertIsInstance(ms, float)
+        self.assertGreaterEqual(ms, 0.0)
+
+    def test_capture_keeps_failed_flags(self):
+        horizontal = self.sketch.constraints.horizontal[0]
+        horizontal.failed = True
+        solver_record.capture(self.context, self.sketch)
+        self.assertTrue(horizontal.failed)
+
+    def test_records_drag_pin(self):
+        from mathutils import Vector
+
+        pin = (self.p2.curve_id, Vector((3.0, 0.0, 0.0)))
+        doc = solver_record.capture(self.context, self.sketch, tweak=pin)
+        names = [name for name, _args, _kwargs in doc["systems"][0]["calls"]]
+        self.assertIn("dragged", names)
+
+    def test_unsupported_version_is_rejected(self):
+        doc = solver_record.capture(self.context, self.sketch)
+        doc["version"] = solver_worker.RECORDING_VERSION + 1
+        with open(self.path, "w") as f:
+            json.dump(doc, f)
+        with self.assertRaises(ValueError):
+            solver_worker.load_recording(self.path)
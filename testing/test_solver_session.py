@@ -0,0 +1,109 @@
+"""Tests for the persistent tweak-drag solver session (curve_solver.SolverSession).
+
+A session builds the solvespace system once per drag and then only moves the
+drag pin between steps. These guard that it follows the cursor like a fresh
+per-step ``CurveSolver`` would, that it really does reuse its system, and that
+it falls back to a full rebuild whenever the system it holds is no longer valid.
+"""
+
+import math
+
+from mathutils import Vector
+
+from ..curve_solver import CurveSolver, SolverSession, solve_system
+from .utils import Sketch2dTestCase
+
+
+class TestSolverSession(Sketch2dTestCase):
+    def _slider(self):
+        a0 = self.add_point((0, 0), fixed=True)
+        p = self.add_point((4, 0))
+        line = self.add_line(a0, p)
+        c = self.sketch.constraints.add_distance(init=True, curve_id_1=line.curve_id)
+        c.value = 4.0
+        self.solve()
+        return p
+
+    def test_drag_reuses_system(self):
+        p = self._slider()
+        session = SolverSession(self.context, self.sketch, p.curve_id)
+        for i in range(12):
+            a = math.tau * i / 12
+            target = Vector((5 * math.cos(a), 5 * math.sin(a), 0.0))
+            self.assertTrue(session.drag(target))
+            self.assertAlmostEqual(p.co.length, 4.0, places=5)
+            self.assertAlmostEqual(
+                math.atan2(p.co.y, p.co.x) % math.tau, a % math.tau, places=4
+            )
+        self.assertEqual(session.builds, 1)
+        session.end()
+        self.assertFalse(session.active)
+
+    def test_matches_fresh_solver(self):
+        p = self._slider()
+        session = SolverSession(self.context, self.sketch, p.curve_id)
+        target = Vector((1.0, 3.0, 0.0))
+        session.drag(target)
+        via_session = Vector(p.co)
+
+        solver = CurveSolver(self.context, self.sketch)
+        solver.tweak(p.curve_id, target)
+        solver.solve()
+        self.assertLess((Vector(p.co) - via_session).length, 1e-6)
+
+    def test_rebuilds_on_topology_change(self):
+        p = self._slider()
+        session = SolverSession(self.context, self.sketch, p.curve_id)
+        session.drag(Vector((0.0, 5.0, 0.0)))
+        self.add_point((9, 9))
+        session.drag(Vector((-5.0, 0.0, 0.0)))
+        self.assertEqual(session.builds, 2)
+        self.assertAlmostEqual(p.co.x, -4.0, places=5)
+
+    def test_rebuilds_when_system_replaced(self):
+        """Another solve between two steps (e.g. the depsgraph handler) clears
+        the global slvs system; the session must notice and rebuild."""
+        p = self._slider()
+        session = SolverSession(self.context, self.sketch, p.curve_id)
+        session.drag(Vector((0.0, 5.0, 0.0)))
+        solve_system(self.context, sketch=self.sketch)
+        session.drag(Vector((0.0, -5.0, 0.0)))
+        self.assertEqual(session.builds, 2)
+        self.assertAlmostEqual(p.co.y, -4.0, places=5)
+
+    def test_fully_defined_drag_falls_back(self):
+        p0 = self.add_point((0, 0), fixed=True)
+        p1 = self.add_point((5, 0))
+        self.add_line(p0, p1)
+        sc = self.sketch.constraints
+        sc.add_distance(
+            init=True, curve_id_1=p0.curve_id, curve_id_2=p1.curve_id
+        ).value = 5.0
+        sc.add_horizontal(curve_id_1=p0.curve_id, curve_id_2=p1.curve_id)
+        self.solve()
+        self.assertEqual(self.sketch.dof, 0)
+
+        session = SolverSession(self.context, self.sketch, p1.curve_id)
+        session.drag(Vector((6.0, 2.0, 0.0)))
+        self.assertNotEqual(self.sketch.solver_state, "INCONSISTENT")
+        self.assertLess((Vector(p1.co) - Vector((5.0, 0.0))).length, 1e-6)
+
+    def test_fallback_publishes_whole_sketch(self):
+        # A fully defined component next to a free line: the fallback solve
+        # of the dragged component must still report the sketch's total dof
+        p0 = self.add_point((0, 0), fixed=True)
+        p1 = self.add_point((5, 0))
+        self.add_line(p0, p1)
+        sc = self.sketch.constraints
+        sc.add_distance(
+            init=True, curve_id_1=p0.curve_id, curve_id_2=p1.curve_id
+        ).value = 5.0
+        sc.add_horizontal(curve_id_1=p0.curve_id, curve_id_2=p1.curve_id)
+        self.add_line(self.add_point((0, 3)), self.add_point((2, 3)))
+        self.solve()
+        dof = self.sketch.dof
+        self.assertGreater(dof, 0)
+
+        session = SolverSession(self.context, self.sketch, p1.curve_id)
+        session.drag(Vector((6.0, 2.0, 0.0)))
+        self.assertEqual(self.sketch.dof, dof)
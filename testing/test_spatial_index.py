@@ -0,0 +1,38 @@
+"""Tests for the uniform grid behind picking (drawing.spatial_index)."""
+
+import unittest
+
+import numpy as np
+
+from ..drawing.spatial_index import GridIndex
+
+
+class TestGridIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.lo = rng.uniform(0, 100, (500, 2))
+        self.hi = self.lo + rng.uniform(0, 5, (500, 2))
+        self.index = GridIndex(self.lo, self.hi)
+
+    def _overlapping(self, lo, hi):
+        hit = (self.lo <= hi).all(axis=1) & (self.hi >= lo).all(axis=1)
+        return set(np.flatnonzero(hit).tolist())
+
+    def test_query_covers_overlapping_boxes(self):
+        for lo, hi in (((10, 10), (12, 12)), ((50, 0), (60, 100)), ((0, 0), (1, 1))):
+            found = set(self.index.query(lo, hi).tolist())
+            self.assertLessEqual(self._overlapping(lo, hi), found)
+        # Small queries only touch a few cells
+        self.assertLess(len(self.index.query((10, 10), (12, 12))), 50)
+
+    def test_query_outside_and_empty(self):
+        self.assertEqual(len(self.index.query((200, 200), (210, 210))), 0)
+        self.assertEqual(len(self.index.query((-20, -20), (-10, -10))), 0)
+        empty = GridIndex(np.empty((0, 2)), np.empty((0, 2)))
+        self.assertEqual(len(empty.query((0, 0), (1, 1))), 0)
+
+    def test_degenerate_boxes(self):
+        # Collinear points: a zero-area extent must still index
+        points = np.column_stack((np.arange(10.0), np.zeros(10)))
+        index = GridIndex(points, points)
+        self.assertEqual(index.query((2.5, -1), (4.5, 1)).tolist(), [3, 4])
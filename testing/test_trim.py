@@ -1,7 +1,11 @@
 """Tests for the trim operator logic."""
 
 import math
+
+import numpy as np
 from mathutils import Vector
+
+from ..utilities.curve_data import get_curve_index
 from .utils import Sketch2dTestCase
 
 
@@ -133,3 +137,42 @@ class TestTrimLogic(Sketch2dTestCase):
         # Should have at least one new coincident constraint
         n_coincident_after = len(sc.coincident)
         self.assertGreater(n_coincident_after, n_coincident_before)
+
+    def _trim_crossing_lines(self):
+        """Trim the left end off a horizontal line crossed at x=3."""
+        from ..utilities.trimming import TrimSegment
+
+        p1 = self.add_point((0, 0))
+        p2 = self.add_point((6, 0))
+        p3 = self.add_point((3, -3))
+        p4 = self.add_point((3, 3))
+        l1 = self.add_line(p1, p2)
+        l2 = self.add_line(p3, p4)
+
+        topo = self.sketch.topology
+        trim = TrimSegment(self.sketch, l1, Vector((1, 0)), topo)
+        for co in topo.intersect(l1, l2):
+            trim.add(co, source_cid=l2.curve_id)
+        self.assertTrue(trim.check())
+        import bpy
+        trim.execute(bpy.context)
+        return p1, p2, l1
+
+    def test_trim_retargets_kept_piece(self):
+        """The reused segment is redrawn from its new endpoint."""
+        n_before = len(self.sketch.data.curves)
+        p1, p2, l1 = self._trim_crossing_lines()
+
+        cd = self.sketch.data
+        # One point added at the intersection, the trimmed-off endpoint removed
+        self.assertEqual(len(cd.curves), n_before)
+        first = cd.curves[get_curve_index(self.sketch, l1.curve_id)].points[0].index
+        positions = [tuple(cd.points[first + i].position)[:2] for i in range(2)]
+        np.testing.assert_allclose(positions, [(3, 0), (6, 0)], atol=1e-6)
+
+    def test_trim_removes_trimmed_endpoint(self):
+        """The endpoint cut off with the first piece no longer exists."""
+        p1, p2, l1 = self._trim_crossing_lines()
+        self.assertIsNone(get_curve_index(self.sketch, p1.curve_id))
+        self.assertIsNotNone(get_curve_index(self.sketch, p2.curve_id))
+        self.assertNotIn(p1.curve_id, {l1.p1.curve_id, l1.p2.curve_id})
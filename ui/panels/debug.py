@@ -1,5 +1,7 @@
 from bpy.types import Context
 
+from ...model.sketch_ref import get_active_sketch
+from ...utilities import solve_cache, solve_timings
 from .. import constants, declarations, preferences
 from . import VIEW3D_PT_sketcher_base
 
@@ -27,6 +29,35 @@ class VIEW3D_PT_sketcher_debug(VIEW3D_PT_sketcher_base):
         row.operator(declarations.Operators.Snapshot)
         row.operator(declarations.Operators.Restore)
 
+        layout.operator(declarations.Operators.RecordSolver)
+
+        # Animation solve cache
+        stats = solve_cache.stats()
+        col = layout.column(align=True)
+        col.label(
+            text="Solve Cache: {} hits, {} misses".format(
+                stats["hits"], stats["misses"]
+            )
+        )
+        col.label(
+            text="{} entries, {:.1f} MB".format(
+                stats["entries"], stats["nbytes"] / 2**20
+            )
+        )
+        col.operator(declarations.Operators.BakeSolveCache)
+        col.operator(declarations.Operators.BakeSolveFile)
+
+        # Where the active sketch's solves spend their time
+        timings = solve_timings.last(get_active_sketch(context))
+        if timings:
+            mean = solve_timings.mean(get_active_sketch(context))
+            col = layout.column(align=True)
+            col.label(text="Solve Timings (last / mean ms)")
+            for name in (*solve_timings.PHASES, "total"):
+                row = col.row()
+                row.label(text=name.replace("_", " ").title())
+                row.label(text="{:.2f} / {:.2f}".format(timings[name], mean[name]))
+
         layout.prop(context.scene.sketcher, "show_origin")
         layout.prop(prefs, "hide_inactive_constraints")
         layout.prop(prefs, "all_entities_selectable")
@@ -4,6 +4,7 @@ from ...drawing import selection
 from ...model.constants import SketchCurveType
 from ...model.sketch_ref import get_active_sketch
 from ...utilities.curve_data import get_str_attr, get_uuid, has_uuid_field
+from ...utilities.sketch_table import to_key
 from .. import declarations
 from . import VIEW3D_PT_sketcher_base
 
@@ -44,6 +45,7 @@ class VIEW3D_PT_sketcher_entities(VIEW3D_PT_sketcher_base):
         if not has_uuid_field(curve_data, "curve_id") or not type_attr:
             return
 
+        selected_keys = set(selection.selected)
         for i in range(n):
             cid = get_uuid(curve_data, "curve_id", i)
             if not cid:
@@ -51,7 +53,7 @@ class VIEW3D_PT_sketcher_entities(VIEW3D_PT_sketcher_base):
 
             ctype = type_attr.data[i].value
             visible = vis_attr.data[i].value if vis_attr else True
-            selected = cid in selection.selected
+            selected = to_key(cid) in selected_keys
             # Stored name (set at creation), falling back to the type label.
             name = (get_str_attr(name_attr, i) if name_attr else "") or _TYPE_NAMES.get(
                 ctype, "Curve"
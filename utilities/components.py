@@ -0,0 +1,179 @@
+"""Independent solver components of a sketch.
+
+A sketch often consists of several islands that share neither geometry nor a
+constraint -- a bolt-hole pattern next to an outline. Each island is its own
+solvespace system: solving it alone gives the same result as solving the whole
+sketch, so an edit only has to re-solve the islands it touched.
+
+Connectivity runs over curve keys (``sketch_table.to_key``): a segment joins its
+start/end/center points, a constraint joins every curve it references
+(``curve_id_1..3``). Fixed points
+are constants to the solver (they go into ``group_fixed``), so they never join
+two islands; an island that references one carries it along as an anchor.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..model.constants import SketchCurveType
+from .curve_data import has_uuid_field
+from .sketch_table import get_table, to_key
+
+
+@dataclass
+class SolveComponent:
+    """One independent island of a sketch's constraint graph."""
+
+    # Keys of the island's free curves; also its identity across solves.
+    key: frozenset
+    # Keys of every curve the island's system needs: ``key`` plus its fixed
+    # anchors.
+    curve_ids: frozenset
+    constraints: list = field(default_factory=list)
+    has_arcs: bool = False
+    n_free_points: int = 0
+    n_circles: int = 0
+
+    @property
+    def is_trivial(self):
+        """Nothing in the island can move: no constraint, and no arc (solvespace
+        implicitly keeps an arc's end point on its radius)."""
+        return not self.constraints and not self.has_arcs
+
+    @property
+    def trivial_dof(self):
+        """Degrees of freedom of a trivial island: 2 per free point (u, v) and
+        one radius parameter per circle."""
+        return 2 * self.n_free_points + self.n_circles
+
+
+class _DisjointSet:
+    def __init__(self):
+        self.parent = {}
+
+    def add(self, x):
+        self.parent.setdefault(x, x)
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[rb] = ra
+
+
+def find_components(sketch):
+    """Split a sketch into independent ``SolveComponent``s, in curve order."""
+    if not sketch or not sketch.target_object or not sketch.target_object.data:
+        return []
+    cd = sketch.target_object.data
+    n = len(cd.curves)
+    type_attr = cd.attributes.get("sketch_type")
+    if n == 0 or not type_attr or not has_uuid_field(cd, "curve_id"):
+        return []
+
+    table = get_table(cd, values=False)
+    types = table.types
+    fixed = np.zeros(n, dtype=bool)
+    fixed_attr = cd.attributes.get("fixed")
+    if fixed_attr:
+        fixed_attr.data.foreach_get("value", fixed)
+
+    cids = table.key_list(cd, "curve_id")
+    sp_ids = table.key_list(cd, "start_point_id")
+    ep_ids = table.key_list(cd, "end_point_id")
+    cp_ids = table.key_list(cd, "center_point_id")
+
+    ctype_by_id = dict(zip(cids, types.tolist()))
+    anchors = {
+        cid
+        for cid, t, f in zip(cids, types.tolist(), fixed.tolist())
+        if t == SketchCurveType.POINT and f
+    }
+
+    ds = _DisjointSet()
+    for cid in cids:
+        if cid not in anchors:
+            ds.add(cid)
+    # (free curve, fixed anchor) pairs, resolved to their island once all
+    # unions are done.
+    links = []
+
+    def _join(ids):
+        """Union the referenced curves; return a representative, or None."""
+        ids = [c for c in ids if c in ctype_by_id]
+        if not ids:
+            return None
+        free = [c for c in ids if c not in anchors]
+        if not free:
+            # Only fixed geometry (e.g. a distance between two fixed points):
+            # it still needs a system of its own to report its state.
+            for c in ids:
+                ds.add(c)
+            free = ids
+        for c in free[1:]:
+            ds.union(free[0], c)
+        links.extend((free[0], c) for c in ids if c not in free)
+        return free[0]
+
+    for i in range(n):
+        if types[i] != SketchCurveType.POINT:
+            _join((cids[i], sp_ids[i], ep_ids[i], cp_ids[i]))
+
+    owned = []  # (constraint, representative curve)
+    sketch_constraints = cd.sketch_constraints
+    for c in sketch_constraints.all:
+        rep = _join(
+            (
+                to_key(getattr(c, "curve_id_1", "")),
+                to_key(getattr(c, "curve_id_2", "")),
+                to_key(getattr(c, "curve_id_3", "")),
+            )
+        )
+        if rep is not None:
+            owned.append((c, rep))
+
+    members, extra = {}, {}
+    for cid in cids:
+        if cid in ds.parent:
+            members.setdefault(ds.find(cid), []).append(cid)
+    for rep, anchor in links:
+        extra.setdefault(ds.find(rep), set()).add(anchor)
+
+    components = {
+        root: SolveComponent(
+            key=frozenset(ids),
+            curve_ids=frozenset(ids).union(extra.get(root, ())),
+        )
+        for root, ids in members.items()
+    }
+    for c, rep in owned:
+        components[ds.find(rep)].constraints.append(c)
+    for root, comp in components.items():
+        for cid in members[root]:
+            t = ctype_by_id[cid]
+            if t == SketchCurveType.POINT and cid not in anchors:
+                comp.n_free_points += 1
+            elif t == SketchCurveType.CIRCLE:
+                comp.n_circles += 1
+            elif t == SketchCurveType.ARC:
+                comp.has_arcs = True
+    return list(components.values())
+
+
+def component_of(components, curve_id):
+    """The component a free curve (hex id or key) belongs to, or None (e.g. a
+    fixed point)."""
+    key = to_key(curve_id)
+    for comp in components:
+        if key in comp.key:
+            return comp
+    return None
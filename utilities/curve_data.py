@@ -8,6 +8,8 @@ import numpy as np
 from mathutils import Vector
 
 from ..model.constants import SketchCurveType
+from . import sketch_table
+from .curve_snapshot import CurveDataSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -62,16 +64,18 @@ def _u32(v):  # signed int32 -> unsigned
     return v + 0x100000000 if v < 0 else v
 
 
-def _stable_source_id(words):
-    """Fold UUID words into a stable signed 32-bit id; zero means unset."""
-    if not any(words):
-        return 0
-    value = 0x811C9DC5
-    for word in words:
-        value = ((value ^ _u32(word)) * 0x01000193) & 0xFFFFFFFF
-    if value == 0:
-        value = 1
-    return _i32(value)
+def _stable_source_ids(words):
+    """Fold (n, 4) int32 UUID words into stable signed 32-bit ids (FNV-1a over
+    the words); zero means unset."""
+    words = np.ascontiguousarray(words, dtype=np.int32).view(np.uint32)
+    value = np.full(len(words), 0x811C9DC5, dtype=np.uint64)
+    for k in range(4):
+        value ^= words[:, k]
+        value *= np.uint64(0x01000193)
+        value &= np.uint64(0xFFFFFFFF)
+    value[value == 0] = 1
+    value[~words.any(axis=1)] = 0
+    return value.astype(np.uint32).view(np.int32)
 
 
 def _hex_to_pairs(hexstr):
@@ -112,9 +116,6 @@ def get_uuid(curve_data, field, index):
 # segment rebuild, draw/pick) without re-deriving every hex id from its int
 # attributes on each call -- the dominant cost in solve and draw (issue #342).
 _uuid_list_cache = {}
-# Parallel cache of the same ids in raw-int-tuple form (read_uuid_raw_list),
-# invalidated in lockstep with _uuid_list_cache.
-_uuid_raw_cache = {}
 
 
 def set_uuid(curve_data, field, index, value):
@@ -127,7 +128,7 @@ def set_uuid(curve_data, field, index, value):
     if hi:
         hi.data[index].value = hi_pair
     _uuid_list_cache.pop((id(curve_data), field), None)
-    _uuid_raw_cache.pop((id(curve_data), field), None)
+    sketch_table.invalidate(curve_data)
 
 
 def new_uuid():
@@ -151,54 +152,23 @@ def read_uuid_list(curve_data, field):
     if cached is not None and len(cached) == n:
         return cached
 
-    lo = curve_data.attributes.get(f".{field}_lo")
-    hi = curve_data.attributes.get(f".{field}_hi")
-    if n == 0 or not lo or not hi:
+    if n == 0 or not has_uuid_field(curve_data, field):
         return [""] * n
-    lob = np.zeros(n * 2, dtype=np.int32)
-    hib = np.zeros(n * 2, dtype=np.int32)
-    lo.data.foreach_get("value", lob)
-    hi.data.foreach_get("value", hib)
-    result = [
-        _pairs_to_hex(
-            (int(lob[2 * i]), int(lob[2 * i + 1])),
-            (int(hib[2 * i]), int(hib[2 * i + 1])),
-        )
-        for i in range(n)
-    ]
+    to_hex = sketch_table.to_hex
+    result = [to_hex(k) for k in read_uuid_keys(curve_data, field)]
     _uuid_list_cache[key] = result
     return result
 
 
-def read_uuid_raw_list(curve_data, field):
-    """All curves' ids for a field as raw ``(lo0, lo1, hi0, hi1)`` int tuples.
+def read_uuid_keys(curve_data, field):
+    """All curves' ids for a field as int keys (0 when unset).
 
-    Like ``read_uuid_list`` but without the hex formatting: callers that only
-    compare ids for equality (e.g. grouping segment endpoints that share a
-    junction) don't need the string form, and building 4-int tuples is far
-    cheaper than ``_pairs_to_hex`` per curve. An all-zero tuple is the unset id
-    (falsy via ``any``).
+    The internal form of an id (see ``sketch_table``): hashing and comparing
+    ints is cheaper than hex strings and needs no formatting. Cached with the
+    sketch table.
     """
-    n = len(curve_data.curves)
-    key = (id(curve_data), field)
-    cached = _uuid_raw_cache.get(key)
-    if cached is not None and len(cached) == n:
-        return cached
-
-    lo = curve_data.attributes.get(f".{field}_lo")
-    hi = curve_data.attributes.get(f".{field}_hi")
-    if n == 0 or not lo or not hi:
-        return [(0, 0, 0, 0)] * n
-    lob = np.zeros(n * 2, dtype=np.int32)
-    hib = np.zeros(n * 2, dtype=np.int32)
-    lo.data.foreach_get("value", lob)
-    hi.data.foreach_get("value", hib)
-    result = [
-        (int(lob[2 * i]), int(lob[2 * i + 1]), int(hib[2 * i]), int(hib[2 * i + 1]))
-        for i in range(n)
-    ]
-    _uuid_raw_cache[key] = result
-    return result
+    table = sketch_table.get_table(curve_data, values=False)
+    return table.key_list(curve_data, field)
 
 
 def default_curve_name(curve_data, ctype):
@@ -235,6 +205,13 @@ def set_attribute(attributes, name: str, value, index: int = None):
                     a.data[i].value = pair
             else:
                 a.data[index].value = pair
+        # Same invalidation as set_uuid: the table's key columns (connectivity
+        # for segment rebuild, merge ids, topology, solver) must see the write
+        curve_data = attributes.id_data
+        _uuid_list_cache.pop((id(curve_data), name), None)
+        if name == "curve_id":
+            _curve_id_cache.pop(id(curve_data), None)
+        sketch_table.invalidate(curve_data)
         return
     attribute = attributes.get(name)
     if name in _STRING_ATTRS:
@@ -322,27 +299,31 @@ def _allocate_curve_id(sketch):
 
 
 def get_curve_index(sketch, curve_id):
-    """Look up curve index by curve_id. Uses runtime cache, falls back to scan."""
+    """Look up curve index by curve_id (hex or key). Uses runtime cache, falls
+    back to scan."""
     cd = _get_original_data(sketch)
     if not cd:
         return None
-    sk_key = id(cd)
-    if sk_key in _curve_id_cache:
-        cache = _curve_id_cache[sk_key]
-        if curve_id in cache:
-            return cache[curve_id]
-    return _rebuild_curve_id_cache(sketch, curve_id)
+    try:
+        key = sketch_table.to_key(curve_id)
+    except (TypeError, ValueError):
+        return None
+    cache = _curve_id_cache.get(id(cd))
+    if cache is not None and key in cache:
+        return cache[key]
+    return _rebuild_curve_id_cache(sketch, key)
 
 
-def _rebuild_curve_id_cache(sketch, lookup_id=None):
-    """Rebuild the curve_id -> curve_index cache for a sketch."""
+def _rebuild_curve_id_cache(sketch, lookup_key=None):
+    """Rebuild the curve key -> curve_index cache for a sketch."""
     curve_data = _get_original_data(sketch)
     if not curve_data:
         return None
     sk_key = id(curve_data)
-    cache = {cid: i for i, cid in enumerate(read_uuid_list(curve_data, "curve_id"))}
+    keys = read_uuid_keys(curve_data, "curve_id")
+    cache = dict(zip(keys, range(len(keys))))
     _curve_id_cache[sk_key] = cache
-    return cache.get(lookup_id) if lookup_id is not None else None
+    return cache.get(lookup_key) if lookup_key is not None else None
 
 
 def invalidate_curve_id_cache(sketch=None):
@@ -352,11 +333,11 @@ def invalidate_curve_id_cache(sketch=None):
         _curve_id_cache.pop(sk_key, None)
         for field in UUID_FIELDS:
             _uuid_list_cache.pop((sk_key, field), None)
-            _uuid_raw_cache.pop((sk_key, field), None)
+        sketch_table.invalidate(sketch.target_object.data)
     else:
         _curve_id_cache.clear()
         _uuid_list_cache.clear()
-        _uuid_raw_cache.clear()
+        sketch_table.invalidate()
 
 
 # ---------------------------------------------------------------------------
@@ -531,44 +512,80 @@ def ensure_sketch_curve_object(sketch):
 
 def remove_native_curve_by_id(sketch, curve_id):
     """Remove a curve by its stable curve_id."""
+    remove_native_curves_by_id(sketch, (curve_id,))
+
+
+def remove_native_curves_by_id(sketch, curve_ids, dependents=False, orphans=()):
+    """Remove the curves ``curve_ids`` (hex ids or keys) in one ``remove_curves``.
+
+    With ``dependents``, curves referencing a removed curve (segments using a
+    removed point) are removed too, transitively. Point curves in ``orphans``
+    are removed as well when no remaining segment references them -- e.g. the
+    endpoints of removed segments.
+
+    Returns the keys of everything removed, for pruning constraints.
+    """
     if not sketch or not sketch.target_object or not sketch.target_object.data:
-        return
+        return []
     curve_data = sketch.target_object.data
     n_curves = len(curve_data.curves)
-    if n_curves == 0:
-        return
+    if n_curves == 0 or not has_uuid_field(curve_data, "curve_id"):
+        return []
 
-    if not has_uuid_field(curve_data, "curve_id"):
-        return
+    table = sketch_table.get_table(curve_data, values=False)
+    curve_keys = table.keys(curve_data, "curve_id")
+    is_set = (curve_keys["lo"] != 0) | (curve_keys["hi"] != 0)
+    remove = sketch_table.keys_in(curve_keys, curve_ids) & is_set
+    ref_keys = [
+        table.keys(curve_data, field)
+        for field in ("start_point_id", "end_point_id", "center_point_id")
+    ]
 
-    to_remove = []
-    for curve_idx in range(n_curves):
-        if get_uuid(curve_data, "curve_id", curve_idx) == curve_id:
-            to_remove.append(curve_idx)
-
-    if to_remove:
-        # INT identity attributes survive remove_curves() and re-index, but the
-        # STRING `name` attribute is dropped entirely, so snapshot the survivors'
-        # names (in order) and restore them afterwards.
-        remove_set = set(to_remove)
-        attrs = curve_data.attributes
-        name_attr = attrs.get("name")
+    while dependents:
+        removed = curve_keys[remove]
+        grown = remove.copy()
+        for keys in ref_keys:
+            grown |= np.isin(keys, removed)
+        if (grown == remove).all():
+            break
+        remove = grown
+
+    if len(orphans):
+        survivors = ~remove & (table.types != SketchCurveType.POINT)
+        referenced = np.concatenate([keys[survivors] for keys in ref_keys])
+        remove |= (
+            sketch_table.keys_in(curve_keys, orphans)
+            & is_set
+            & ~np.isin(curve_keys, referenced)
+        )
+
+    to_remove = np.flatnonzero(remove).tolist()
+    if not to_remove:
+        return []
+    key_list = table.key_list(curve_data, "curve_id")
+    removed_keys = [key_list[i] for i in to_remove]
+
+    # INT identity attributes survive remove_curves() and re-index, but the
+    # STRING `name` attribute is dropped entirely, so snapshot the survivors'
+    # names (in order) and restore them afterwards.
+    name_attr = curve_data.attributes.get("name")
+    survivor_names = []
+    if name_attr:
         survivor_names = [
-            name_attr.data[i].value
-            for i in range(n_curves)
-            if i not in remove_set and name_attr
+            name_attr.data[i].value for i in np.flatnonzero(~remove).tolist()
         ]
 
-        curve_data.remove_curves(indices=to_remove)
+    curve_data.remove_curves(indices=to_remove)
 
-        ensure_standard_attributes(curve_data)  # recreate the dropped `name`
-        name_attr = curve_data.attributes.get("name")
-        if name_attr:
-            for new_idx, val in enumerate(survivor_names):
-                name_attr.data[new_idx].value = val
+    ensure_standard_attributes(curve_data)  # recreate the dropped `name`
+    name_attr = curve_data.attributes.get("name")
+    if name_attr:
+        for new_idx, val in enumerate(survivor_names):
+            name_attr.data[new_idx].value = val
 
-        invalidate_curve_id_cache(sketch)
-        curve_data.update_tag()
+    invalidate_curve_id_cache(sketch)
+    curve_data.update_tag()
+    return removed_keys
 
 
 _batch_sketches = set()
@@ -650,6 +667,18 @@ def _target_arc_segments(angle, current):
     return current
 
 
+def _touching(cd, table, point_ids):
+    """Mask of the curves whose start, end or center point is in ``point_ids``
+    (every curve when None)."""
+    if point_ids is None:
+        return np.ones(table.n_curves, dtype=bool)
+    point_ids = [p for p in point_ids if p]
+    mask = np.zeros(table.n_curves, dtype=bool)
+    for field in ("start_point_id", "end_point_id", "center_point_id"):
+        mask |= sketch_table.keys_in(table.keys(cd, field), point_ids)
+    return mask
+
+
 def _resegment_arcs(sketch, cd, point_ids=None):
     """Resize arcs whose control-point count no longer fits their sweep angle.
 
@@ -661,7 +690,7 @@ def _resegment_arcs(sketch, cd, point_ids=None):
     """
     import math
 
-    from ..model.constants import BezierHandleType, SketchCurveType
+    from ..model.constants import SketchCurveType
     from .math import range_2pi
 
     ob = sketch.target_object
@@ -669,45 +698,37 @@ def _resegment_arcs(sketch, cd, point_ids=None):
     if ob is None or getattr(ob, "mode", "OBJECT") == "EDIT":
         return False
 
-    type_attr = cd.attributes.get("sketch_type")
-    if not type_attr:
+    if not cd.attributes.get("sketch_type"):
         return False
 
-    n = len(cd.curves)
-    types = np.empty(n, dtype=np.int32)
-    type_attr.data.foreach_get("value", types)
+    table = sketch_table.get_table(cd, values=False)
+    types = table.types
     if not (types == SketchCurveType.ARC).any():
         return False
 
-    cp_ids = read_uuid_list(cd, "center_point_id")
-    sp_ids = read_uuid_list(cd, "start_point_id")
-    ep_ids = read_uuid_list(cd, "end_point_id")
-
     # Arcs to consider (all, or only those touching a changed point).
-    arc_indices = [
-        i
-        for i in range(n)
-        if types[i] == SketchCurveType.ARC
-        and (
-            point_ids is None
-            or sp_ids[i] in point_ids
-            or ep_ids[i] in point_ids
-            or cp_ids[i] in point_ids
-        )
-    ]
+    arc_indices = np.flatnonzero(
+        (types == SketchCurveType.ARC) & _touching(cd, table, point_ids)
+    ).tolist()
     if not arc_indices:
         return False
 
+    cp_ids = table.key_list(cd, "center_point_id")
+    sp_ids = table.key_list(cd, "start_point_id")
+    ep_ids = table.key_list(cd, "end_point_id")
+
     # id -> 2D position, built only for the point curves those arcs reference.
     needed = set()
     for i in arc_indices:
         needed.update((cp_ids[i], sp_ids[i], ep_ids[i]))
-    curve_ids = read_uuid_list(cd, "curve_id")
+    curve_ids = table.key_list(cd, "curve_id")
+    table = sketch_table.get_table(cd)
+    positions = table.positions
+    first = table.first
     pos_map = {}
-    for i in range(n):
-        if types[i] == SketchCurveType.POINT and curve_ids[i] in needed:
-            p = cd.points[cd.curves[i].points[0].index].position
-            pos_map[curve_ids[i]] = Vector((p[0], p[1]))
+    for i in np.flatnonzero(types == SketchCurveType.POINT).tolist():
+        if curve_ids[i] in needed:
+            pos_map[curve_ids[i]] = Vector(positions[first[i], :2])
 
     sizes = None
     changed = []
@@ -720,22 +741,33 @@ def _resegment_arcs(sketch, cd, point_ids=None):
 
         sv, ev = s - ct, e - ct
         angle = range_2pi(math.atan2(ev[1], ev[0]) - math.atan2(sv[1], sv[0]))
-        current = cd.curves[i].points_length - 1
+        current = int(table.counts[i]) - 1
         target = _target_arc_segments(angle, current)
         if target != current:
             if sizes is None:
-                sizes = [cv.points_length for cv in cd.curves]
+                sizes = table.counts.tolist()
             sizes[i] = target + 1
             changed.append(i)
 
     if sizes is None:
         return False
 
+    # Positions/handles for the whole arc are rewritten by the rebuild pass
+    # that follows.
+    _resize_arcs(cd, sizes, changed)
+    return True
+
+
+def _resize_arcs(cd, sizes, changed):
+    """``resize_curves`` to ``sizes``, where the curves at indices ``changed``
+    are the arcs whose point count changed."""
+    from ..model.constants import BezierHandleType
+
     cd.resize_curves(sizes)
+    sketch_table.invalidate(cd)
 
     # New points come in zero-initialized; give them free bezier handles so
-    # _build_arc_bezier's handle vectors take effect. (Positions/handles for the
-    # whole arc are rewritten by the rebuild pass that follows.)
+    # the bezier handle vectors written afterwards take effect.
     attrs = cd.attributes
     hlt = attrs.get("handle_type_left")
     hrt = attrs.get("handle_type_right")
@@ -745,7 +777,6 @@ def _resegment_arcs(sketch, cd, point_ids=None):
                 hlt.data[pt.index].value = BezierHandleType.FREE
             if hrt:
                 hrt.data[pt.index].value = BezierHandleType.FREE
-    return True
 
 
 def compute_merge_ids(sketch):
@@ -758,7 +789,8 @@ def compute_merge_ids(sketch):
     instead of by proximity: tolerance-free and independent of sketch scale.
 
     Interior, point and circle vertices keep id 0; they are never welded (their
-    valence is not 1), so their id is irrelevant. Returns True if anything ran.
+    valence is not 1), so their id is irrelevant. Returns True if the ids are
+    current (computed now or still valid).
     """
     if not sketch or not sketch.target_object or not sketch.target_object.data:
         return False
@@ -768,39 +800,49 @@ def compute_merge_ids(sketch):
     if n_points == 0 or not type_attr:
         return False
 
+    table = sketch_table.get_table(cd, values=False)
+    attr = cd.attributes.get("merge_id")
+    # Weld ids and seeds only depend on connectivity: skip while the table's
+    # structure (curves, points, ids) is the one they were computed from.
+    if attr is not None and _connectivity_version.get(id(cd)) == (
+        table.structure_version
+    ):
+        return True
+
+    segments, start_idx, end_idx = _segment_ends(table)
     # Only equality of endpoint ids matters here (shared junction -> shared weld
-    # id), so read the raw id tuples and skip the per-curve hex formatting.
-    sp_ids = read_uuid_raw_list(cd, "start_point_id")
-    ep_ids = read_uuid_raw_list(cd, "end_point_id")
+    # id), so dense ids come straight from np.unique over the endpoint keys.
+    keys = np.concatenate((
+        table.keys(cd, "start_point_id")[segments],
+        table.keys(cd, "end_point_id")[segments],
+    ))
+    point_idx = np.concatenate((start_idx, end_idx))
+    is_set = (keys["lo"] != 0) | (keys["hi"] != 0)
+    _unique, dense = np.unique(keys[is_set], return_inverse=True)
 
     ids = np.zeros(n_points, dtype=np.int32)
-    dense = {}
+    # 1-based so 0 stays the "no weld" default for interior/point/circle.
+    ids[point_idx[is_set]] = dense.ravel() + 1
 
-    def junction(u):
-        # 1-based so 0 stays the "no weld" default for interior/point/circle.
-        return dense.setdefault(u, len(dense) + 1)
-
-    for i in range(len(cd.curves)):
-        t = type_attr.data[i].value
-        if t not in (SketchCurveType.LINE, SketchCurveType.ARC):
-            continue
-        cv = cd.curves[i]
-        npt = cv.points_length
-        if npt < 2:
-            continue
-        if any(sp_ids[i]):
-            ids[cv.points[0].index] = junction(sp_ids[i])
-        if any(ep_ids[i]):
-            ids[cv.points[npt - 1].index] = junction(ep_ids[i])
-
-    attr = cd.attributes.get("merge_id")
     if attr is None:
         attr = cd.attributes.new("merge_id", "INT", "POINT")
     attr.data.foreach_set("value", ids)
     compute_generated_id_seeds(sketch)
+    _connectivity_version[id(cd)] = table.structure_version
     return True
 
 
+def _segment_ends(table):
+    """Lines and arcs with at least two points, and the point indices of their
+    first and last points."""
+    segments = np.flatnonzero(
+        np.isin(table.types, (SketchCurveType.LINE, SketchCurveType.ARC))
+        & (table.counts >= 2)
+    )
+    start_idx = table.first[segments]
+    return segments, start_idx, start_idx + table.counts[segments] - 1
+
+
 def compute_generated_id_seeds(sketch):
     """Write stable source seeds used to identify generated mesh children."""
     if not sketch or not sketch.target_object or not sketch.target_object.data:
@@ -819,34 +861,72 @@ def compute_generated_id_seeds(sketch):
     if not curve_attr or not endpoint_attr or not type_attr:
         return False
 
-    curve_ids = read_uuid_raw_list(cd, "curve_id")
-    start_ids = read_uuid_raw_list(cd, "start_point_id")
-    end_ids = read_uuid_raw_list(cd, "end_point_id")
-    curve_seeds = np.array(
-        [_stable_source_id(value) for value in curve_ids], dtype=np.int32
+    table = sketch_table.get_table(cd, values=False)
+    curve_seeds = _stable_source_ids(table.words(cd, "curve_id"))
+    endpoint_seeds = np.zeros(table.n_points, dtype=np.int32)
+    segments, start_idx, end_idx = _segment_ends(table)
+    endpoint_seeds[start_idx] = _stable_source_ids(
+        table.words(cd, "start_point_id")[segments]
+    )
+    endpoint_seeds[end_idx] = _stable_source_ids(
+        table.words(cd, "end_point_id")[segments]
     )
-    endpoint_seeds = np.zeros(len(cd.points), dtype=np.int32)
-
-    for index, curve in enumerate(cd.curves):
-        if type_attr.data[index].value not in (
-            SketchCurveType.LINE,
-            SketchCurveType.ARC,
-        ) or curve.points_length < 2:
-            continue
-        if any(start_ids[index]):
-            endpoint_seeds[curve.points[0].index] = _stable_source_id(
-                start_ids[index]
-            )
-        if any(end_ids[index]):
-            endpoint_seeds[curve.points[curve.points_length - 1].index] = (
-                _stable_source_id(end_ids[index])
-            )
 
     curve_attr.data.foreach_set("value", curve_seeds)
     endpoint_attr.data.foreach_set("value", endpoint_seeds)
     return True
 
 
+def arc_bezier_geometry(first, counts, centers, starts, ends, cyclic):
+    """Bezier control points and handles for a batch of arcs/circles.
+
+    Per curve: the index of its first point, its point count, center, start and
+    end (2D), and whether it is a closed circle. A circle's points are spread
+    from angle 0 and only its start sets the radius; an arc's points are spread
+    evenly from start to end. Degenerate curves (zero radius, no segment, zero
+    sweep) are skipped.
+
+    Returns ``(point_idx, pos, left, right)``: the point-domain indices of the
+    built control points and their (P, 2) positions and left/right handles.
+    """
+    from .constants import FULL_TURN
+
+    first = np.asarray(first, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    cyclic = np.asarray(cyclic, dtype=bool)
+
+    sv = starts - centers
+    ev = ends - centers
+    radius = np.hypot(sv[:, 0], sv[:, 1])
+    start_angle = np.arctan2(sv[:, 1], sv[:, 0])
+    sweep = np.mod(np.arctan2(ev[:, 1], ev[:, 0]) - start_angle + FULL_TURN, FULL_TURN)
+    segments = np.where(cyclic, counts, counts - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        step = np.where(cyclic, FULL_TURN / counts, sweep / segments)
+    start_angle = np.where(cyclic, 0.0, start_angle)
+
+    valid = (radius >= 1e-6) & (segments > 0) & (step != 0)
+    n = counts[valid]
+    # Position of every control point within its curve: 0..n-1 per curve.
+    k = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+    step = np.repeat(step[valid], n)
+    angle = np.repeat(start_angle[valid], n) + step * k
+    r = np.repeat(radius[valid], n)
+
+    direction = np.column_stack((np.cos(angle), np.sin(angle)))
+    pos = np.repeat(centers[valid], n, axis=0) + r[:, None] * direction
+    # Standard bezier circle approximation: the handles sit on the tangent at
+    # 4/3 * tan(step / 4) * r from their point.
+    tangent = ((4 / 3) * np.tan(step / 4) * r)[:, None] * np.column_stack(
+        (-direction[:, 1], direction[:, 0])
+    )
+    point_idx = np.repeat(first[valid], n) + k
+    return point_idx, pos, pos - tangent, pos + tangent
+
+
 def rebuild_segments(sketch, point_ids=None):
     """Rebuild segment curve positions from their referenced point curves.
 
@@ -857,11 +937,12 @@ def rebuild_segments(sketch, point_ids=None):
     ``point_ids`` is given, only segments referencing one of those point ids are
     rebuilt (e.g. during a move, where only the dragged points changed) — this
     avoids re-resolving every segment in the sketch each frame.
-    """
-    from mathutils import Vector
 
+    All of it runs on whole-domain arrays: segment endpoints are looked up in
+    the point curves by id key, and positions and both handle vectors are
+    written back with one foreach_set each.
+    """
     from ..model.constants import SketchCurveType
-    from ..model.curve_ref import _build_arc_bezier
 
     if not sketch or not sketch.target_object or not sketch.target_object.data:
         return
@@ -876,97 +957,129 @@ def rebuild_segments(sketch, point_ids=None):
     # per-point data below is read.
     _resegment_arcs(sketch, cd, point_ids)
 
-    type_attr = cd.attributes.get("sketch_type")
-    if not type_attr:
+    if not cd.attributes.get("sketch_type"):
         return
 
-    # Bulk-read the relationship ids once (get_uuid does 4 attribute lookups
-    # per call, so per-segment reads add up in this per-frame hot path).
-    sp_ids = read_uuid_list(cd, "start_point_id")
-    ep_ids = read_uuid_list(cd, "end_point_id")
-    cp_ids = read_uuid_list(cd, "center_point_id")
-
-    # Map point curve_id -> local 2D position once, so segment endpoints resolve
-    # by dict lookup instead of a PointRef per endpoint (each of which re-resolved
-    # curve data twice). This is the bulk of solve's per-edit cost (issue #342).
-    cid_list = read_uuid_list(cd, "curve_id")
-    point_co = {}
-    for i in range(n):
-        if type_attr.data[i].value == SketchCurveType.POINT:
-            cs = cd.curves[i]
-            if cs.points_length:
-                p = cd.points[cs.points[0].index].position
-                point_co[cid_list[i]] = Vector((p[0], p[1]))
-
-    # Handle attributes are the same collection for every segment; fetch once
-    # rather than re-resolving them by name inside the per-segment loop below.
-    handle_left = cd.attributes.get("handle_left")
-    handle_right = cd.attributes.get("handle_right")
-
-    for i in range(n):
-        ctype = type_attr.data[i].value
-        if ctype == SketchCurveType.POINT:
-            continue
+    table = sketch_table.get_table(cd)
+    types = table.types
+    counts = table.counts
+    scope = _touching(cd, table, point_ids)
+
+    # A native edit can leave a segment with too few points (e.g. an endpoint
+    # deleted in Edit Mode); such degenerate curves are skipped.
+    lines = np.flatnonzero((types == SketchCurveType.LINE) & scope & (counts >= 2))
+    arcs = np.flatnonzero(
+        np.isin(types, (SketchCurveType.ARC, SketchCurveType.CIRCLE))
+        & scope
+        & (counts >= 1)
+    )
+    if len(lines) or len(arcs):
+        _rebuild_segment_geometry(cd, table, lines, arcs)
 
-        # Scoped rebuild: skip segments that don't touch a changed point.
-        if point_ids is not None and not (
-            sp_ids[i] in point_ids or ep_ids[i] in point_ids or cp_ids[i] in point_ids
-        ):
-            continue
+    # Weld ids depend on connectivity (start/end_point_id), not positions, so
+    # only recompute on a full rebuild -- a scoped move leaves topology intact.
+    if point_ids is None:
+        compute_merge_ids(sketch)
 
-        curve_slice = cd.curves[i]
 
-        # A native edit can leave a segment with too few points (e.g. an
-        # endpoint deleted in Edit Mode). Skip such degenerate curves rather
-        # than indexing past their point count.
-        min_points = 2 if ctype == SketchCurveType.LINE else 1
-        if curve_slice.points_length < min_points:
+def _rebuild_segment_geometry(cd, table, lines, arcs):
+    """Write the positions and handles of the curves ``lines`` and ``arcs``
+    (arcs and circles) from their point curves."""
+    from ..model.constants import SketchCurveType
+
+    types = table.types
+    counts = table.counts
+    first = table.first
+
+    # Point curves by id key; endpoints resolve to a row of point_xy.
+    point_curves = np.flatnonzero((types == SketchCurveType.POINT) & (counts > 0))
+    point_keys = table.keys(cd, "curve_id")[point_curves]
+    positions = table.positions
+    point_xy = positions[first[point_curves], :2].astype(np.float64)
+
+    def source(field, curves):
+        return sketch_table.lookup(point_keys, table.keys(cd, field)[curves])
+
+    # Patched in place: ``positions`` is the table's array, so the table stays
+    # in step with what's written.
+    point_idx = []
+    for field, offset in (("start_point_id", 0), ("end_point_id", 1)):
+        rows = source(field, lines)
+        found = rows >= 0
+        idx = first[lines[found]] + offset
+        positions[idx, :2] = point_xy[rows[found]]
+        positions[idx, 2] = 0.0
+        point_idx.append(idx)
+    line_idx = np.concatenate(point_idx)
+
+    cyclic = types[arcs] == SketchCurveType.CIRCLE
+    ct = source("center_point_id", arcs)
+    sp = source("start_point_id", arcs)
+    ep = source("end_point_id", arcs)
+    valid = (ct >= 0) & (cyclic | ((sp >= 0) & (ep >= 0)))
+    arcs, cyclic = arcs[valid], cyclic[valid]
+    ct, sp, ep = ct[valid], sp[valid], ep[valid]
+    # A circle's start and end are its first (edge) point
+    edge = positions[first[arcs], :2]
+    arc_idx, arc_pos, arc_left, arc_right = arc_bezier_geometry(
+        first[arcs],
+        counts[arcs],
+        point_xy[ct],
+        np.where(cyclic[:, None], edge, point_xy[sp]),
+        np.where(cyclic[:, None], edge, point_xy[ep]),
+        cyclic,
+    )
+    positions[arc_idx, :2] = arc_pos
+    positions[arc_idx, 2] = 0.0
+    cd.points.foreach_set("position", positions.ravel())
+
+    # Line handles sit on their points
+    for attr, arc_handles in (
+        (cd.attributes.get("handle_left"), arc_left),
+        (cd.attributes.get("handle_right"), arc_right),
+    ):
+        if not attr:
             continue
+        data = np.empty(table.n_points * 3, dtype=np.float32)
+        attr.data.foreach_get("vector", data)
+        data = data.reshape(-1, 3)
+        data[line_idx] = positions[line_idx]
+        data[arc_idx, :2] = arc_handles
+        data[arc_idx, 2] = 0.0
+        attr.data.foreach_set("vector", data.ravel())
 
-        if ctype == SketchCurveType.LINE:
-            sp_co = point_co.get(sp_ids[i])
-            ep_co = point_co.get(ep_ids[i])
-            hl = handle_left
-            hr = handle_right
-            if sp_co is not None:
-                pos = (sp_co.x, sp_co.y, 0.0)
-                idx = curve_slice.points[0].index
-                cd.points[idx].position = pos
-                if hl:
-                    hl.data[idx].vector = pos
-                if hr:
-                    hr.data[idx].vector = pos
-            if ep_co is not None:
-                pos = (ep_co.x, ep_co.y, 0.0)
-                idx = curve_slice.points[1].index
-                cd.points[idx].position = pos
-                if hl:
-                    hl.data[idx].vector = pos
-                if hr:
-                    hr.data[idx].vector = pos
-
-        elif ctype in (SketchCurveType.ARC, SketchCurveType.CIRCLE):
-            ct_co = point_co.get(cp_ids[i])
-            if ct_co is None:
-                continue
-            is_cyclic = ctype == SketchCurveType.CIRCLE
-            if is_cyclic:
-                edge = Vector(cd.points[curve_slice.points[0].index].position[:2])
-                _build_arc_bezier(cd, i, ct_co, edge, edge, is_cyclic=True)
-            else:
-                s_co = point_co.get(sp_ids[i])
-                e_co = point_co.get(ep_ids[i])
-                if s_co is not None and e_co is not None:
-                    _build_arc_bezier(cd, i, ct_co, s_co, e_co)
 
-    # Weld ids depend on connectivity (start/end_point_id), not positions, so
-    # only recompute on a full rebuild -- a scoped move leaves topology intact.
-    if point_ids is None:
-        compute_merge_ids(sketch)
+# target_object pointer -> _refresh_signature at the last topology rebuild
+_refreshed_topology = {}
 
+# id(curve_data) -> sketch table structure_version the weld ids and seeds were
+# computed from
+_connectivity_version = {}
 
-def refresh_curve_geometry(sketch):
-    """Force GN modifier re-evaluation by doing a topology rebuild."""
+
+def reset_refresh_cache():
+    """Forget the refreshed topologies (pointers don't survive a file load)."""
+    _refreshed_topology.clear()
+    _connectivity_version.clear()
+
+
+def _refresh_signature(curve_data):
+    """Everything a refresh derives data from besides values: curve layout,
+    types and the identity/connectivity fields weld ids and seeds read."""
+    table = sketch_table.get_table(curve_data, values=False)
+    ids = b"".join(table.words(curve_data, field).tobytes() for field in UUID_FIELDS)
+    return (table.n_points, table.counts.tobytes(), table.types.tobytes(), hash(ids))
+
+
+def refresh_curve_geometry(sketch, full=False):
+    """Make the GN modifier re-evaluate after curve data was written in place.
+
+    Writes through ``foreach_set`` don't notify the depsgraph. When only values
+    changed since the last refresh (a solve moving points), tagging the data
+    for an update is enough. A changed topology -- curves or points added or
+    removed, types or connectivity changed -- or ``full`` falls back to a full
+    topology rebuild, which also refreshes weld ids and generated-id seeds.
+    """
     if not sketch or not sketch.target_object or not sketch.target_object.data:
         return
 
@@ -975,6 +1088,20 @@ def refresh_curve_geometry(sketch):
     if n_curves == 0:
         return
 
+    key = sketch.target_object.as_pointer()
+    signature = _refresh_signature(curve_data)
+    if not full and _refreshed_topology.get(key) == signature:
+        curve_data.update_tag()
+        return
+
+    _rebuild_curve_topology(sketch)
+    _refreshed_topology[key] = signature
+
+
+def _rebuild_curve_topology(sketch):
+    """Force GN modifier re-evaluation by doing a topology rebuild."""
+    curve_data = sketch.target_object.data
+
     # Refresh weld ids before the rebuild so they're saved/restored current; this
     # is the sync point right before the GN convert re-evaluates.
     compute_merge_ids(sketch)
@@ -984,61 +1111,9 @@ def refresh_curve_geometry(sketch):
     # programmatic group in place.
     _get_convert_node_group()
 
-    n_points = len(curve_data.points)
-    point_counts = np.zeros(n_curves, dtype=np.int32)
-    curve_data.curves.foreach_get("points_length", point_counts)
-
-    positions = np.zeros(n_points * 3, dtype=np.float32)
-    curve_data.points.foreach_get("position", positions)
-
-    saved_attrs = {}
-    for attr in curve_data.attributes:
-        if attr.name == "position":
-            continue
-        domain_len = n_points if attr.domain == "POINT" else n_curves
-        if attr.data_type == "FLOAT_VECTOR":
-            data = np.zeros(domain_len * 3, dtype=np.float32)
-            attr.data.foreach_get("vector", data)
-        elif attr.data_type == "BOOLEAN":
-            data = np.zeros(domain_len, dtype=np.bool_)
-            attr.data.foreach_get("value", data)
-        elif attr.data_type in ("INT", "INT8"):
-            data = np.zeros(domain_len, dtype=np.int32)
-            attr.data.foreach_get("value", data)
-        elif attr.data_type in ("INT32_2D", "INT16_2D"):
-            data = np.zeros(domain_len * 2, dtype=np.int32)
-            attr.data.foreach_get("value", data)
-        elif attr.data_type == "FLOAT":
-            data = np.zeros(domain_len, dtype=np.float32)
-            attr.data.foreach_get("value", data)
-        elif attr.data_type == "STRING":
-            data = [attr.data[i].value for i in range(domain_len)]
-        else:
-            continue
-        saved_attrs[attr.name] = {
-            "data": data,
-            "type": attr.data_type,
-            "domain": attr.domain,
-        }
-
-    curve_data.remove_curves()
-    curve_data.add_curves(point_counts.tolist())
-    curve_data.set_types(type="BEZIER")
+    snapshot = CurveDataSnapshot(curve_data)
+    snapshot.restore(curve_data, rebuild=True)
+    snapshot.release()
     ensure_standard_attributes(curve_data)
 
-    curve_data.points.foreach_set("position", positions)
-    for name, info in saved_attrs.items():
-        attr = curve_data.attributes.get(name)
-        if not attr:
-            attr = curve_data.attributes.new(
-                name, type=info["type"], domain=info["domain"]
-            )
-        if info["type"] == "STRING":
-            for i, v in enumerate(info["data"]):
-                attr.data[i].value = v
-        elif info["type"] == "FLOAT_VECTOR":
-            attr.data.foreach_set("vector", info["data"])
-        else:
-            attr.data.foreach_set("value", info["data"])
-
     invalidate_curve_id_cache(sketch)
@@ -0,0 +1,254 @@
+"""Capture and restore a Curves datablock's geometry and attributes.
+
+Used by the stateful operators' undo snapshots (restored on every mouse move
+while previewing) and by the topology rebuild of ``refresh_curve_geometry``.
+Array buffers come from a pool keyed by dtype and size: a sketch's attribute
+arrays have the same handful of sizes call after call, so a released
+snapshot's buffers are reused by the next capture instead of reallocated.
+
+STRING attributes have no ``foreach_get``; their values are read in one pass
+and kept as a single bytes blob plus lengths.
+
+A snapshot can be limited to some curve attributes (a delta snapshot of what
+an operator writes), and restoring in place only writes the arrays that differ.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# data_type -> (foreach property, dtype, components)
+_LAYOUTS = {
+    "FLOAT_VECTOR": ("vector", np.float32, 3),
+    "FLOAT": ("value", np.float32, 1),
+    "BOOLEAN": ("value", np.bool_, 1),
+    "INT": ("value", np.int32, 1),
+    "INT8": ("value", np.int32, 1),
+    "INT32_2D": ("value", np.int32, 2),
+    "INT16_2D": ("value", np.int32, 2),
+}
+
+# Free buffers kept per (dtype, size)
+POOL_DEPTH = 4
+
+
+class BufferPool:
+    """Reusable NumPy buffers keyed by dtype and size."""
+
+    def __init__(self, depth=POOL_DEPTH):
+        self.depth = depth
+        self._free = {}
+        self.allocations = 0
+
+    def take(self, dtype, size):
+        """A buffer of ``size`` elements; its contents are undefined."""
+        free = self._free.get((np.dtype(dtype), size))
+        if free:
+            return free.pop()
+        self.allocations += 1
+        return np.empty(size, dtype=dtype)
+
+    def give(self, buffer):
+        """Return a buffer taken from this pool once it's no longer used."""
+        free = self._free.setdefault((buffer.dtype, buffer.size), [])
+        if len(free) < self.depth:
+            free.append(buffer)
+
+    @property
+    def nbytes(self):
+        return sum(b.nbytes for free in self._free.values() for b in free)
+
+    def clear(self):
+        self._free.clear()
+
+
+pool = BufferPool()
+
+
+class _StringData:
+    __slots__ = ("blob", "lengths")
+
+    def __init__(self, values):
+        values = [v.encode() if isinstance(v, str) else v for v in values]
+        self.blob = b"".join(values)
+        self.lengths = np.fromiter(map(len, values), dtype=np.int32, count=len(values))
+
+    def values(self):
+        ends = np.cumsum(self.lengths).tolist()
+        blob = self.blob
+        start = 0
+        out = []
+        for end in ends:
+            out.append(blob[start:end])
+            start = end
+        return out
+
+    @property
+    def nbytes(self):
+        return len(self.blob) + self.lengths.nbytes
+
+
+class CurveDataSnapshot:
+    """Geometry and attributes of a Curves datablock at one point in time."""
+
+    __slots__ = (
+        "n_curves",
+        "point_counts",
+        "positions",
+        "attributes",
+        "partial",
+        "_pool",
+    )
+
+    def __init__(self, curve_data=None, pool=pool, attributes=None):
+        self._pool = pool
+        self.n_curves = 0
+        self.point_counts = None
+        self.positions = None
+        # name -> (data_type, domain, array or _StringData)
+        self.attributes = {}
+        self.partial = False
+        if curve_data is not None:
+            self.capture(curve_data, attributes)
+
+    def capture(self, curve_data, attributes=None):
+        """Read ``curve_data``, reusing this snapshot's buffers if it held any.
+
+        ``attributes`` limits the snapshot's curve-domain attributes to these
+        names. Point positions and counts and the other point attributes are
+        always included, so such a snapshot can still undo a change of point
+        counts (a solve re-segmenting an arc), but not of the curves.
+        """
+        self.release()
+        self.partial = attributes is not None
+        n_curves = len(curve_data.curves)
+        self.n_curves = n_curves
+        if n_curves == 0:
+            return self
+
+        take = self._pool.take
+        n_points = len(curve_data.points)
+        self.point_counts = take(np.int32, n_curves)
+        curve_data.curves.foreach_get("points_length", self.point_counts)
+        self.positions = take(np.float32, n_points * 3)
+        curve_data.points.foreach_get("position", self.positions)
+
+        for attr in curve_data.attributes:
+            if attr.name == "position":
+                continue
+            if self.partial and attr.domain != "POINT" and attr.name not in attributes:
+                continue
+            if attr.data_type == "STRING":
+                data = _StringData([d.value for d in attr.data])
+            else:
+                layout = _LAYOUTS.get(attr.data_type)
+                if layout is None:
+                    continue
+                prop, dtype, width = layout
+                domain_len = n_points if attr.domain == "POINT" else n_curves
+                data = take(dtype, domain_len * width)
+                attr.data.foreach_get(prop, data)
+            self.attributes[attr.name] = (attr.data_type, attr.domain, data)
+        return self
+
+    def restore(self, curve_data, rebuild=False):
+        """Write the snapshot back to ``curve_data``.
+
+        The curves are only removed and re-added when the topology differs
+        (or ``rebuild``); otherwise only the arrays that changed are written.
+        Returns False if a partial snapshot couldn't be restored because
+        curves were added or removed.
+        """
+        if self.n_curves == 0:
+            if len(curve_data.curves) == 0:
+                return True
+            if self.partial:
+                return self._topology_changed()
+            curve_data.remove_curves()
+            return True
+
+        counts = self.point_counts
+        same_topology = (
+            not rebuild
+            and len(curve_data.curves) == self.n_curves
+            and len(curve_data.points) == int(counts.sum())
+        )
+        if same_topology:
+            current = self._pool.take(np.int32, self.n_curves)
+            curve_data.curves.foreach_get("points_length", current)
+            same_topology = np.array_equal(current, counts)
+            self._pool.give(current)
+
+        if not same_topology and self.partial:
+            if len(curve_data.curves) != self.n_curves:
+                return self._topology_changed()
+            # Only point counts differ: resizing keeps the curve domain, and
+            # the snapshot has everything of the point domain to write back
+            curve_data.resize_curves(counts.tolist())
+        elif not same_topology:
+            if len(curve_data.curves) > 0:
+                curve_data.remove_curves()
+            curve_data.add_curves(counts.tolist())
+            curve_data.set_types(type="BEZIER")
+
+        if not same_topology or self._changed(
+            curve_data.points, "position", self.positions
+        ):
+            curve_data.points.foreach_set("position", self.positions)
+
+        for name, (data_type, domain, data) in self.attributes.items():
+            attr = curve_data.attributes.get(name)
+            if not attr:
+                attr = curve_data.attributes.new(name, type=data_type, domain=domain)
+            if data_type == "STRING":
+                items = attr.data
+                for i, value in enumerate(data.values()):
+                    # Only the text that changed; assigning is per item
+                    if not same_topology or items[i].value != value:
+                        items[i].value = value
+            else:
+                prop = _LAYOUTS[data_type][0]
+                if not same_topology or self._changed(attr.data, prop, data):
+                    attr.data.foreach_set(prop, data)
+
+        curve_data.update_tag()
+        return True
+
+    def _topology_changed(self):
+        logger.warning("Can't restore a partial snapshot: curves changed")
+        return False
+
+    def _changed(self, collection, prop, data):
+        current = self._pool.take(data.dtype, data.size)
+        try:
+            collection.foreach_get(prop, current)
+            return not np.array_equal(current, data)
+        finally:
+            self._pool.give(current)
+
+    def release(self):
+        """Hand the buffers back to the pool; the snapshot is empty afterwards."""
+        give = self._pool.give
+        for array in (self.point_counts, self.positions):
+            if array is not None:
+                give(array)
+        for _type, _domain, data in self.attributes.values():
+            if isinstance(data, np.ndarray):
+                give(data)
+        self.n_curves = 0
+        self.point_counts = None
+        self.positions = None
+        self.attributes = {}
+
+    @property
+    def nbytes(self):
+        """Memory held by the snapshot's data."""
+        total = 0
+        for array in (self.point_counts, self.positions):
+            if array is not None:
+                total += array.nbytes
+        for _type, _domain, data in self.attributes.values():
+            total += data.nbytes
+        return total
@@ -3,6 +3,7 @@ from ..model.sketch_ref import get_active_constraints
 from bpy.types import PropertyGroup, Context, Event
 
 from ..drawing import selection
+from .sketch_table import to_key
 
 
 class HighlightElement:
@@ -59,12 +60,14 @@ class HighlightElement:
             if c:
                 selection.highlight_constraint = c
                 if members:
-                    selection.highlight_curve_ids = c.curve_id_placements()
+                    selection.highlight_curve_ids = [
+                        to_key(cid) for cid in c.curve_id_placements()
+                    ]
         else:
             # Entity operator: highlight the referenced curve.
             cid = properties.curve_id if has_curve_id else properties.index
             if isinstance(cid, str) and cid:
-                selection.highlight_curve_ids = [cid]
+                selection.highlight_curve_ids = [to_key(cid)]
 
         if context.area:
             context.area.tag_redraw()
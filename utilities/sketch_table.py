@@ -0,0 +1,253 @@
+"""Columnar view of a sketch's Curves datablock.
+
+The draw, pick, solve and segment-rebuild paths all need the same per-curve
+arrays -- types, point offsets, flags, identity words, positions -- and each
+used to read them from RNA on its own. ``get_table`` reads them in bulk into
+a ``SketchTable`` that those paths share.
+
+Two kinds of column, with different lifetimes:
+
+- Structure (types, point counts and offsets, identity words) only changes
+  when curves are added, removed, resized or re-identified. It is kept until
+  ``invalidate`` -- called by ``invalidate_curve_id_cache`` and ``set_uuid``,
+  the same events that drop the uuid list caches -- or until the curve or
+  point count no longer matches.
+- Values (positions and the construction/fixed/visible/cyclic flags) change
+  all the time through plain attribute writes. They are re-read on every
+  ``get_table`` call, except inside a ``frame()`` block: there one read serves
+  every consumer until the block ends (or ``values_changed``). Use a frame for
+  read-only passes, like drawing the overlay.
+
+Every (re)load bumps the table's ``version``, so consumers can tell whether
+anything was re-read since they last looked. ``structure_version`` is the
+version the structure columns were read at; work that only depends on
+connectivity can be skipped while it is unchanged.
+
+Identity fields are also available as keys: the 128-bit id as an unsigned int,
+0 when unset. ``keys`` holds them as a structured ``KEY_DTYPE`` array for
+vectorized set tests (``keys_in``), ``key_list`` as Python ints for dicts and
+sets. Hex strings are only needed where ids meet RNA properties and the UI.
+"""
+
+import itertools
+from contextlib import contextmanager
+
+import numpy as np
+
+FLAGS = ("construction", "fixed", "visible", "cyclic")
+
+# A 128-bit id as its low and high 64-bit halves
+KEY_DTYPE = np.dtype([("lo", "<u8"), ("hi", "<u8")])
+
+_MASK64 = (1 << 64) - 1
+
+# Flags that are True for curves without the attribute
+_FLAG_DEFAULTS = {"visible": True}
+
+_versions = itertools.count(1)
+
+# id(curve_data) -> SketchTable, same keying as the uuid list caches
+_tables = {}
+
+_frame_depth = 0
+_frame_epoch = 0
+
+
+class SketchTable:
+    """NumPy columns of one Curves datablock."""
+
+    __slots__ = (
+        "n_curves",
+        "n_points",
+        "types",
+        "counts",
+        "first",
+        "positions",
+        "flags",
+        "version",
+        "structure_version",
+        "_words",
+        "_keys",
+        "_values_epoch",
+    )
+
+    def __init__(self, curve_data):
+        n_curves = len(curve_data.curves)
+        self.n_curves = n_curves
+        self.n_points = len(curve_data.points)
+
+        self.types = np.full(n_curves, -1, dtype=np.int32)
+        type_attr = curve_data.attributes.get("sketch_type")
+        if type_attr is not None and n_curves:
+            type_attr.data.foreach_get("value", self.types)
+
+        self.counts = np.zeros(n_curves, dtype=np.int32)
+        if n_curves:
+            curve_data.curves.foreach_get("points_length", self.counts)
+        self.first = np.zeros(n_curves, dtype=np.int64)
+        if n_curves:
+            np.cumsum(self.counts[:-1], out=self.first[1:])
+
+        # field -> (n, 4) int32 identity words, read on first use
+        self._words = {}
+        # field -> (KEY_DTYPE array, list of ints)
+        self._keys = {}
+        self.positions = None
+        self.flags = {}
+        self._values_epoch = None
+        self.version = next(_versions)
+        self.structure_version = self.version
+
+    def matches(self, curve_data):
+        return (
+            len(curve_data.curves) == self.n_curves
+            and len(curve_data.points) == self.n_points
+        )
+
+    def load_values(self, curve_data):
+        """Re-read positions and flags."""
+        positions = np.empty(self.n_points * 3, dtype=np.float32)
+        if self.n_points:
+            curve_data.points.foreach_get("position", positions)
+        self.positions = positions.reshape(-1, 3)
+
+        for name in FLAGS:
+            column = np.full(self.n_curves, _FLAG_DEFAULTS.get(name, False), bool)
+            attr = curve_data.attributes.get(name)
+            if attr is not None and self.n_curves:
+                attr.data.foreach_get("value", column)
+            self.flags[name] = column
+        self._values_epoch = _frame_epoch if _frame_depth else None
+        self.version = next(_versions)
+
+    def words(self, curve_data, field):
+        """Identity field ``field`` as an (n, 4) int32 array of its words
+        (lo0, lo1, hi0, hi1); all zero where unset."""
+        words = self._words.get(field)
+        if words is None:
+            words = np.zeros((self.n_curves, 4), dtype=np.int32)
+            lo = curve_data.attributes.get(f".{field}_lo")
+            hi = curve_data.attributes.get(f".{field}_hi")
+            if lo and hi and self.n_curves:
+                buf = np.empty(self.n_curves * 2, dtype=np.int32)
+                lo.data.foreach_get("value", buf)
+                words[:, :2] = buf.reshape(-1, 2)
+                hi.data.foreach_get("value", buf)
+                words[:, 2:] = buf.reshape(-1, 2)
+            self._words[field] = words
+        return words
+
+    def keys(self, curve_data, field):
+        """Identity field ``field`` as a ``KEY_DTYPE`` array."""
+        return self._key_columns(curve_data, field)[0]
+
+    def key_list(self, curve_data, field):
+        """Identity field ``field`` as Python ints (0 where unset)."""
+        return self._key_columns(curve_data, field)[1]
+
+    def _key_columns(self, curve_data, field):
+        columns = self._keys.get(field)
+        if columns is None:
+            words = self.words(curve_data, field).view(np.uint32).astype(np.uint64)
+            keys = np.empty(self.n_curves, dtype=KEY_DTYPE)
+            keys["lo"] = words[:, 0] | (words[:, 1] << np.uint64(32))
+            keys["hi"] = words[:, 2] | (words[:, 3] << np.uint64(32))
+            key_list = [
+                hi << 64 | lo
+                for lo, hi in zip(keys["lo"].tolist(), keys["hi"].tolist())
+            ]
+            columns = self._keys[field] = (keys, key_list)
+        return columns
+
+    @staticmethod
+    def ids(curve_data, field="curve_id"):
+        """Identity field ``field`` as hex strings (see ``read_uuid_list``)."""
+        from .curve_data import read_uuid_list
+
+        return read_uuid_list(curve_data, field)
+
+    def point_positions(self):
+        """Position of each curve's first point, (n_curves, 3)."""
+        if not self.n_points:
+            return np.zeros((self.n_curves, 3), dtype=np.float32)
+        first = np.minimum(self.first, self.n_points - 1)
+        return self.positions[first]
+
+
+def to_key(curve_id):
+    """Key of a hex id (or a key already); 0 for an empty id."""
+    if isinstance(curve_id, int):
+        return curve_id
+    return int(curve_id, 16) if curve_id else 0
+
+
+def to_hex(key):
+    """Hex form of a key, as stored in RNA properties ('' when unset)."""
+    return f"{key:032x}" if key else ""
+
+
+def key_array(curve_ids):
+    """``KEY_DTYPE`` array of hex ids or keys."""
+    keys = [to_key(cid) for cid in curve_ids]
+    out = np.empty(len(keys), dtype=KEY_DTYPE)
+    out["lo"] = [k & _MASK64 for k in keys]
+    out["hi"] = [k >> 64 for k in keys]
+    return out
+
+
+def keys_in(keys, curve_ids):
+    """Mask of the entries of ``keys`` that are in ``curve_ids``."""
+    return np.isin(keys, key_array(curve_ids))
+
+
+def lookup(keys, query):
+    """Row of each ``query`` key in ``keys``; -1 where absent or unset."""
+    rows = np.full(len(query), -1, dtype=np.int64)
+    if not len(keys) or not len(query):
+        return rows
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    pos = np.minimum(np.searchsorted(ordered, query), len(keys) - 1)
+    found = (ordered[pos] == query) & ((query["lo"] != 0) | (query["hi"] != 0))
+    rows[found] = order[pos[found]]
+    return rows
+
+
+def get_table(curve_data, values=True):
+    """The ``SketchTable`` of ``curve_data``, with current values unless
+    ``values`` is False (structure columns only)."""
+    key = id(curve_data)
+    table = _tables.get(key)
+    if table is None or not table.matches(curve_data):
+        table = _tables[key] = SketchTable(curve_data)
+    if values and not (_frame_depth and table._values_epoch == _frame_epoch):
+        table.load_values(curve_data)
+    return table
+
+
+@contextmanager
+def frame():
+    """Share value columns between all reads in the block."""
+    global _frame_depth, _frame_epoch
+    if not _frame_depth:
+        _frame_epoch += 1
+    _frame_depth += 1
+    try:
+        yield
+    finally:
+        _frame_depth -= 1
+
+
+def values_changed(curve_data):
+    """Positions or flags of ``curve_data`` were written inside a frame."""
+    table = _tables.get(id(curve_data))
+    if table is not None:
+        table._values_epoch = None
+
+
+def invalidate(curve_data=None):
+    """Drop the table of ``curve_data`` (all tables if None)."""
+    if curve_data is None:
+        _tables.clear()
+    else:
+        _tables.pop(id(curve_data), None)
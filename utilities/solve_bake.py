@@ -0,0 +1,226 @@
+"""Baked solves of a frame range, stored in a sidecar file next to the .blend.
+
+Headless renders (``blender -b``) run every frame once, so the in-memory solve
+cache never gets a hit there. Baking solves a frame range ahead of time and
+writes each sketch's solved geometry per frame to ``<blend>.slvs_bake.npz``;
+``on_frame_change`` then restores a baked frame instead of solving it.
+
+A baked frame is only used while it still matches the sketch: the file stores
+a signature of each sketch's constraints (types, references and settings) and,
+per frame, the solve cache key of the inputs (dimension values and fixed or
+projected positions, see ``solve_cache.solve_key``). Anything that differs
+falls back to solving.
+
+Point counts can change between frames (arcs are resegmented by their sweep
+angle), so geometry is stored flat with per-frame offsets, along with each
+frame's point count per curve; restoring a frame resizes the arcs to match.
+"""
+
+import hashlib
+import os
+
+import bpy
+import numpy as np
+
+from ..curve_solver import solve_generation
+from . import solve_cache
+
+SUFFIX = ".slvs_bake.npz"
+
+# Not part of a constraint's structure: display state, solver feedback and
+# the dimension value itself (covered by the per-frame key).
+_SIGNATURE_SKIP = {"rna_type", "name", "failed", "visible", "value"}
+
+# (path, mtime) and the loaded bake: sketch name -> _SketchBake
+_loaded = (None, None)
+_bakes = {}
+
+# target_object pointer -> solve generation the signature was last checked at
+_signature_checked = {}
+
+# While baking: sketch name -> list of per-frame records
+_recording = None
+
+
+def bake_path():
+    """Sidecar path for the current .blend, None while it's unsaved."""
+    if not bpy.data.filepath:
+        return None
+    return bpy.data.filepath + SUFFIX
+
+
+def constraints_signature(sketch):
+    """Digest of the constraint structure of ``sketch``."""
+    h = hashlib.blake2b(digest_size=16)
+    for c in sketch.target_object.data.sketch_constraints.all:
+        h.update(type(c).__name__.encode())
+        for prop in c.bl_rna.properties:
+            if prop.identifier in _SIGNATURE_SKIP or prop.type in {
+                "POINTER",
+                "COLLECTION",
+            }:
+                continue
+            value = getattr(c, prop.identifier)
+            if getattr(prop, "is_array", False):
+                value = tuple(value)
+            h.update(f"{prop.identifier}={value!r};".encode())
+    return h.digest()
+
+
+class _SketchBake:
+    def __init__(self, data, prefix):
+        self.signature = data[prefix + "signature"].tobytes()
+        self.keys = data[prefix + "keys"]
+        self.offsets = data[prefix + "offsets"]
+        self.positions = data[prefix + "positions"]
+        # (frames, curves); missing in bakes written before counts were stored
+        self.counts = data.get(prefix + "counts")
+        self.handles = data.get(prefix + "handles")
+        self.states = data[prefix + "states"]
+        self.dofs = data[prefix + "dofs"]
+        self.oks = data[prefix + "oks"]
+        self.rows = {int(f): i for i, f in enumerate(data[prefix + "frames"])}
+
+    def entry(self, row):
+        a, b = self.offsets[row], self.offsets[row + 1]
+        handles = None
+        if self.handles is not None:
+            handles = (self.handles[0, a:b], self.handles[1, a:b])
+        return solve_cache._Entry(
+            self.positions[a:b],
+            None if self.counts is None else self.counts[row],
+            handles,
+            str(self.states[row]),
+            int(self.dofs[row]),
+            bool(self.oks[row]),
+        )
+
+
+def _load():
+    """The bake for the current file (reloaded when the file changes)."""
+    global _loaded, _bakes
+    path = bake_path()
+    mtime = None
+    if path and os.path.exists(path):
+        mtime = os.path.getmtime(path)
+    if (path, mtime) == _loaded:
+        return _bakes
+
+    _loaded = (path, mtime)
+    _bakes = {}
+    _signature_checked.clear()
+    if mtime is None:
+        return _bakes
+    with np.load(path) as npz:
+        data = {name: npz[name] for name in npz.files}
+    for i, name in enumerate(data["sketches"]):
+        _bakes[str(name)] = _SketchBake(data, f"s{i}_")
+    return _bakes
+
+
+def lookup(context, scene, sketch):
+    """Restore ``sketch`` from the bake for the current frame.
+
+    Returns the baked solve result, or None when there is no valid baked
+    frame and the sketch has to be solved.
+    """
+    if _recording is not None:
+        return None
+    bake = _load().get(sketch.target_object.name)
+    if bake is None:
+        return None
+    row = bake.rows.get(scene.frame_current)
+    if row is None:
+        return None
+
+    ptr = sketch.target_object.as_pointer()
+    # Constraints only change through edits, and those solve
+    if _signature_checked.get(ptr) != solve_generation(sketch):
+        if constraints_signature(sketch) != bake.signature:
+            return None
+        _signature_checked[ptr] = solve_generation(sketch)
+
+    if solve_cache.solve_key(scene, sketch) != bake.keys[row].tobytes():
+        return None
+    entry = bake.entry(row)
+    if not solve_cache._apply(context, sketch, entry):
+        return None
+    return entry.ok
+
+
+def record(scene, solved):
+    """Called with the ``(sketch, ok)`` results of each frame's solve."""
+    if _recording is None:
+        return
+    for sketch, ok in solved:
+        if not sketch.target_object:
+            continue
+        cd = sketch.target_object.data
+        n = len(cd.points) * 3
+        positions = np.empty(n, dtype=np.float32)
+        cd.points.foreach_get("position", positions)
+        counts = np.empty(len(cd.curves), dtype=np.int32)
+        cd.curves.foreach_get("points_length", counts)
+        hl = cd.attributes.get("handle_left")
+        hr = cd.attributes.get("handle_right")
+        handles = None
+        if hl and hr:
+            handles = np.empty((2, n), dtype=np.float32)
+            hl.data.foreach_get("vector", handles[0])
+            hr.data.foreach_get("vector", handles[1])
+        _recording.setdefault(sketch.target_object.name, []).append(
+            (
+                scene.frame_current,
+                solve_cache.solve_key(scene, sketch),
+                positions,
+                counts,
+                handles,
+                sketch.solver_state,
+                sketch.dof,
+                ok,
+            )
+        )
+
+
+def begin():
+    global _recording
+    _recording = {}
+
+
+def end(scene, path):
+    """Stop recording and write what was recorded to ``path``."""
+    global _recording
+    recorded, _recording = _recording, None
+
+    from ..model.sketch_ref import get_sketches
+
+    signatures = {
+        s.target_object.name: constraints_signature(s)
+        for s in get_sketches(scene)
+        if s.target_object
+    }
+    arrays = {}
+    names = [name for name in recorded if name in signatures]
+    for i, name in enumerate(names):
+        frames, keys, positions, counts, handles, states, dofs, oks = zip(
+            *recorded[name]
+        )
+        p = f"s{i}_"
+        arrays[p + "signature"] = np.frombuffer(signatures[name], dtype=np.uint8)
+        arrays[p + "frames"] = np.array(frames, dtype=np.int32)
+        arrays[p + "keys"] = np.array([np.frombuffer(k, dtype=np.uint8) for k in keys])
+        arrays[p + "offsets"] = np.concatenate(
+            ([0], np.cumsum([len(pos) for pos in positions]))
+        ).astype(np.int64)
+        arrays[p + "positions"] = np.concatenate(positions)
+        # The curves don't change while baking (the key covers them)
+        arrays[p + "counts"] = np.stack(counts)
+        if all(h is not None for h in handles):
+            arrays[p + "handles"] = np.concatenate(handles, axis=1)
+        arrays[p + "states"] = np.array(states)
+        arrays[p + "dofs"] = np.array(dofs, dtype=np.int32)
+        arrays[p + "oks"] = np.array(oks, dtype=bool)
+    arrays["sketches"] = np.array(names, dtype=str)
+
+    np.savez_compressed(path, **arrays)
+    return len(names)
@@ -0,0 +1,249 @@
+"""Per-sketch LRU cache of animation solves.
+
+``on_frame_change`` re-solves every sketch on every frame so driven/animated
+dimensions (``scene["slvs:c:{uid}"]``) update. Scrubbing back over frames that
+were already solved repeats identical work: the solve inputs -- the dimension
+values and the positions of fixed (incl. projected) points -- are the same, so
+the result is too. This caches the solved point positions per sketch, keyed by
+a hash of those inputs, so a hit is a ``foreach_set`` instead of a solve.
+
+Free geometry isn't part of the key; it's what the solve produces. That
+includes the point counts of arcs (resegmented by their sweep angle), which a
+hit resizes back to the cached ones. Any solve the cache didn't run itself (an
+edit, a drag, ...) can change that result, so it empties the sketch's cache
+(see ``curve_solver.solve_generation``).
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from ..curve_solver import _sync_legacy_entities, solve_generation
+from ..model.constants import SketchCurveType
+from .curve_data import _resize_arcs, read_curve_id_list
+
+DEFAULT_CAP_MB = 64
+
+
+class _Entry:
+    __slots__ = (
+        "positions",
+        "counts",
+        "handles",
+        "solver_state",
+        "dof",
+        "ok",
+        "nbytes",
+    )
+
+    def __init__(self, positions, counts, handles, solver_state, dof, ok):
+        self.positions = positions
+        # Point count per curve, None if unknown
+        self.counts = counts
+        self.handles = handles
+        self.solver_state = solver_state
+        self.dof = dof
+        self.ok = ok
+        self.nbytes = positions.nbytes + sum(h.nbytes for h in handles or ())
+        if counts is not None:
+            self.nbytes += counts.nbytes
+
+
+class SolveCache:
+    """LRU of solved geometry for one sketch."""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        # solve_generation the entries are valid for
+        self.generation = None
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old.nbytes
+        self.entries[key] = entry
+        self.nbytes += entry.nbytes
+
+    def pop_oldest(self):
+        _key, entry = self.entries.popitem(last=False)
+        self.nbytes -= entry.nbytes
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+
+# target_object pointer -> SolveCache
+_caches = {}
+
+
+def _cap_bytes():
+    from .preferences import get_prefs
+
+    try:
+        mb = get_prefs().solve_cache_mb
+    except (AttributeError, KeyError):
+        mb = DEFAULT_CAP_MB
+    return mb * 1024 * 1024
+
+
+def solve_key(scene, sketch):
+    """Hash of everything a solve's result depends on besides the previous
+    (warm-start) state: topology, dimension values and fixed positions."""
+    cd = sketch.target_object.data
+    n_curves = len(cd.curves)
+    n_points = len(cd.points)
+
+    h = hashlib.blake2b(digest_size=16)
+    # Not the point count: the solve changes it by resegmenting arcs
+    h.update(np.array((n_curves,), dtype=np.int64).tobytes())
+    h.update("".join(read_curve_id_list(cd)).encode())
+
+    values = []
+    for c in cd.sketch_constraints.all:
+        uid = getattr(c, "constraint_uid", "")
+        value = scene.get(f"slvs:c:{uid}") if uid else None
+        values.append(float("nan") if value is None else float(value))
+    h.update(np.array(values, dtype=np.float64).tobytes())
+
+    type_attr = cd.attributes.get("sketch_type")
+    fixed_attr = cd.attributes.get("fixed")
+    if n_curves and type_attr and fixed_attr:
+        types = np.empty(n_curves, dtype=np.int32)
+        type_attr.data.foreach_get("value", types)
+        fixed = np.zeros(n_curves, dtype=bool)
+        fixed_attr.data.foreach_get("value", fixed)
+        counts = np.empty(n_curves, dtype=np.int32)
+        cd.curves.foreach_get("points_length", counts)
+        first = np.zeros(n_curves, dtype=np.int64)
+        np.cumsum(counts[:-1], out=first[1:])
+        positions = np.empty(n_points * 3, dtype=np.float32)
+        cd.points.foreach_get("position", positions)
+        anchors = first[fixed & (types == SketchCurveType.POINT)]
+        h.update(positions.reshape(-1, 3)[anchors].tobytes())
+    return h.digest()
+
+
+def _has_round_curves(cd):
+    type_attr = cd.attributes.get("sketch_type")
+    if not type_attr or not len(cd.curves):
+        return False
+    types = np.empty(len(cd.curves), dtype=np.int32)
+    type_attr.data.foreach_get("value", types)
+    return bool(np.isin(types, (SketchCurveType.ARC, SketchCurveType.CIRCLE)).any())
+
+
+def _capture(sketch, ok):
+    cd = sketch.target_object.data
+    n = len(cd.points) * 3
+    positions = np.empty(n, dtype=np.float32)
+    cd.points.foreach_get("position", positions)
+    counts = np.empty(len(cd.curves), dtype=np.int32)
+    cd.curves.foreach_get("points_length", counts)
+    handles = None
+    hl = cd.attributes.get("handle_left")
+    hr = cd.attributes.get("handle_right")
+    # Line handles sit on their points; only arcs/circles need theirs kept.
+    if hl and hr and _has_round_curves(cd):
+        handles = (np.empty(n, dtype=np.float32), np.empty(n, dtype=np.float32))
+        hl.data.foreach_get("vector", handles[0])
+        hr.data.foreach_get("vector", handles[1])
+    return _Entry(positions, counts, handles, sketch.solver_state, sketch.dof, ok)
+
+
+def _match_counts(cd, entry):
+    """Resize the curves of ``cd`` to the point counts of ``entry``.
+
+    Arcs resegmented since ``entry`` was taken (their point count follows the
+    sweep angle) are resized back. Returns False if the curves can't be
+    matched: a different number of them, or no counts stored.
+    """
+    if entry.counts is None or len(cd.curves) != len(entry.counts):
+        return False
+    current = np.empty(len(cd.curves), dtype=np.int32)
+    cd.curves.foreach_get("points_length", current)
+    changed = np.flatnonzero(current != entry.counts).tolist()
+    if changed:
+        _resize_arcs(cd, entry.counts.tolist(), changed)
+    return len(cd.points) * 3 == len(entry.positions)
+
+
+def _apply(context, sketch, entry):
+    cd = sketch.target_object.data
+    if not _match_counts(cd, entry):
+        return False
+    cd.points.foreach_set("position", entry.positions)
+    if entry.handles is not None:
+        cd.attributes["handle_left"].data.foreach_set("vector", entry.handles[0])
+        cd.attributes["handle_right"].data.foreach_set("vector", entry.handles[1])
+    sketch.solver_state = entry.solver_state
+    sketch.dof = entry.dof
+    _sync_legacy_entities(context, sketch)
+    return True
+
+
+def lookup(context, scene, sketch):
+    """Try to restore ``sketch`` from the cache for the current inputs.
+
+    Returns ``(ok, key)``: ``ok`` is the cached solve result on a hit and None
+    on a miss, ``key`` is what to pass to ``store`` after solving a miss (None
+    when caching is disabled).
+    """
+    if _cap_bytes() <= 0:
+        return None, None
+    ptr = sketch.target_object.as_pointer()
+    cache = _caches.setdefault(ptr, SolveCache())
+    if cache.generation != solve_generation(sketch):
+        cache.clear()
+        cache.generation = solve_generation(sketch)
+
+    key = solve_key(scene, sketch)
+    entry = cache.get(key)
+    if entry is not None and _apply(context, sketch, entry):
+        return entry.ok, key
+    return None, key
+
+
+def store(sketch, key, ok):
+    """Cache the solved state of ``sketch`` under ``key`` (from ``lookup``)."""
+    if key is None:
+        return
+    cache = _caches.setdefault(sketch.target_object.as_pointer(), SolveCache())
+    cache.put(key, _capture(sketch, ok))
+    cache.generation = solve_generation(sketch)
+
+    cap = _cap_bytes()
+    total = sum(c.nbytes for c in _caches.values())
+    while total > cap:
+        largest = max(_caches.values(), key=lambda c: c.nbytes)
+        before = largest.nbytes
+        largest.pop_oldest()
+        total -= before - largest.nbytes
+
+
+def stats():
+    """Totals over all sketches: hits, misses, entries and bytes held."""
+    caches = _caches.values()
+    return {
+        "hits": sum(c.hits for c in caches),
+        "misses": sum(c.misses for c in caches),
+        "entries": sum(len(c.entries) for c in caches),
+        "nbytes": sum(c.nbytes for c in caches),
+    }
+
+
+def clear():
+    _caches.clear()
@@ -0,0 +1,115 @@
+"""Per-phase timings of sketch solves.
+
+A solve (``solve_system``, a tweak drag step, a pooled frame solve) is split
+into the phases below; each phase adds its wall-clock time to the solve being
+measured, and the last ``HISTORY`` solves are kept per sketch. Phases outside
+a measured solve cost one ``None`` check.
+
+    workplane         CurveSolver._init_workplane
+    geometry          CurveSolver._init_geometry
+    constraints       CurveSolver._init_constraints (create_slvs_data_from_curves)
+    solve_sketch      the slvs solve itself
+    write_back        writing solved positions to the curve data
+    rebuild_segments  rebuilding line/arc segments from the solved points
+    legacy_sync       syncing legacy entity coordinates
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+
+PHASES = (
+    "workplane",
+    "geometry",
+    "constraints",
+    "solve_sketch",
+    "write_back",
+    "rebuild_segments",
+    "legacy_sync",
+)
+HISTORY = 32
+
+# target_object pointer -> deque of {phase: ms, "total": ms}
+_history = {}
+
+# Phase times (seconds) of the solve being measured
+_current = None
+
+
+@contextmanager
+def phase(name):
+    """Add the time spent in the block to phase ``name`` of the current solve."""
+    record = _current
+    if record is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record[name] = record.get(name, 0.0) + time.perf_counter() - start
+
+
+@contextmanager
+def collect(record):
+    """Collect phases into ``record`` (seconds) without storing it anywhere;
+    for solves whose phases don't run in one block, see ``push``."""
+    global _current
+    outer, _current = _current, record
+    try:
+        yield record
+    finally:
+        _current = outer
+
+
+@contextmanager
+def measure(sketch):
+    """Measure the solve of ``sketch`` run in the block. Nested measures are
+    part of the outer one."""
+    if _current is not None:
+        yield _current
+        return
+    record = {}
+    start = time.perf_counter()
+    with collect(record):
+        try:
+            yield record
+        finally:
+            record["total"] = time.perf_counter() - start
+            push(sketch, record)
+
+
+def push(sketch, record):
+    """Store a finished solve's ``record`` (seconds) for ``sketch``."""
+    if not sketch or not sketch.target_object:
+        return
+    ms = {name: record.get(name, 0.0) * 1000.0 for name in PHASES}
+    ms["total"] = record.get("total", sum(record.values())) * 1000.0
+    key = sketch.target_object.as_pointer()
+    _history.setdefault(key, deque(maxlen=HISTORY)).append(ms)
+
+
+def history(sketch):
+    """The last solves of ``sketch``, oldest first, as ``{phase: ms}`` dicts
+    (plus ``"total"``)."""
+    if not sketch or not sketch.target_object:
+        return []
+    return list(_history.get(sketch.target_object.as_pointer(), ()))
+
+
+def last(sketch):
+    """Timings of the last solve of ``sketch``, None if it wasn't solved yet."""
+    solves = history(sketch)
+    return solves[-1] if solves else None
+
+
+def mean(sketch):
+    """Mean timings over the kept solves of ``sketch``, None without any."""
+    solves = history(sketch)
+    if not solves:
+        return None
+    return {name: sum(s[name] for s in solves) / len(solves) for name in solves[0]}
+
+
+def clear():
+    _history.clear()
@@ -9,7 +9,8 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
-from .curve_data import get_uuid, has_uuid_field
+from .curve_data import get_uuid, has_uuid_field, read_uuid_list
+from .sketch_table import get_table
 
 from mathutils import Vector, Matrix
 from mathutils.geometry import intersect_line_sphere_2d, intersect_sphere_sphere_2d
@@ -69,20 +70,20 @@ class SketchTopology:
             return
 
         cd = obj.data
-        n = len(cd.curves)
-        type_attr = cd.attributes.get("sketch_type")
-
-        if not has_uuid_field(cd, "curve_id") or not type_attr:
+        if not has_uuid_field(cd, "curve_id") or not cd.attributes.get("sketch_type"):
             return
 
-        for i in range(n):
-            ctype = type_attr.data[i].value
+        types = get_table(cd, values=False).types.tolist()
+        cids = read_uuid_list(cd, "curve_id")
+        sps = read_uuid_list(cd, "start_point_id")
+        eps = read_uuid_list(cd, "end_point_id")
+        for i, ctype in enumerate(types):
             if ctype == SketchCurveType.POINT:
                 continue
 
-            cid = get_uuid(cd, "curve_id", i)
-            sp = get_uuid(cd, "start_point_id", i)
-            ep = get_uuid(cd, "end_point_id", i)
+            cid = cids[i]
+            sp = sps[i]
+            ep = eps[i]
 
             if sp:
                 self._connections.setdefault(sp, []).append((cid, "start"))
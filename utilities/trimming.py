@@ -5,7 +5,6 @@ import logging
 from mathutils import Vector
 
 from ..model.curve_ref import ArcRef, CircleRef, LineRef, PointRef
-from .curve_data import get_uuid, has_uuid_field
 
 logger = logging.getLogger(__name__)
 
@@ -178,8 +177,7 @@ class TrimSegment:
 
     def _cleanup_orphan_points(self, sketch):
         """Remove endpoints of the original segment that are no longer referenced."""
-        from ..model.constants import SketchCurveType
-        from ..utilities.curve_data import remove_native_curve_by_id
+        from ..utilities.curve_data import remove_native_curves_by_id
 
         # Check all original endpoints of the trimmed segment
         candidates = set(self._original_endpoint_cids)
@@ -187,28 +185,7 @@ class TrimSegment:
         if not candidates:
             return
 
-        cd = sketch.data
-        if not cd:
-            return
-
-        n = len(cd.curves)
-        type_attr = cd.attributes.get("sketch_type")
-        if not has_uuid_field(cd, "curve_id") or not type_attr:
-            return
-
-        # Check which candidates are still referenced by any segment
-        referenced = set()
-        for i in range(n):
-            ctype = type_attr.data[i].value
-            if ctype == SketchCurveType.POINT:
-                continue
-            referenced.add(get_uuid(cd, "start_point_id", i))
-            referenced.add(get_uuid(cd, "end_point_id", i))
-            referenced.add(get_uuid(cd, "center_point_id", i))
-
-        for cid in candidates:
-            if cid not in referenced:
-                remove_native_curve_by_id(sketch, cid)
+        remove_native_curves_by_id(sketch, (), orphans=candidates)
 
     def execute(self, context):
         """Perform the trim operation."""
@@ -17,6 +17,8 @@ import logging
 import math
 import secrets
 
+import numpy as np
+
 from ..model.constants import SketchCurveType
 from .curve_data import (
     UUID_FIELDS,
@@ -27,9 +29,11 @@ from .curve_data import (
     has_uuid_field,
     invalidate_curve_id_cache,
     new_uuid,
-    remove_native_curve_by_id,
+    remove_native_curves_by_id,
     set_uuid,
 )
+from .sketch_table import get_table
+from .sketch_table import invalidate as invalidate_table
 
 logger = logging.getLogger(__name__)
 
@@ -108,23 +112,6 @@ def _prune_dangling_constraints(sketch, valid_ids):
     return removed
 
 
-def _remove_orphan_points(sketch, candidate_ids):
-    """Remove point curves in ``candidate_ids`` no segment still references."""
-    cd = sketch.target_object.data
-    type_attr = cd.attributes.get("sketch_type")
-    if not type_attr:
-        return
-    referenced = set()
-    for i in range(len(cd.curves)):
-        if type_attr.data[i].value == SketchCurveType.POINT:
-            continue
-        for field in ("start_point_id", "end_point_id", "center_point_id"):
-            referenced.add(get_uuid(cd, field, i))
-    for cid in candidate_ids:
-        if cid and cid not in referenced:
-            remove_native_curve_by_id(sketch, cid)
-
-
 def validate_sketch(sketch):
     """Repair invariants on one sketch's curve data.
 
@@ -146,6 +133,9 @@ def validate_sketch(sketch):
         return False
 
     changed = False
+    # A built-in tool may have reshaped the curves without changing their
+    # count; don't trust the cached table.
+    invalidate_table(cd)
 
     # 1. Recreate any dropped standard attributes (purely additive).
     if any(cd.attributes.get(name) is None for name in _REQUIRED_ATTRS):
@@ -155,6 +145,7 @@ def validate_sketch(sketch):
     # 2. Give every curve a unique, non-empty id. Empty ids come from natively
     #    added curves, duplicates from natively copied ones — both get a fresh id.
     type_attr = cd.attributes.get("sketch_type")
+    types = get_table(cd, values=False).types.tolist()
     seen = set()
     for i in range(len(cd.curves)):
         cid = get_uuid(cd, "curve_id", i)
@@ -163,7 +154,7 @@ def validate_sketch(sketch):
             set_uuid(cd, "curve_id", i, cid)
             name_attr = cd.attributes.get("name")
             if name_attr and not name_attr.data[i].value:
-                ctype = type_attr.data[i].value if type_attr else -1
+                ctype = types[i]
                 name_attr.data[i].value = default_curve_name(cd, ctype).encode()
             changed = True
         seen.add(cid)
@@ -171,34 +162,31 @@ def validate_sketch(sketch):
     # 3. Remove segments left degenerate by a native edit — e.g. a line whose
     #    endpoint was deleted in Edit Mode, leaving a 1-point "line".
     if type_attr:
+        table = get_table(cd, values=False)
         degenerate = [
             get_uuid(cd, "curve_id", i)
-            for i in range(len(cd.curves))
-            if type_attr.data[i].value == SketchCurveType.LINE
-            and cd.curves[i].points_length < 2
+            for i in np.flatnonzero(
+                (table.types == SketchCurveType.LINE) & (table.counts < 2)
+            ).tolist()
         ]
-        for cid in degenerate:
-            if cid:
-                remove_native_curve_by_id(sketch, cid)
-                changed = True
+        if remove_native_curves_by_id(sketch, degenerate):
+            changed = True
 
     # 3b. Remove degenerate arcs whose start and end points coincide (zero
     #     sweep). Trimming a circle down to nothing can leave these; their
     #     bezier degenerates into a stray sliver (the "trim leftover" lens).
-    #     Drop the arc and any points it orphans.
+    #     Drop the arcs and any points they orphan, in one removal.
     if type_attr:
+        table = get_table(cd)
         pos_by_id = {
             get_uuid(cd, "curve_id", i): tuple(
-                cd.points[cd.curves[i].points[0].index].position[:2]
+                table.positions[table.first[i], :2].tolist()
             )
-            for i in range(len(cd.curves))
-            if type_attr.data[i].value == SketchCurveType.POINT
+            for i in np.flatnonzero(table.types == SketchCurveType.POINT).tolist()
         }
         degenerate_arcs = []
         orphaned = set()
-        for i in range(len(cd.curves)):
-            if type_attr.data[i].value != SketchCurveType.ARC:
-                continue
+        for i in np.flatnonzero(table.types == SketchCurveType.ARC).tolist():
             sp = get_uuid(cd, "start_point_id", i)
             ep = get_uuid(cd, "end_point_id", i)
             a, b = pos_by_id.get(sp), pos_by_id.get(ep)
@@ -209,12 +197,8 @@ def validate_sketch(sketch):
             if coincident:
                 degenerate_arcs.append(get_uuid(cd, "curve_id", i))
                 orphaned.update((sp, ep, get_uuid(cd, "center_point_id", i)))
-        for cid in degenerate_arcs:
-            if cid:
-                remove_native_curve_by_id(sketch, cid)
-                changed = True
-        if degenerate_arcs:
-            _remove_orphan_points(sketch, orphaned)
+        if remove_native_curves_by_id(sketch, degenerate_arcs, orphans=orphaned):
+            changed = True
 
     # 4. Prune constraints referencing a curve that exists in no sketch.
     valid_ids = {get_uuid(cd, "curve_id", i) for i in range(len(cd.curves))}
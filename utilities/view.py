@@ -251,6 +251,68 @@ def _project_points_to_region(world, region, rv3d):
     return screen, valid
 
 
+def _region_to_plane(screen, region, rv3d, matrix):
+    """Inverse of ``_project_points_to_region`` onto a plane: intersect the view
+    rays through the (K, 2) region pixels ``screen`` with the local z=0 plane
+    of the 4x4 ``matrix`` (e.g. a sketch's world matrix). Returns the (K, 2)
+    local coordinates and a validity mask (the ray meets the plane between the
+    near and far clip planes).
+    """
+    import numpy as np
+
+    screen = np.asarray(screen, dtype=np.float64).reshape(-1, 2)
+    n = len(screen)
+    ndc = np.empty((n, 4), dtype=np.float64)
+    ndc[:, 0] = screen[:, 0] / (region.width * 0.5) - 1.0
+    ndc[:, 1] = screen[:, 1] / (region.height * 0.5) - 1.0
+    ndc[:, 3] = 1.0
+    # Clip space -> the plane's local space, at the near and far planes
+    inv = np.linalg.inv(
+        np.array(rv3d.perspective_matrix, dtype=np.float64)
+        @ np.array(matrix, dtype=np.float64)
+    )
+    ends = []
+    for depth in (-1.0, 1.0):
+        ndc[:, 2] = depth
+        point = ndc @ inv.T
+        ends.append(point[:, :3] / point[:, 3:])
+    near, far = ends
+    direction = far - near
+    hits = np.abs(direction[:, 2]) > 1e-12
+    t = -near[:, 2] / np.where(hits, direction[:, 2], 1.0)
+    valid = hits & (t >= 0.0) & (t <= 1.0)
+    return (near + t[:, None] * direction)[:, :2], valid
+
+
+def _box_corners(bounds):
+    """The 8 corners of each (min, max) box in a (B, 2, 3) array, as (B, 8, 3)."""
+    import numpy as np
+
+    bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 2, 3)
+    pick = np.array([(i >> 2 & 1, i >> 1 & 1, i & 1) for i in range(8)])
+    return bounds[:, pick, np.arange(3)]
+
+
+def _boxes_outside_view(bounds, rv3d):
+    """Mask of the world-space (min, max) boxes in a (B, 2, 3) array that lie
+    entirely outside the view frustum.
+
+    A box is culled when all its corners are outside the same clip plane. That
+    misses a few boxes near the frustum's edges (never culls a visible one).
+    """
+    import numpy as np
+
+    corners = _box_corners(bounds)
+    mat = np.array(rv3d.perspective_matrix, dtype=np.float64)
+    clip = corners @ mat[:3, :3].T + mat[:3, 3]
+    w = corners @ mat[3, :3] + mat[3, 3]
+    outside = np.zeros(len(corners), dtype=bool)
+    for k in range(3):
+        outside |= (clip[..., k] < -w).all(axis=1)
+        outside |= (clip[..., k] > w).all(axis=1)
+    return outside
+
+
 def _curve_snap_candidates(context: Context, obj, coords: Vector, elements, threshold=None):
     """Snap candidates from a curve object's control points and segments.
 